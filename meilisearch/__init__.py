@@ -1 +1,3 @@
-from meilisearch.client import Client as Client  # pylint: disable=useless-import-alias
+# pylint: disable=useless-import-alias
+from meilisearch.async_client import AsyncClient as AsyncClient
+from meilisearch.client import Client as Client
@@ -0,0 +1,575 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from functools import partial
+from time import monotonic
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+from meilisearch._httprequests import (
+    _build_headers,
+    _compressor,
+    _first_answer,
+    _record_outcome,
+    _report,
+    _retry_delay,
+    _serialize_body,
+    _should_compress,
+    _split_bytes,
+)
+from meilisearch._nodes import NodePool, is_read, is_read_only
+from meilisearch.config import Config
+from meilisearch.errors import (
+    MeilisearchApiError,
+    MeilisearchCommunicationError,
+    MeilisearchTimeoutError,
+)
+from meilisearch.hedging import HedgingPolicy
+from meilisearch.metrics import RequestSample
+from meilisearch.models.index import PrefixSearch, ProximityPrecision
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore[assignment]
+
+
+class AsyncHttpRequests:
+    """
+    Non-blocking, connection-pooled transport to the Meilisearch API
+
+    Backed by an httpx.AsyncClient. A single instance is shared by an AsyncClient and every
+    AsyncIndex and AsyncTaskHandler created from it.
+    """
+
+    def __init__(self, config: Config, custom_headers: Optional[Mapping[str, str]] = None) -> None:
+        if httpx is None:  # pragma: no cover
+            raise ImportError(
+                "The async client requires httpx. Install it with `pip install meilisearch[async]`."
+            )
+
+        self.config = config
+        self.headers = _build_headers(config, custom_headers)
+        transport = config.transport
+        self.client = httpx.AsyncClient(
+            timeout=config.timeout,
+            limits=httpx.Limits(
+                max_connections=transport.pool_size,
+                max_keepalive_connections=transport.pool_size if transport.keep_alive else 0,
+            ),
+        )
+        self.nodes = NodePool(config.urls, config.transport.load_balancing)
+
+    async def aclose(self) -> None:
+        """Close the connections held by the pool."""
+        await self.client.aclose()
+
+    async def send_request(
+        self,
+        http_method: str,
+        path: str,
+        body: Optional[
+            Union[
+                Mapping[str, Any],
+                Sequence[Mapping[str, Any]],
+                List[str],
+                bool,
+                bytes,
+                AsyncIterator[bytes],
+                str,
+                int,
+                ProximityPrecision,
+            ]
+        ] = None,
+        content_type: Optional[str] = None,
+        *,
+        serializer: Optional[Type[json.JSONEncoder]] = None,
+        raw: bool = False,
+    ) -> Any:
+        if raw:
+            # Raw bodies skip the layers sharing decoded responses: cache and single-flight.
+            return await self._send_uncached(
+                http_method, path, body, content_type, serializer=serializer, raw=True
+            )
+        flight = self.config.middleware.single_flight
+        # Only the reads are shared, the other bodies are not encoded into a key.
+        if flight is not None and flight.applies(http_method, path):
+            key = flight.key(http_method, path, body)
+            if key is not None:
+                return await flight.arun(
+                    key,
+                    partial(
+                        self._send_cached,
+                        http_method,
+                        path,
+                        body,
+                        content_type,
+                        serializer=serializer,
+                    ),
+                )
+        return await self._send_cached(http_method, path, body, content_type, serializer=serializer)
+
+    async def _send_cached(
+        self,
+        http_method: str,
+        path: str,
+        body: Optional[
+            Union[
+                Mapping[str, Any],
+                Sequence[Mapping[str, Any]],
+                List[str],
+                bool,
+                bytes,
+                AsyncIterator[bytes],
+                str,
+                int,
+                ProximityPrecision,
+            ]
+        ] = None,
+        content_type: Optional[str] = None,
+        *,
+        serializer: Optional[Type[json.JSONEncoder]] = None,
+    ) -> Any:
+        cache = self.config.middleware.search_cache
+        if cache is None:
+            return await self._send_uncached(
+                http_method, path, body, content_type, serializer=serializer
+            )
+
+        if cache.applies(http_method, path):
+            key, indexes = cache.key(path, body)
+            cached = cache.get(key, self.config.transport.json_codec)
+            if cached is not None:
+                return cached
+            generation = cache.generation(indexes)
+            response = await self._send_uncached(
+                http_method, path, body, content_type, serializer=serializer
+            )
+            cache.put(key, response, indexes, generation, self.config.transport.json_codec)
+            return response
+
+        try:
+            return await self._send_uncached(
+                http_method, path, body, content_type, serializer=serializer
+            )
+        finally:
+            if not is_read_only(http_method, path):
+                cache.invalidate_for_write(path)
+
+    async def _send_uncached(
+        self,
+        http_method: str,
+        path: str,
+        body: Optional[
+            Union[
+                Mapping[str, Any],
+                Sequence[Mapping[str, Any]],
+                List[str],
+                bool,
+                bytes,
+                AsyncIterator[bytes],
+                str,
+                int,
+                ProximityPrecision,
+            ]
+        ] = None,
+        content_type: Optional[str] = None,
+        *,
+        serializer: Optional[Type[json.JSONEncoder]] = None,
+        batch: bool = True,
+        raw: bool = False,
+    ) -> Any:
+        batcher = self.config.middleware.search_batcher if batch and not raw else None
+        index_uid = batcher.index_uid(http_method, path) if batcher is not None else None
+        if batcher is not None and index_uid is not None and isinstance(body, dict):
+            return await batcher.asearch(
+                lambda path, body: self._send_uncached(
+                    http_method, path, body, content_type, batch=False
+                ),
+                index_uid,
+                body,
+            )
+
+        headers = self._headers_for(content_type)
+        hedging = self.config.middleware.hedging
+        try:
+            if hedging is not None and hedging.applies(http_method, path):
+                return await self._send_hedged(
+                    hedging,
+                    partial(
+                        self._send_with_retries, http_method, path, body, headers, serializer, raw
+                    ),
+                )
+            return await self._send_with_retries(http_method, path, body, headers, serializer, raw)
+
+        except httpx.TimeoutException as err:
+            raise MeilisearchTimeoutError(str(err)) from err
+        except httpx.UnsupportedProtocol as err:
+            if "://" not in self.config.url:
+                raise MeilisearchCommunicationError(
+                    f"""
+                    Invalid URL {self.config.url}, no scheme/protocol supplied.
+                    Did you mean https://{self.config.url}?
+                    """
+                ) from err
+
+            raise MeilisearchCommunicationError(str(err)) from err
+        except httpx.TransportError as err:
+            raise MeilisearchCommunicationError(str(err)) from err
+
+    async def _send_with_retries(
+        self,
+        http_method: str,
+        path: str,
+        body: Any,
+        headers: Dict[str, str],
+        serializer: Optional[Type[json.JSONEncoder]],
+        raw: bool = False,
+    ) -> Any:
+        if not self.config.middleware.metrics and not self.config.middleware.hooks:
+            return self.__validate(
+                await self._send_attempts(http_method, path, body, headers, serializer), raw
+            )
+
+        sample = RequestSample(http_method, path)
+        # The hooks may add headers, such as the trace context, to this request only.
+        headers = dict(headers)
+        states = [hook.before_request(sample, headers) for hook in self.config.middleware.hooks]
+        response: Optional[httpx.Response] = None
+        error: Optional[BaseException] = None
+        try:
+            response = await self._send_attempts(
+                http_method, path, body, headers, serializer, sample
+            )
+            return self.__validate(response, raw, sample)
+        except BaseException as err:
+            error = err
+            raise
+        finally:
+            _report(self.config, sample, states, response, error)
+
+    async def _send_attempts(
+        self,
+        http_method: str,
+        path: str,
+        body: Any,
+        headers: Dict[str, str],
+        serializer: Optional[Type[json.JSONEncoder]],
+        sample: Optional[RequestSample] = None,
+    ) -> httpx.Response:
+        read = is_read(http_method, path)
+        tried: List[str] = []
+        attempt = 1
+        while True:
+            url = self.nodes.select(read, tried)
+            tried.append(url)
+            try:
+                response = await self._send_to(
+                    url, read, http_method, path, body, headers, serializer, sample
+                )
+            except (
+                httpx.TimeoutException,
+                httpx.NetworkError,
+                MeilisearchCommunicationError,
+            ) as err:
+                # Reads fail over to the next node straight away.
+                if read and self.nodes.can_failover(tried):
+                    continue
+                if isinstance(err, MeilisearchCommunicationError):
+                    raise
+                delay = _retry_delay(
+                    self.config,
+                    attempt,
+                    http_method,
+                    path,
+                    body,
+                    sent=not isinstance(err, (httpx.ConnectError, httpx.ConnectTimeout)),
+                )
+                if delay is None:
+                    raise
+            else:
+                if read and response.status_code >= 500 and self.nodes.can_failover(tried):
+                    continue
+                delay = _retry_delay(self.config, attempt, http_method, path, body, response)
+                if delay is None:
+                    return response
+            if sample is not None:
+                sample.retries = attempt
+            await asyncio.sleep(delay / 1000)
+            attempt += 1
+            tried = []
+
+    async def _send_hedged(self, hedging: HedgingPolicy, send: Callable[[], Awaitable[Any]]) -> Any:
+        legs = {asyncio.ensure_future(_timed(hedging, send))}
+        pending = legs
+        try:
+            done, _ = await asyncio.wait(legs, timeout=hedging.delay() / 1000)
+            if not done and hedging.try_hedge():
+                legs.add(asyncio.ensure_future(_timed(hedging, send)))
+
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = _first_answer(
+                    done, bool(pending), (httpx.TransportError, MeilisearchCommunicationError)
+                )
+                if winner is not None:
+                    return winner.result()
+        finally:
+            for leg in pending:
+                leg.cancel()
+
+    async def get(self, path: str, *, raw: bool = False) -> Any:
+        return await self.send_request("GET", path, raw=raw)
+
+    async def post(
+        self,
+        path: str,
+        body: Optional[
+            Union[
+                Mapping[str, Any],
+                Sequence[Mapping[str, Any]],
+                List[str],
+                bytes,
+                str,
+                AsyncIterator[bytes],
+            ]
+        ] = None,
+        content_type: Optional[str] = "application/json",
+        *,
+        serializer: Optional[Type[json.JSONEncoder]] = None,
+        raw: bool = False,
+    ) -> Any:
+        return await self.send_request(
+            "POST", path, body, content_type, serializer=serializer, raw=raw
+        )
+
+    async def patch(
+        self,
+        path: str,
+        body: Optional[
+            Union[Mapping[str, Any], Sequence[Mapping[str, Any]], List[str], bytes, str]
+        ] = None,
+        content_type: Optional[str] = "application/json",
+    ) -> Any:
+        return await self.send_request("PATCH", path, body, content_type)
+
+    async def put(
+        self,
+        path: str,
+        body: Optional[
+            Union[
+                Mapping[str, Any],
+                Sequence[Mapping[str, Any]],
+                List[str],
+                bool,
+                bytes,
+                AsyncIterator[bytes],
+                str,
+                int,
+                PrefixSearch,
+                ProximityPrecision,
+            ]
+        ] = None,
+        content_type: Optional[str] = "application/json",
+        *,
+        serializer: Optional[Type[json.JSONEncoder]] = None,
+    ) -> Any:
+        return await self.send_request("PUT", path, body, content_type, serializer=serializer)
+
+    async def delete(
+        self,
+        path: str,
+        body: Optional[Union[Mapping[str, Any], Sequence[Mapping[str, Any]], List[str]]] = None,
+    ) -> Any:
+        return await self.send_request("DELETE", path, body)
+
+    async def post_stream(
+        self,
+        path: str,
+        body: Optional[
+            Union[Mapping[str, Any], Sequence[Mapping[str, Any]], List[str], bytes, str]
+        ] = None,
+        content_type: Optional[str] = "application/json",
+        *,
+        serializer: Optional[Type[json.JSONEncoder]] = None,
+    ) -> httpx.Response:
+        """Send a POST request with streaming enabled.
+
+        Returns the raw response object for streaming consumption, it must be closed with
+        `aclose()` once consumed.
+        """
+        headers = self._headers_for(content_type)
+        try:
+            content, headers = self._encode_body(body, headers, serializer)
+            request = self.client.build_request(
+                "POST", self.config.url + "/" + path, headers=headers, content=content
+            )
+            response = await self.client.send(request, stream=True)
+
+            # For streaming responses, we validate status but don't parse JSON
+            if response.is_error:
+                await response.aread()
+                await response.aclose()
+                raise MeilisearchApiError(f"HTTP {response.status_code}", response)
+
+            return response
+
+        except httpx.TimeoutException as err:
+            raise MeilisearchTimeoutError(str(err)) from err
+        except httpx.UnsupportedProtocol as err:
+            if "://" not in self.config.url:
+                raise MeilisearchCommunicationError(
+                    f"""
+                    Invalid URL {self.config.url}, no scheme/protocol supplied.
+                    Did you mean https://{self.config.url}?
+                    """
+                ) from err
+
+            raise MeilisearchCommunicationError(str(err)) from err
+        except httpx.TransportError as err:
+            raise MeilisearchCommunicationError(str(err)) from err
+
+    def _encode_body(
+        self,
+        body: Any,
+        headers: Dict[str, str],
+        serializer: Optional[Type[json.JSONEncoder]] = None,
+        sample: Optional[RequestSample] = None,
+    ) -> Tuple[Any, Dict[str, str]]:
+        started = monotonic()
+        data = _serialize_body(body, self.config.transport.json_codec, serializer)
+        if sample is not None:
+            sample.durations_ms["serialize"] += (monotonic() - started) * 1000
+            sample.sizes["request"] = len(data) if isinstance(data, bytes) else 0
+        compression = self.config.transport.compression
+        if compression is None or not _should_compress(data, self.config):
+            return data, headers
+
+        chunks = _split_bytes(data) if isinstance(data, bytes) else data
+        return _compress_chunks(chunks, self.config), {**headers, "Content-Encoding": compression}
+
+    async def _send_to(
+        self,
+        url: str,
+        read: bool,
+        http_method: str,
+        path: str,
+        body: Any,
+        headers: Dict[str, str],
+        serializer: Optional[Type[json.JSONEncoder]],
+        sample: Optional[RequestSample] = None,
+    ) -> httpx.Response:
+        success = False
+        try:
+            await self._check_circuit(url)
+            started = monotonic()
+            try:
+                if http_method == "GET":
+                    response = await self.client.request(
+                        http_method, url + "/" + path, headers=headers
+                    )
+                else:
+                    content, request_headers = self._encode_body(body, headers, serializer, sample)
+                    started = monotonic()
+                    response = await self.client.request(
+                        http_method, url + "/" + path, headers=request_headers, content=content
+                    )
+            except (httpx.TimeoutException, httpx.NetworkError):
+                if sample is not None:
+                    sample.durations_ms["network"] += (monotonic() - started) * 1000
+                    sample.status = "error"
+                _record_outcome(self.config, url, success=False)
+                raise
+            if sample is not None:
+                sample.durations_ms["network"] += (monotonic() - started) * 1000
+                sample.status = response.status_code
+                sample.sizes["response"] = len(response.content)
+            success = response.status_code < 500
+            _record_outcome(self.config, url, success)
+            return response
+        finally:
+            self.nodes.release(url, success, read)
+
+    async def _check_circuit(self, url: str) -> None:
+        breaker = self.config.middleware.circuit_breaker
+        if breaker is None or not breaker.before_request(url):
+            return
+
+        healthy = False
+        try:
+            response = await self.client.get(
+                url + "/" + self.config.paths.health,
+                timeout=breaker.probe_timeout_in_ms / 1000,
+                headers=self.headers,
+            )
+            healthy = not response.is_error
+        except httpx.HTTPError:
+            pass
+        finally:
+            breaker.record_probe(url, healthy)
+        if not healthy:
+            raise MeilisearchCommunicationError(
+                f"Circuit breaker open for {url}, the health probe failed."
+            )
+
+    def _headers_for(self, content_type: Optional[str]) -> Dict[str, str]:
+        if not content_type:
+            return self.headers
+        return {**self.headers, "Content-Type": content_type}
+
+    def __to_json(self, response: httpx.Response) -> Any:
+        if response.content == b"":
+            return response
+        return self.config.transport.json_codec.loads(response.content)
+
+    def __validate(
+        self, response: httpx.Response, raw: bool = False, sample: Optional[RequestSample] = None
+    ) -> Any:
+        if response.is_error:
+            raise MeilisearchApiError(f"HTTP {response.status_code}", response)
+        if raw:
+            return response.content
+        started = monotonic()
+        decoded = self.__to_json(response)
+        if sample is not None:
+            sample.durations_ms["decode"] = (monotonic() - started) * 1000
+        return decoded
+
+
+async def _timed(hedging: HedgingPolicy, send: Callable[[], Awaitable[Any]]) -> Any:
+    started = monotonic()
+    result = await send()
+    hedging.record((monotonic() - started) * 1000)
+    return result
+
+
+async def _compress_chunks(
+    chunks: Union[Iterable[Union[bytes, memoryview]], AsyncIterable[bytes]], config: Config
+) -> AsyncIterator[bytes]:
+    """Compress the chunks as they are sent, without building the whole compressed body."""
+    compressor = _compressor(config.transport.compression, config.transport.compression_level)
+    chunk: Union[bytes, memoryview]
+    if isinstance(chunks, AsyncIterable):
+        async for chunk in chunks:
+            if compressed := compressor.compress(chunk):
+                yield compressed
+    else:
+        for chunk in chunks:
+            if compressed := compressor.compress(chunk):
+                yield compressed
+    yield compressor.flush()
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, Optional, Type, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None  # type: ignore[assignment]
+
+
+class JsonCodec:
+    """
+    Encode the request bodies and decode the responses with the standard library json module
+
+    Other codecs subclass it, a custom codec only needs to provide `dumps` returning bytes and
+    `loads` accepting bytes or str.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec backed by orjson."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError(
+                "The orjson codec requires orjson. Install it with `pip install orjson`."
+            )
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    """JSON codec backed by msgspec."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        if msgspec is None:
+            raise ImportError(
+                "The msgspec codec requires msgspec. Install it with `pip install msgspec`."
+            )
+
+        self.encoder = msgspec.json.Encoder()
+        self.decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self.encoder.encode(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self.decoder.decode(data)
+
+
+CODECS: Dict[str, Type[JsonCodec]] = {
+    JsonCodec.name: JsonCodec,
+    OrjsonCodec.name: OrjsonCodec,
+    MsgspecCodec.name: MsgspecCodec,
+}
+
+
+def get_json_codec(json_codec: Optional[Union[str, JsonCodec]] = None) -> JsonCodec:
+    """Resolve the json_codec option of the Config to a codec instance.
+
+    "auto" picks orjson, then msgspec, when they are installed and falls back to the standard
+    library json module.
+    """
+    if json_codec is None:
+        return JsonCodec()
+    if not isinstance(json_codec, str):
+        return json_codec
+
+    if json_codec == "auto":
+        for codec in (OrjsonCodec, MsgspecCodec):
+            try:
+                return codec()
+            except ImportError:
+                continue
+        return JsonCodec()
+
+    try:
+        return CODECS[json_codec]()
+    except KeyError as err:
+        raise ValueError(
+            f"Unknown json_codec {json_codec!r}, expected one of: auto, {', '.join(CODECS)}"
+        ) from err
+
+
+def encode_json(
+    codec: JsonCodec, obj: Any, serializer: Optional[Type[json.JSONEncoder]] = None
+) -> bytes:
+    """Encode `obj` with the codec, or with the standard library when a serializer is given.
+
+    Custom JSONEncoder classes only work with the json module so they take precedence over the
+    codec.
+    """
+    if serializer is not None:
+        return json.dumps(obj, cls=serializer, separators=(",", ":")).encode("utf-8")
+    return codec.dumps(obj)
@@ -1,31 +1,69 @@
 from __future__ import annotations
 
 import json
-from functools import lru_cache
-from typing import Any, Callable, List, Mapping, Optional, Sequence, Tuple, Type, Union
+import threading
+import zlib
+from collections import abc
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from functools import lru_cache, partial
+from time import monotonic, sleep
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
 
+from meilisearch._codec import JsonCodec, encode_json
+from meilisearch._nodes import NodePool, is_read, is_read_only
 from meilisearch.config import Config
 from meilisearch.errors import (
     MeilisearchApiError,
     MeilisearchCommunicationError,
     MeilisearchTimeoutError,
 )
+from meilisearch.hedging import HedgingPolicy
+from meilisearch.metrics import RequestSample
 from meilisearch.models.index import PrefixSearch, ProximityPrecision
 from meilisearch.version import qualified_version
 
 
 class HttpRequests:
+    """
+    Connection-pooled transport to the Meilisearch API
+
+    A single instance is meant to be shared by a Client and every Index and TaskHandler created
+    from it so that all of them reuse the same pool of keep-alive connections.
+    """
+
     def __init__(self, config: Config, custom_headers: Optional[Mapping[str, str]] = None) -> None:
         self.config = config
-        self.headers = {
-            "Authorization": f"Bearer {self.config.api_key}",
-            "User-Agent": _build_user_agent(config.client_agents),
-        }
+        self.headers = _build_headers(config, custom_headers)
+        self.session = _build_session(config)
+        self.nodes = NodePool(config.urls, config.transport.load_balancing)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # One slot per worker of the hedging executor, so that a leg never waits in its queue.
+        self._hedging_slots = threading.BoundedSemaphore(config.transport.pool_size)
+        self._lock = threading.Lock()
 
-        if custom_headers is not None:
-            self.headers.update(custom_headers)
+    def close(self) -> None:
+        """Close the connections held by the pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
 
     def send_request(
         self,
@@ -38,6 +76,7 @@ class HttpRequests:
                 List[str],
                 bool,
                 bytes,
+                Iterator[bytes],
                 str,
                 int,
                 ProximityPrecision,
@@ -46,36 +85,122 @@ class HttpRequests:
         content_type: Optional[str] = None,
         *,
         serializer: Optional[Type[json.JSONEncoder]] = None,
+        raw: bool = False,
     ) -> Any:
-        if content_type:
-            self.headers["Content-Type"] = content_type
-        try:
-            request_path = self.config.url + "/" + path
-            if http_method.__name__ == "get":
-                request = http_method(
-                    request_path,
-                    timeout=self.config.timeout,
-                    headers=self.headers,
-                )
-            elif isinstance(body, bytes):
-                request = http_method(
-                    request_path,
-                    timeout=self.config.timeout,
-                    headers=self.headers,
-                    data=body,
-                )
-            else:
-                serialize_body = isinstance(body, dict) or body
-                data = (
-                    json.dumps(body, cls=serializer)
-                    if isinstance(body, bool) or serialize_body
-                    else "" if body == "" else "null"
+        if raw:
+            # Raw bodies skip the layers sharing decoded responses: cache and single-flight.
+            return self._send_uncached(
+                http_method, path, body, content_type, serializer=serializer, raw=True
+            )
+        method = http_method.__name__.upper()
+        flight = self.config.middleware.single_flight
+        # Only the reads are shared, the other bodies are not encoded into a key.
+        if flight is not None and flight.applies(method, path):
+            key = flight.key(method, path, body)
+            if key is not None:
+                return flight.run(
+                    key,
+                    partial(
+                        self._send_cached,
+                        http_method,
+                        path,
+                        body,
+                        content_type,
+                        serializer=serializer,
+                    ),
                 )
+        return self._send_cached(http_method, path, body, content_type, serializer=serializer)
+
+    def _send_cached(
+        self,
+        http_method: Callable,
+        path: str,
+        body: Optional[
+            Union[
+                Mapping[str, Any],
+                Sequence[Mapping[str, Any]],
+                List[str],
+                bool,
+                bytes,
+                Iterator[bytes],
+                str,
+                int,
+                ProximityPrecision,
+            ]
+        ] = None,
+        content_type: Optional[str] = None,
+        *,
+        serializer: Optional[Type[json.JSONEncoder]] = None,
+    ) -> Any:
+        method = http_method.__name__.upper()
+        cache = self.config.middleware.search_cache
+        if cache is None:
+            return self._send_uncached(http_method, path, body, content_type, serializer=serializer)
+
+        if cache.applies(method, path):
+            key, indexes = cache.key(path, body)
+            cached = cache.get(key, self.config.transport.json_codec)
+            if cached is not None:
+                return cached
+            generation = cache.generation(indexes)
+            response = self._send_uncached(
+                http_method, path, body, content_type, serializer=serializer
+            )
+            cache.put(key, response, indexes, generation, self.config.transport.json_codec)
+            return response
+
+        try:
+            return self._send_uncached(http_method, path, body, content_type, serializer=serializer)
+        finally:
+            if not is_read_only(method, path):
+                cache.invalidate_for_write(path)
+
+    def _send_uncached(
+        self,
+        http_method: Callable,
+        path: str,
+        body: Optional[
+            Union[
+                Mapping[str, Any],
+                Sequence[Mapping[str, Any]],
+                List[str],
+                bool,
+                bytes,
+                Iterator[bytes],
+                str,
+                int,
+                ProximityPrecision,
+            ]
+        ] = None,
+        content_type: Optional[str] = None,
+        *,
+        serializer: Optional[Type[json.JSONEncoder]] = None,
+        batch: bool = True,
+        raw: bool = False,
+    ) -> Any:
+        method = http_method.__name__.upper()
+        batcher = self.config.middleware.search_batcher if batch and not raw else None
+        index_uid = batcher.index_uid(method, path) if batcher is not None else None
+        if batcher is not None and index_uid is not None and isinstance(body, dict):
+            return batcher.search(
+                lambda path, body: self._send_uncached(
+                    http_method, path, body, content_type, batch=False
+                ),
+                index_uid,
+                body,
+            )
 
-                request = http_method(
-                    request_path, timeout=self.config.timeout, headers=self.headers, data=data
+        headers = self._headers_for(content_type)
+        hedging = self.config.middleware.hedging
+        try:
+            if hedging is not None and hedging.applies(method, path):
+                return self._send_hedged(
+                    hedging,
+                    partial(
+                        self._send_with_retries, http_method, path, body, headers, serializer, raw
+                    ),
                 )
-            return self.__validate(request)
+            return self._send_with_retries(http_method, path, body, headers, serializer, raw)
 
         except requests.exceptions.Timeout as err:
             raise MeilisearchTimeoutError(str(err)) from err
@@ -92,20 +217,158 @@ class HttpRequests:
 
             raise MeilisearchCommunicationError(str(err)) from err
 
-    def get(self, path: str) -> Any:
-        return self.send_request(requests.get, path)
+    def _send_with_retries(
+        self,
+        http_method: Callable,
+        path: str,
+        body: Any,
+        headers: Dict[str, str],
+        serializer: Optional[Type[json.JSONEncoder]],
+        raw: bool = False,
+    ) -> Any:
+        if not self.config.middleware.metrics and not self.config.middleware.hooks:
+            return self.__validate(
+                self._send_attempts(http_method, path, body, headers, serializer), raw
+            )
+
+        sample = RequestSample(http_method.__name__.upper(), path)
+        # The hooks may add headers, such as the trace context, to this request only.
+        headers = dict(headers)
+        states = [hook.before_request(sample, headers) for hook in self.config.middleware.hooks]
+        response: Optional[requests.Response] = None
+        error: Optional[BaseException] = None
+        try:
+            response = self._send_attempts(http_method, path, body, headers, serializer, sample)
+            return self.__validate(response, raw, sample)
+        except BaseException as err:
+            error = err
+            raise
+        finally:
+            _report(self.config, sample, states, response, error)
+
+    def _send_attempts(
+        self,
+        http_method: Callable,
+        path: str,
+        body: Any,
+        headers: Dict[str, str],
+        serializer: Optional[Type[json.JSONEncoder]],
+        sample: Optional[RequestSample] = None,
+    ) -> requests.Response:
+        method = http_method.__name__.upper()
+        read = is_read(method, path)
+        tried: List[str] = []
+        attempt = 1
+        while True:
+            url = self.nodes.select(read, tried)
+            tried.append(url)
+            try:
+                request = self._send_to(
+                    url, read, http_method, path, body, headers, serializer, sample
+                )
+            except (
+                requests.exceptions.Timeout,
+                requests.exceptions.ConnectionError,
+                MeilisearchCommunicationError,
+            ) as err:
+                # Reads fail over to the next node straight away.
+                if read and self.nodes.can_failover(tried):
+                    continue
+                if isinstance(err, MeilisearchCommunicationError):
+                    raise
+                delay = _retry_delay(
+                    self.config,
+                    attempt,
+                    method,
+                    path,
+                    body,
+                    sent=not _failed_to_connect(err),
+                )
+                if delay is None:
+                    raise
+            else:
+                if read and request.status_code >= 500 and self.nodes.can_failover(tried):
+                    continue
+                delay = _retry_delay(self.config, attempt, method, path, body, request)
+                if delay is None:
+                    return request
+            if sample is not None:
+                sample.retries = attempt
+            sleep(delay / 1000)
+            attempt += 1
+            tried = []
+
+    def _send_hedged(self, hedging: HedgingPolicy, send: Callable[[], Any]) -> Any:
+        # A search that could not be hedged anyway, because the budget is spent or every worker
+        # is busy, is sent from the calling thread.
+        leg = self._submit_leg(hedging, send) if hedging.can_hedge() else None
+        if leg is None:
+            return _timed(hedging, send)
+
+        legs = {leg}
+        done, _ = wait(legs, timeout=hedging.delay() / 1000)
+        if not done and hedging.try_hedge():
+            hedge = self._submit_leg(hedging, send)
+            if hedge is not None:
+                legs.add(hedge)
+
+        pending = legs
+        while True:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            winner = _first_answer(
+                done,
+                bool(pending),
+                (requests.exceptions.RequestException, MeilisearchCommunicationError),
+            )
+            if winner is not None:
+                # A request already sent cannot be interrupted, its response is ignored.
+                for leg in pending:
+                    leg.cancel()
+                return winner.result()
+
+    def _submit_leg(self, hedging: HedgingPolicy, send: Callable[[], Any]) -> Optional[Future]:
+        """Send a leg from the hedging executor, None when all its workers are busy."""
+        # The slot is held until the leg is done, past the end of this method.
+        if not self._hedging_slots.acquire(blocking=False):  # pylint: disable=consider-using-with
+            return None
+        # Each leg runs in a copy of the caller's context, to stay within its current span.
+        leg = self._hedging_executor().submit(copy_context().run, _timed, hedging, send)
+        leg.add_done_callback(lambda _: self._hedging_slots.release())
+        return leg
+
+    def _hedging_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.config.transport.pool_size,
+                    thread_name_prefix="meilisearch-hedging",
+                )
+            return self._executor
+
+    def get(self, path: str, *, raw: bool = False) -> Any:
+        return self.send_request(self.session.get, path, raw=raw)
 
     def post(
         self,
         path: str,
         body: Optional[
-            Union[Mapping[str, Any], Sequence[Mapping[str, Any]], List[str], bytes, str]
+            Union[
+                Mapping[str, Any],
+                Sequence[Mapping[str, Any]],
+                List[str],
+                bytes,
+                str,
+                Iterator[bytes],
+            ]
         ] = None,
         content_type: Optional[str] = "application/json",
         *,
         serializer: Optional[Type[json.JSONEncoder]] = None,
+        raw: bool = False,
     ) -> Any:
-        return self.send_request(requests.post, path, body, content_type, serializer=serializer)
+        return self.send_request(
+            self.session.post, path, body, content_type, serializer=serializer, raw=raw
+        )
 
     def patch(
         self,
@@ -115,7 +378,7 @@ class HttpRequests:
         ] = None,
         content_type: Optional[str] = "application/json",
     ) -> Any:
-        return self.send_request(requests.patch, path, body, content_type)
+        return self.send_request(self.session.patch, path, body, content_type)
 
     def put(
         self,
@@ -127,6 +390,7 @@ class HttpRequests:
                 List[str],
                 bool,
                 bytes,
+                Iterator[bytes],
                 str,
                 int,
                 PrefixSearch,
@@ -137,14 +401,14 @@ class HttpRequests:
         *,
         serializer: Optional[Type[json.JSONEncoder]] = None,
     ) -> Any:
-        return self.send_request(requests.put, path, body, content_type, serializer=serializer)
+        return self.send_request(self.session.put, path, body, content_type, serializer=serializer)
 
     def delete(
         self,
         path: str,
         body: Optional[Union[Mapping[str, Any], Sequence[Mapping[str, Any]], List[str]]] = None,
     ) -> Any:
-        return self.send_request(requests.delete, path, body)
+        return self.send_request(self.session.delete, path, body)
 
     def post_stream(
         self,
@@ -160,34 +424,18 @@ class HttpRequests:
 
         Returns the raw response object for streaming consumption.
         """
-        if content_type:
-            self.headers["Content-Type"] = content_type
+        headers = self._headers_for(content_type)
         try:
             request_path = self.config.url + "/" + path
+            data, headers = self._encode_body(body, headers, serializer)
 
-            if isinstance(body, bytes):
-                response = requests.post(
-                    request_path,
-                    timeout=self.config.timeout,
-                    headers=self.headers,
-                    data=body,
-                    stream=True,
-                )
-            else:
-                serialize_body = isinstance(body, dict) or body
-                data = (
-                    json.dumps(body, cls=serializer)
-                    if isinstance(body, bool) or serialize_body
-                    else "" if body == "" else "null"
-                )
-
-                response = requests.post(
-                    request_path,
-                    timeout=self.config.timeout,
-                    headers=self.headers,
-                    data=data,
-                    stream=True,
-                )
+            response = self.session.post(
+                request_path,
+                timeout=self.config.timeout,
+                headers=headers,
+                data=data,
+                stream=True,
+            )
 
             # For streaming responses, we validate status but don't parse JSON
             if not response.ok:
@@ -212,21 +460,272 @@ class HttpRequests:
 
             raise MeilisearchCommunicationError(str(err)) from err
 
-    @staticmethod
-    def __to_json(request: requests.Response) -> Any:
+    def _send_to(
+        self,
+        url: str,
+        read: bool,
+        http_method: Callable,
+        path: str,
+        body: Any,
+        headers: Dict[str, str],
+        serializer: Optional[Type[json.JSONEncoder]],
+        sample: Optional[RequestSample] = None,
+    ) -> requests.Response:
+        success = False
+        try:
+            self._check_circuit(url)
+            started = monotonic()
+            try:
+                if http_method.__name__ == "get":
+                    response = http_method(
+                        url + "/" + path, timeout=self.config.timeout, headers=headers
+                    )
+                else:
+                    data, request_headers = self._encode_body(body, headers, serializer, sample)
+                    started = monotonic()
+                    response = http_method(
+                        url + "/" + path,
+                        timeout=self.config.timeout,
+                        headers=request_headers,
+                        data=data,
+                    )
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+                if sample is not None:
+                    sample.durations_ms["network"] += (monotonic() - started) * 1000
+                    sample.status = "error"
+                _record_outcome(self.config, url, success=False)
+                raise
+            if sample is not None:
+                sample.durations_ms["network"] += (monotonic() - started) * 1000
+                sample.status = response.status_code
+                sample.sizes["response"] = len(response.content)
+            success = response.status_code < 500
+            _record_outcome(self.config, url, success)
+            return response
+        finally:
+            self.nodes.release(url, success, read)
+
+    def _check_circuit(self, url: str) -> None:
+        breaker = self.config.middleware.circuit_breaker
+        if breaker is None or not breaker.before_request(url):
+            return
+
+        healthy = False
+        try:
+            response = self.session.get(
+                url + "/" + self.config.paths.health,
+                timeout=breaker.probe_timeout_in_ms / 1000,
+                headers=self.headers,
+            )
+            healthy = response.ok
+        except requests.exceptions.RequestException:
+            pass
+        finally:
+            breaker.record_probe(url, healthy)
+        if not healthy:
+            raise MeilisearchCommunicationError(
+                f"Circuit breaker open for {url}, the health probe failed."
+            )
+
+    def _headers_for(self, content_type: Optional[str]) -> Dict[str, str]:
+        # The headers are shared by every thread using this transport so the per-request
+        # Content-Type is set on a copy instead of mutating them in place.
+        if not content_type:
+            return self.headers
+        return {**self.headers, "Content-Type": content_type}
+
+    def _encode_body(
+        self,
+        body: Any,
+        headers: Dict[str, str],
+        serializer: Optional[Type[json.JSONEncoder]] = None,
+        sample: Optional[RequestSample] = None,
+    ) -> Tuple[Any, Dict[str, str]]:
+        started = monotonic()
+        data = _serialize_body(body, self.config.transport.json_codec, serializer)
+        if sample is not None:
+            sample.durations_ms["serialize"] += (monotonic() - started) * 1000
+            sample.sizes["request"] = len(data) if isinstance(data, bytes) else 0
+        compression = self.config.transport.compression
+        if compression is None or not _should_compress(data, self.config):
+            return data, headers
+
+        chunks = _split_bytes(data) if isinstance(data, bytes) else data
+        return _compress_chunks(chunks, self.config), {**headers, "Content-Encoding": compression}
+
+    def __to_json(self, request: requests.Response) -> Any:
         if request.content == b"":
             return request
-        return request.json()
+        return self.config.transport.json_codec.loads(request.content)
 
-    @staticmethod
-    def __validate(request: requests.Response) -> Any:
+    def __validate(
+        self, request: requests.Response, raw: bool = False, sample: Optional[RequestSample] = None
+    ) -> Any:
         try:
             request.raise_for_status()
-            return HttpRequests.__to_json(request)
+            if raw:
+                return request.content
+            started = monotonic()
+            decoded = self.__to_json(request)
+            if sample is not None:
+                sample.durations_ms["decode"] = (monotonic() - started) * 1000
+            return decoded
         except requests.exceptions.HTTPError as err:
             raise MeilisearchApiError(str(err), request) from err
 
 
+def _retry_delay(
+    config: Config,
+    attempt: int,
+    method: str,
+    path: str,
+    body: Any,
+    response: Any = None,
+    *,
+    sent: bool = True,
+) -> Optional[float]:
+    """Time to wait in milliseconds before retrying a failed attempt, None to give up.
+
+    `response` is the requests or httpx response of the attempt, None when it failed with a
+    connection error or a timeout.
+    """
+    retry = config.middleware.retry
+    if retry is None:
+        return None
+    # Streamed bodies are consumed by the first attempt and cannot be sent again.
+    if isinstance(body, (abc.Iterator, abc.AsyncIterator)):
+        return None
+
+    status_code = None if response is None else response.status_code
+    if status_code is not None and status_code < 400:
+        return None
+    if not retry.can_retry(attempt, method, path, status_code=status_code, sent=sent):
+        return None
+    return retry.backoff(attempt, None if response is None else response.headers.get("Retry-After"))
+
+
+def _timed(hedging: HedgingPolicy, send: Callable[[], Any]) -> Any:
+    started = monotonic()
+    result = send()
+    hedging.record((monotonic() - started) * 1000)
+    return result
+
+
+def _first_answer(done: Iterable[Any], pending: bool, transport_errors: Tuple[type, ...]) -> Any:
+    """Pick the hedged leg answering the request among the completed ones, None to keep waiting.
+
+    A response, even an error sent by Meilisearch, answers the request. A transport error only
+    does once no other leg is left.
+    """
+    done = list(done)
+    for leg in done:
+        if not isinstance(leg.exception(), transport_errors):
+            return leg
+    return None if pending else done[0]
+
+
+def _record_outcome(config: Config, url: str, success: bool) -> None:
+    if config.middleware.circuit_breaker is not None:
+        config.middleware.circuit_breaker.record(url, success)
+
+
+def _report(
+    config: Config,
+    sample: RequestSample,
+    states: List[Any],
+    response: Optional[Any],
+    error: Optional[BaseException],
+) -> None:
+    # Every hook and sink is run even when a hook fails. The error of a hook is raised only when
+    # the request succeeded, so that it never hides the error of the request.
+    hook_error: Optional[Exception] = None
+    for hook, state in zip(config.middleware.hooks, states):
+        try:
+            hook.after_response(sample, response, error, state)
+        except Exception as err:  # pylint: disable=broad-except
+            hook_error = hook_error or err
+    for sink in config.middleware.metrics:
+        sink.record(sample)
+    if hook_error is not None and error is None:
+        raise hook_error
+
+
+def _failed_to_connect(err: requests.exceptions.RequestException) -> bool:
+    # A failed connection means the request never reached Meilisearch.
+    if isinstance(err, requests.exceptions.ConnectTimeout):
+        return True
+    reason = getattr(err.args[0], "reason", None) if err.args else None
+    return isinstance(reason, NewConnectionError)
+
+
+def _build_headers(
+    config: Config, custom_headers: Optional[Mapping[str, str]] = None
+) -> Dict[str, str]:
+    headers = {
+        "Authorization": f"Bearer {config.api_key}",
+        "User-Agent": _build_user_agent(config.client_agents),
+    }
+    if not config.transport.keep_alive:
+        headers["Connection"] = "close"
+
+    if custom_headers is not None:
+        headers.update(custom_headers)
+
+    return headers
+
+
+def _serialize_body(
+    body: Any, codec: JsonCodec, serializer: Optional[Type[json.JSONEncoder]] = None
+) -> Any:
+    # Streamed bodies are sent chunk by chunk as they are produced.
+    if isinstance(body, (bytes, abc.Iterator, abc.AsyncIterator)):
+        return body
+
+    serialize_body = isinstance(body, dict) or body
+    return (
+        encode_json(codec, body, serializer)
+        if isinstance(body, bool) or serialize_body
+        else "" if body == "" else "null"
+    )
+
+
+def _should_compress(data: Any, config: Config) -> bool:
+    # Streamed bodies have no known size, they are always worth compressing.
+    if config.transport.compression is None:
+        return False
+    if isinstance(data, bytes):
+        return len(data) >= config.transport.compression_threshold
+    return isinstance(data, (abc.Iterator, abc.AsyncIterator))
+
+
+def _compressor(compression: Optional[str], level: int) -> Any:
+    # wbits selects the container: 31 writes a gzip stream, 15 a zlib stream for deflate.
+    return zlib.compressobj(level, zlib.DEFLATED, 31 if compression == "gzip" else 15)
+
+
+def _split_bytes(data: bytes, chunk_size: int = 64 * 1024) -> Iterator[memoryview]:
+    view = memoryview(data)
+    for i in range(0, len(view), chunk_size):
+        yield view[i : i + chunk_size]
+
+
+def _compress_chunks(chunks: Iterable[Union[bytes, memoryview]], config: Config) -> Iterator[bytes]:
+    """Compress the chunks as they are sent, without building the whole compressed body."""
+    compressor = _compressor(config.transport.compression, config.transport.compression_level)
+    for chunk in chunks:
+        if compressed := compressor.compress(chunk):
+            yield compressed
+    yield compressor.flush()
+
+
+def _build_session(config: Config) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=config.transport.pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
 @lru_cache(maxsize=1)
 def _build_user_agent(client_agents: Optional[Tuple[str, ...]] = None) -> str:
     user_agent = qualified_version()
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import itertools
+import re
+import threading
+from time import monotonic
+from typing import Collection, Dict, Sequence
+
+# Routes only reading data even though they are sent with POST. Every other POST, and every PUT,
+# PATCH and DELETE, enqueues a task.
+_READ_ONLY_POST_PATH = re.compile(
+    r"^(multi-search|indexes/[^/]+/(search|facet-search|similar|documents/fetch))$"
+)
+# GET routes served by any replica along with the read-only POST routes: the document reads.
+# Everything else, task polling included, goes to the primary.
+_REPLICA_GET_PATH = re.compile(r"^indexes/[^/]+/documents(/[^/]+)?$")
+
+LOAD_BALANCING = ("round_robin", "least_outstanding")
+
+
+def is_read_only(method: str, path: str) -> bool:
+    """Whether the request only reads data: the GETs and the read-only POST routes."""
+    method = method.upper()
+    if method == "GET":
+        return True
+    return method == "POST" and bool(_READ_ONLY_POST_PATH.match(path.split("?", 1)[0]))
+
+
+def is_read(method: str, path: str) -> bool:
+    """Whether the request only reads data and can be sent to any node."""
+    method = method.upper()
+    if method == "GET":
+        return bool(_REPLICA_GET_PATH.match(path.split("?", 1)[0]))
+    return is_read_only(method, path)
+
+
+class NodePool:
+    """Pick the Meilisearch node serving each request.
+
+    The first url is the primary, it receives the writes and the task polling. The reads are
+    spread over every node, round-robin or to the node with the fewest requests in flight. A node
+    failing with a connection error, a timeout or a 5xx status is skipped for
+    `cooldown_in_ms` unless no other node is left.
+    """
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        load_balancing: str = "round_robin",
+        cooldown_in_ms: float = 5000,
+    ) -> None:
+        self.urls = tuple(urls)
+        self.load_balancing = load_balancing
+        self.cooldown_in_ms = cooldown_in_ms
+        self._outstanding: Dict[str, int] = dict.fromkeys(self.urls, 0)
+        self._unhealthy_until: Dict[str, float] = dict.fromkeys(self.urls, 0.0)
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    @property
+    def primary(self) -> str:
+        return self.urls[0]
+
+    def select(self, read: bool, exclude: Collection[str] = ()) -> str:
+        """Return the url of the node the next request should be sent to.
+
+        Parameters
+        ----------
+        read:
+            True for the requests any replica can serve, the others always go to the primary.
+        exclude (optional):
+            Nodes already tried by the request, skipped while another node is left.
+        """
+        if not read or len(self.urls) == 1:
+            return self.primary
+
+        with self._lock:
+            now = monotonic()
+            candidates = [url for url in self.urls if url not in exclude] or list(self.urls)
+            healthy = [url for url in candidates if self._unhealthy_until[url] <= now]
+            candidates = healthy or candidates
+            if self.load_balancing == "least_outstanding":
+                offset = next(self._counter) % len(candidates)
+                # Rotating before taking the minimum spreads the ties evenly.
+                rotated = candidates[offset:] + candidates[:offset]
+                url = min(rotated, key=self._outstanding.__getitem__)
+            else:
+                url = candidates[next(self._counter) % len(candidates)]
+            self._outstanding[url] += 1
+            return url
+
+    def can_failover(self, exclude: Collection[str]) -> bool:
+        """Whether a read request has a node left to try."""
+        return any(url not in exclude for url in self.urls)
+
+    def release(self, url: str, success: bool, read: bool = True) -> None:
+        """Record the outcome of a request sent to `url` by `select`."""
+        if not read or len(self.urls) == 1:
+            return
+        with self._lock:
+            self._outstanding[url] -= 1
+            if success:
+                self._unhealthy_until[url] = 0.0
+            else:
+                self._unhealthy_until[url] = monotonic() + self.cooldown_in_ms / 1000
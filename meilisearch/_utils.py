@@ -1,9 +1,19 @@
+import asyncio
+import json
+import os
+from contextlib import contextmanager
 from datetime import datetime
-from functools import lru_cache
-from typing import Union
+from functools import lru_cache, partial
+from typing import IO, Any, AsyncIterator, Iterator, List, Mapping, Optional, Type, TypeVar, Union
 
 import pydantic
 
+from meilisearch._codec import JsonCodec, encode_json
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+T = TypeVar("T")
+
 
 @lru_cache(maxsize=1)
 def is_pydantic_2() -> bool:
@@ -41,3 +51,137 @@ def iso_to_date_time(iso_date: Union[datetime, str, None]) -> Union[datetime, No
         reduce = len(split[1]) - 6
         reduced = f"{split[0]}.{split[1][:-reduce]}Z"
         return datetime.strptime(reduced, "%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+class PayloadBatcher:
+    """Pack documents into JSON arrays that stay under a maximum payload size.
+
+    Each document is serialized once when it is added and the encoded bytes are reused as is in
+    the payload. A batch is cut when adding the next document would make the payload larger than
+    `max_payload_size` bytes or when it already holds `batch_size` documents. A document that is
+    larger than `max_payload_size` on its own is sent alone in its batch.
+    """
+
+    def __init__(
+        self,
+        batch_size: int,
+        max_payload_size: int,
+        serializer: Optional[Type[json.JSONEncoder]] = None,
+        codec: Optional[JsonCodec] = None,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size should be greater than or equal to 1")
+        if max_payload_size < 1:
+            raise ValueError("max_payload_size should be greater than or equal to 1")
+
+        self.batch_size = batch_size
+        self.max_payload_size = max_payload_size
+        self.serializer = serializer
+        self.codec = codec or JsonCodec()
+        self._documents: List[bytes] = []
+        # The opening bracket, then every document is followed by either a comma or the closing
+        # bracket.
+        self._size = 1
+
+    def add(self, document: Mapping[str, Any]) -> Optional[bytes]:
+        """Add a document, returning the previous batch if the document did not fit in it."""
+        encoded = encode_json(self.codec, document, self.serializer)
+        payload = None
+        if self._documents and (
+            len(self._documents) == self.batch_size
+            or self._size + len(encoded) + 1 > self.max_payload_size
+        ):
+            payload = self.flush()
+
+        self._documents.append(encoded)
+        self._size += len(encoded) + 1
+        return payload
+
+    def flush(self) -> Optional[bytes]:
+        """Return the pending batch, if any, and start a new one."""
+        if not self._documents:
+            return None
+
+        payload = b"[" + b",".join(self._documents) + b"]"
+        self._documents = []
+        self._size = 1
+        return payload
+
+
+@contextmanager
+def open_binary(file: Union[str, os.PathLike, IO[bytes]]) -> Iterator[IO[bytes]]:
+    """Open a path for binary reading, a file object is used as is and left open."""
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "rb") as opened:
+            yield opened
+    else:
+        yield file
+
+
+def read_chunks(file: IO[bytes], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Read a binary file in chunks of at most `chunk_size` bytes."""
+    if chunk_size < 1:
+        raise ValueError("chunk_size should be greater than or equal to 1")
+
+    return iter(partial(file.read, chunk_size), b"")
+
+
+def split_records(
+    file: IO[bytes],
+    batch_size: int,
+    *,
+    csv: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Iterator[bytes]]:
+    """Split an NDJSON or CSV file into streams of at most `batch_size` records.
+
+    Each stream yields chunks of about `chunk_size` bytes and must be consumed before the next
+    one is requested. With `csv` the header row is repeated at the start of every stream and a
+    quoted field may span several lines.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size should be greater than or equal to 1")
+    if chunk_size < 1:
+        raise ValueError("chunk_size should be greater than or equal to 1")
+
+    header = _read_record(file, csv) if csv else b""
+    while first := _read_record(file, csv):
+        stream = _stream_records(file, header + first, batch_size, csv, chunk_size)
+        yield stream
+        # Skip what the consumer left unread so the next stream starts on a record boundary.
+        for _ in stream:
+            pass
+
+
+def _stream_records(
+    file: IO[bytes], first: bytes, batch_size: int, csv: bool, chunk_size: int
+) -> Iterator[bytes]:
+    buffer = bytearray(first)
+    for _ in range(batch_size - 1):
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+        record = _read_record(file, csv)
+        if not record:
+            break
+        buffer += record
+    if buffer:
+        yield bytes(buffer)
+
+
+def _read_record(file: IO[bytes], csv: bool) -> bytes:
+    record = file.readline()
+    if csv:
+        # An odd number of quotes means a quoted field continues on the next line.
+        while record.count(b'"') % 2:
+            line = file.readline()
+            if not line:
+                break
+            record += line
+    return record
+
+
+async def iterate_in_thread(iterator: Iterator[T]) -> AsyncIterator[T]:
+    """Pull the items of a blocking iterator, such as file chunks, without blocking the loop."""
+    while (item := await asyncio.to_thread(next, iterator, None)) is not None:
+        yield item
@@ -0,0 +1,1144 @@
+# pylint: disable=too-many-public-methods
+
+from __future__ import annotations
+
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Literal,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
+from urllib import parse
+
+from meilisearch._async_httprequests import AsyncHttpRequests
+from meilisearch.async_index import AsyncIndex
+from meilisearch.async_task import AsyncTaskHandler
+from meilisearch.client import Client
+from meilisearch.config import Config, Middleware, Transport
+from meilisearch.errors import (  # noqa: F401
+    MeilisearchApiError,
+    MeilisearchCommunicationError,
+    MeilisearchError,
+)
+from meilisearch.models.key import Key, KeysResults
+from meilisearch.models.task import Batch, BatchResults, Task, TaskInfo, TaskResults
+from meilisearch.models.webhook import Webhook, WebhooksResults
+from meilisearch.polling import PollingStrategy
+
+
+class AsyncClient:
+    """
+    An asyncio client for the Meilisearch API
+
+    Same API as Client, but every method doing an HTTP call is a coroutine. The requests are sent
+    through a non-blocking connection pool shared by the client and every AsyncIndex created from
+    it, so many concurrent calls can run on a single event loop.
+
+    The background task watching of Client, watch_task and enable_task_webhook, is not
+    available: wait_for_task and wait_for_tasks always poll the tasks.
+    """
+
+    # Import aliases to satisfy pylint (used in docstrings)
+    MeilisearchApiError = MeilisearchApiError
+
+    def __init__(
+        self,
+        url: Union[str, Sequence[str]],
+        api_key: Optional[str] = None,
+        timeout: Optional[int] = None,
+        client_agents: Optional[Tuple[str, ...]] = None,
+        custom_headers: Optional[Mapping[str, str]] = None,
+        transport: Optional[Transport] = None,
+        middleware: Optional[Middleware] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        url:
+            The url to the Meilisearch API (ex: http://localhost:7700), or a list of the urls of
+            several nodes. The first one is the primary receiving the writes and the task polling,
+            the searches, facet searches and document reads are spread over all of them and fail
+            over to the next node when one does not answer.
+        api_key:
+            The optional API key for Meilisearch
+        timeout (optional):
+            The amount of time in seconds that the client will wait for a response before timing
+            out.
+        client_agents (optional):
+            Used to send additional client agent information for clients extending the functionality
+            of this client.
+        custom_headers (optional):
+            Custom headers to add when sending data to Meilisearch.
+        transport (optional):
+            Transport setting how the requests are sent: size of the connection pool shared by
+            this client and every AsyncIndex created from it, keep-alive, JSON codec, compression of
+            the request bodies and load balancing over several nodes. Defaults to Transport().
+        middleware (optional):
+            Middleware taking part in every request, such as a RetryPolicy, a SearchCache or a
+            TracingHook. Defaults to none of them.
+        """
+
+        self.config = Config(
+            url,
+            api_key,
+            timeout=timeout,
+            client_agents=client_agents,
+            transport=transport,
+            middleware=middleware,
+        )
+
+        self.http = AsyncHttpRequests(self.config, custom_headers)
+
+        self.task_handler = AsyncTaskHandler(self.config, self.http)
+
+    async def __aenter__(self) -> AsyncClient:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the connections of the pool shared by this client and its indexes."""
+        await self.http.aclose()
+
+    async def create_index(self, uid: str, options: Optional[Mapping[str, Any]] = None) -> TaskInfo:
+        """Create an index.
+
+        Parameters
+        ----------
+        uid: str
+            UID of the index.
+        options (optional): dict
+            Options passed during index creation (ex: primaryKey).
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await AsyncIndex.create(self.config, uid, options, http=self.http)
+
+    async def delete_index(self, uid: str) -> TaskInfo:
+        """Deletes an index
+
+        Parameters
+        ----------
+        uid:
+            UID of the index.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+
+        task = await self.http.delete(f"{self.config.paths.index}/{uid}")
+
+        return TaskInfo(**task)
+
+    async def get_indexes(
+        self, parameters: Optional[Mapping[str, Any]] = None
+    ) -> Dict[str, List[AsyncIndex]]:
+        """Get all indexes.
+
+        Parameters
+        ----------
+        parameters (optional):
+            parameters accepted by the get indexes route: https://www.meilisearch.com/docs/reference/api/indexes#list-all-indexes
+
+        Returns
+        -------
+        indexes:
+            Dictionary with limit, offset, total and results a list of AsyncIndex instances.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        if parameters is None:
+            parameters = {}
+        response = await self.http.get(f"{self.config.paths.index}?{parse.urlencode(parameters)}")
+        response["results"] = [
+            AsyncIndex(
+                self.config,
+                index["uid"],
+                index["primaryKey"],
+                index["createdAt"],
+                index["updatedAt"],
+                http=self.http,
+            )
+            for index in response["results"]
+        ]
+        return response
+
+    async def get_raw_indexes(
+        self, parameters: Optional[Mapping[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Get all indexes in dictionary format.
+
+        Parameters
+        ----------
+        parameters (optional):
+            parameters accepted by the get indexes route: https://www.meilisearch.com/docs/reference/api/indexes#list-all-indexes
+
+        Returns
+        -------
+        indexes:
+            Dictionary with limit, offset, total and results a list of indexes in dictionary format. (e.g [{ 'uid': 'movies' 'primaryKey': 'objectID' }])
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        if parameters is None:
+            parameters = {}
+        return await self.http.get(f"{self.config.paths.index}?{parse.urlencode(parameters)}")
+
+    async def get_index(self, uid: str) -> AsyncIndex:
+        """Get the index.
+        This index should already exist.
+
+        Parameters
+        ----------
+        uid:
+            UID of the index.
+
+        Returns
+        -------
+        index:
+            An AsyncIndex instance containing the information of the fetched index.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await AsyncIndex(self.config, uid, http=self.http).fetch_info()
+
+    async def get_raw_index(self, uid: str) -> Dict[str, Any]:
+        """Get the index as a dictionary.
+        This index should already exist.
+
+        Parameters
+        ----------
+        uid:
+            UID of the index.
+
+        Returns
+        -------
+        index:
+            An index in dictionary format. (e.g { 'uid': 'movies' 'primaryKey': 'objectID' })
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await self.http.get(f"{self.config.paths.index}/{uid}")
+
+    def index(self, uid: str) -> AsyncIndex:
+        """Create a local reference to an index identified by UID, without doing an HTTP call.
+        Calling this method doesn't create an index in the Meilisearch instance, but grants access to all the other methods in the AsyncIndex class.
+
+        Parameters
+        ----------
+        uid:
+            UID of the index.
+
+        Returns
+        -------
+        index:
+            An AsyncIndex instance.
+        """
+        if uid is not None:
+            return AsyncIndex(self.config, uid=uid, http=self.http)
+        raise ValueError("The index UID should not be None")
+
+    @overload
+    async def multi_search(
+        self,
+        queries: Sequence[Mapping[str, Any]],
+        federation: Optional[Dict[str, Any]] = None,
+        *,
+        raw: Literal[False] = False,
+    ) -> Dict[str, List[Dict[str, Any]]]: ...
+
+    @overload
+    async def multi_search(
+        self,
+        queries: Sequence[Mapping[str, Any]],
+        federation: Optional[Dict[str, Any]] = None,
+        *,
+        raw: Literal[True],
+    ) -> bytes: ...
+
+    async def multi_search(
+        self,
+        queries: Sequence[Mapping[str, Any]],
+        federation: Optional[Dict[str, Any]] = None,
+        *,
+        raw: bool = False,
+    ) -> Union[Dict[str, List[Dict[str, Any]]], bytes]:
+        """Multi-index search.
+
+        Parameters
+        ----------
+        queries:
+            List of dictionaries containing the specified indexes and their search queries
+            https://www.meilisearch.com/docs/reference/api/search#search-in-an-index
+            It can also include remote options in federationOptions for each query
+            https://www.meilisearch.com/docs/reference/api/network
+        federation: (optional):
+            Dictionary containing offset and limit
+            https://www.meilisearch.com/docs/reference/api/multi_search
+        raw (optional):
+            Return the body of the response as bytes, without decoding it, for instance to
+            forward it untouched. Defaults to False.
+
+        Returns
+        -------
+        results:
+            Dictionary of results for each search query
+            The encoded response when raw is True.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await self.http.post(
+            f"{self.config.paths.multi_search}",
+            body={"queries": queries, "federation": federation},
+            raw=raw,
+        )
+
+    async def update_documents_by_function(
+        self, index_uid: str, queries: Dict[str, List[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """Update Documents by function
+        Parameters
+        ----------
+        index_uid:
+            The index_uid where you want to update documents of.
+        queries:
+            List of dictionaries containing functions with or without filters that you want to use to update documents.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await self.http.post(
+            path=f"{self.config.paths.index}/{index_uid}/{self.config.paths.document}/{self.config.paths.edit}",
+            body=dict(queries),
+        )
+
+    async def get_all_stats(self) -> Dict[str, Any]:
+        """Get all stats of Meilisearch
+
+        Get information about database size and all indexes
+        https://www.meilisearch.com/docs/reference/api/stats
+
+        Returns
+        -------
+        stats:
+            Dictionary containing stats about your Meilisearch instance.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await self.http.get(self.config.paths.stat)
+
+    async def health(self) -> Dict[str, str]:
+        """Get health of the Meilisearch server.
+
+        Returns
+        -------
+        health:
+            Dictionary containing the status of the Meilisearch instance.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await self.http.get(self.config.paths.health)
+
+    async def is_healthy(self) -> bool:
+        """Get health of the Meilisearch server."""
+        try:
+            await self.health()
+        except MeilisearchError:
+            return False
+        return True
+
+    async def get_key(self, key_or_uid: str) -> Key:
+        """Gets information about a specific API key.
+
+        Parameters
+        ----------
+        key_or_uid:
+            The key or the uid for which to retrieve the information.
+
+        Returns
+        -------
+        key:
+            The API key.
+            https://www.meilisearch.com/docs/reference/api/keys#get-key
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        key = await self.http.get(f"{self.config.paths.keys}/{key_or_uid}")
+
+        return Key(**key)
+
+    async def get_keys(self, parameters: Optional[Mapping[str, Any]] = None) -> KeysResults:
+        """Gets the Meilisearch API keys.
+
+        Parameters
+        ----------
+        parameters (optional):
+            parameters accepted by the get keys route: https://www.meilisearch.com/docs/reference/api/keys#get-all-keys
+
+        Returns
+        -------
+        keys:
+            API keys.
+            https://www.meilisearch.com/docs/reference/api/keys#get-keys
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        if parameters is None:
+            parameters = {}
+        keys = await self.http.get(f"{self.config.paths.keys}?{parse.urlencode(parameters)}")
+
+        return KeysResults(**keys)
+
+    async def create_key(self, options: Mapping[str, Any]) -> Key:
+        """Creates a new API key.
+
+        Parameters
+        ----------
+        options:
+            Options, the information to use in creating the key (ex: { 'actions': ['*'], 'indexes': ['movies'], 'description': 'Search Key', 'expiresAt': '22-01-01' }).
+            An `actions`, an `indexes` and a `expiresAt` fields are mandatory,`None` should be specified for no expiration date.
+            `actions`: A list of actions permitted for the key. ["*"] for all actions.
+            `indexes`: A list of indexes permitted for the key. ["*"] for all indexes.
+            Note that if an expires_at value is included it should be in UTC time.
+
+        Returns
+        -------
+        key:
+            The new API key.
+            https://www.meilisearch.com/docs/reference/api/keys#get-keys
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.post(f"{self.config.paths.keys}", options)
+
+        return Key(**task)
+
+    async def update_key(self, key_or_uid: str, options: Mapping[str, Any]) -> Key:
+        """Update an API key.
+
+        Parameters
+        ----------
+        key_or_uid:
+            The key or the uid of the key for which to update the information.
+        options:
+            The information to use in creating the key (ex: { 'description': 'Search Key', 'expiresAt': '22-01-01' }). Note that if an
+            expires_at value is included it should be in UTC time.
+
+        Returns
+        -------
+        key:
+            The updated API key.
+            https://www.meilisearch.com/docs/reference/api/keys#get-keys
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        url = f"{self.config.paths.keys}/{key_or_uid}"
+        key = await self.http.patch(url, options)
+
+        return Key(**key)
+
+    async def delete_key(self, key_or_uid: str) -> int:
+        """Deletes an API key.
+
+        Parameters
+        ----------
+        key:
+            The key or the uid of the key to delete.
+
+        Returns
+        -------
+        keys:
+            The Response status code. 204 signifies a successful delete.
+            https://www.meilisearch.com/docs/reference/api/keys#get-keys
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        response = await self.http.delete(f"{self.config.paths.keys}/{key_or_uid}")
+
+        return response.status_code
+
+    # WEBHOOKS ROUTES
+
+    async def get_webhooks(self) -> WebhooksResults:
+        """Get all webhooks.
+
+        Returns
+        -------
+        webhooks:
+            WebhooksResults instance containing list of webhooks and pagination info.
+            https://www.meilisearch.com/docs/reference/api/webhooks
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        webhooks = await self.http.get(f"{self.config.paths.webhooks}")
+        return WebhooksResults(**webhooks)
+
+    async def get_webhook(self, webhook_uuid: str) -> Webhook:
+        """Get information about a specific webhook.
+
+        Parameters
+        ----------
+        webhook_uuid:
+            The uuid of the webhook to retrieve.
+
+        Returns
+        -------
+        webhook:
+            The webhook information.
+            https://www.meilisearch.com/docs/reference/api/webhooks#get-one-webhook
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        webhook = await self.http.get(f"{self.config.paths.webhooks}/{webhook_uuid}")
+        return Webhook(**webhook)
+
+    async def create_webhook(self, options: Mapping[str, Any]) -> Webhook:
+        """Create a new webhook.
+
+        Parameters
+        ----------
+        options:
+            The webhook configuration. Can include:
+            - url: The URL to send the webhook to
+            - headers: Dictionary of HTTP headers to include in webhook requests
+
+        Returns
+        -------
+        webhook:
+            The newly created webhook.
+            https://www.meilisearch.com/docs/reference/api/webhooks#create-a-webhook
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        webhook = await self.http.post(self.config.paths.webhooks, options)
+        return Webhook(**webhook)
+
+    async def update_webhook(self, webhook_uuid: str, options: Mapping[str, Any]) -> Webhook:
+        """Update an existing webhook.
+
+        Parameters
+        ----------
+        webhook_uuid:
+            The uuid of the webhook to update.
+        options:
+            The webhook fields to update. Can include:
+            - url: The URL to send the webhook to
+            - headers: Dictionary of HTTP headers to include in webhook requests
+
+        Returns
+        -------
+        webhook:
+            The updated webhook.
+            https://www.meilisearch.com/docs/reference/api/webhooks#update-a-webhook
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        webhook = await self.http.patch(f"{self.config.paths.webhooks}/{webhook_uuid}", options)
+        return Webhook(**webhook)
+
+    async def delete_webhook(self, webhook_uuid: str) -> int:
+        """Delete a webhook.
+
+        Parameters
+        ----------
+        webhook_uuid:
+            The uuid of the webhook to delete.
+
+        Returns
+        -------
+        status_code:
+            The Response status code. 204 signifies a successful delete.
+            https://www.meilisearch.com/docs/reference/api/webhooks#delete-a-webhook
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        response = await self.http.delete(f"{self.config.paths.webhooks}/{webhook_uuid}")
+        return response.status_code
+
+    async def get_version(self) -> Dict[str, str]:
+        """Get version Meilisearch
+
+        Returns
+        -------
+        version:
+            Information about the version of Meilisearch.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await self.http.get(self.config.paths.version)
+
+    async def version(self) -> Dict[str, str]:
+        """Alias for get_version
+
+        Returns
+        -------
+        version:
+            Information about the version of Meilisearch.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await self.get_version()
+
+    async def create_dump(self) -> TaskInfo:
+        """Trigger the creation of a Meilisearch dump.
+
+        Returns
+        -------
+        Dump:
+            Information about the dump.
+            https://www.meilisearch.com/docs/reference/api/dump#create-a-dump
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.post(self.config.paths.dumps)
+
+        return TaskInfo(**task)
+
+    async def create_snapshot(self) -> TaskInfo:
+        """Trigger the creation of a Meilisearch snapshot.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.post(self.config.paths.snapshots)
+
+        return TaskInfo(**task)
+
+    async def swap_indexes(self, parameters: List[Mapping[str, List[str]]]) -> TaskInfo:
+        """Swap two indexes.
+
+        Parameters
+        ----------
+        indexes:
+            List of indexes to swap (ex: [{"indexes": ["indexA", "indexB"]}).
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return TaskInfo(**await self.http.post(self.config.paths.swap, parameters))
+
+    async def get_tasks(self, parameters: Optional[MutableMapping[str, Any]] = None) -> TaskResults:
+        """Get all tasks.
+
+        Parameters
+        ----------
+        parameters (optional):
+            parameters accepted by the get tasks route: https://www.meilisearch.com/docs/reference/api/tasks#get-tasks.
+
+        Returns
+        -------
+        task:
+            TaskResult instance containing limit, from, next and results containing a list of all
+            enqueued, processing, succeeded or failed tasks.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await self.task_handler.get_tasks(parameters=parameters)
+
+    async def get_task(self, uid: int) -> Task:
+        """Get one task.
+
+        Parameters
+        ----------
+        uid:
+            Identifier of the task.
+
+        Returns
+        -------
+        task:
+            Task instance containing information about the processed asynchronous task.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await self.task_handler.get_task(uid)
+
+    async def cancel_tasks(self, parameters: MutableMapping[str, Any]) -> TaskInfo:
+        """Cancel a list of enqueued or processing tasks.
+
+        Parameters
+        ----------
+        parameters:
+            parameters accepted by the cancel tasks route:https://www.meilisearch.com/docs/reference/api/tasks#cancel-tasks.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await self.task_handler.cancel_tasks(parameters=parameters)
+
+    async def delete_tasks(self, parameters: MutableMapping[str, Any]) -> TaskInfo:
+        """Delete a list of finished tasks.
+
+        Parameters
+        ----------
+        parameters (optional):
+            parameters accepted by the delete tasks route:https://www.meilisearch.com/docs/reference/api/tasks#delete-task.
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await self.task_handler.delete_tasks(parameters=parameters)
+
+    async def wait_for_task(
+        self,
+        uid: int,
+        timeout_in_ms: int = 5000,
+        interval_in_ms: int = 50,
+        *,
+        polling: Optional[PollingStrategy] = None,
+    ) -> Task:
+        """Wait until Meilisearch processes a task until it fails or succeeds.
+
+        Parameters
+        ----------
+        uid:
+            Identifier of the task to wait for being processed.
+        timeout_in_ms (optional):
+            Time the method should wait before raising a MeilisearchTimeoutError
+        interval_in_ms (optional):
+            Time interval the method should wait (sleep) between requests
+        polling (optional):
+            PollingStrategy controlling the intervals between requests, overrides interval_in_ms.
+
+        Returns
+        -------
+        task:
+            Task instance containing information about the processed asynchronous task.
+
+        Raises
+        ------
+        MeilisearchTimeoutError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await self.task_handler.wait_for_task(
+            uid, timeout_in_ms, interval_in_ms, polling=polling
+        )
+
+    async def wait_for_tasks(
+        self,
+        uids: Sequence[int],
+        timeout_in_ms: int = 5000,
+        interval_in_ms: int = 50,
+        *,
+        stop_on_failure: bool = False,
+        polling: Optional[PollingStrategy] = None,
+    ) -> List[Task]:
+        """Wait until Meilisearch processes several tasks until they fail or succeed.
+
+        The pending tasks are polled together with one request per interval.
+
+        Parameters
+        ----------
+        uids:
+            Identifiers of the tasks to wait for being processed.
+        timeout_in_ms (optional):
+            Time the method should wait for all the tasks before raising a MeilisearchTimeoutError.
+        interval_in_ms (optional):
+            Time interval the method should wait (sleep) between requests.
+        stop_on_failure (optional):
+            Return as soon as one of the tasks failed, without waiting for the others.
+        polling (optional):
+            PollingStrategy controlling the intervals between requests, overrides interval_in_ms.
+
+        Returns
+        -------
+        tasks:
+            List of Task instances of the processed tasks, in the order of uids.
+
+        Raises
+        ------
+        MeilisearchTimeoutError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await self.task_handler.wait_for_tasks(
+            uids,
+            timeout_in_ms,
+            interval_in_ms,
+            stop_on_failure=stop_on_failure,
+            polling=polling,
+        )
+
+    async def get_batches(
+        self, parameters: Optional[MutableMapping[str, Any]] = None
+    ) -> BatchResults:
+        """Get all batches.
+
+        Parameters
+        ----------
+        parameters (optional):
+            parameters accepted by the get batches route: https://www.meilisearch.com/docs/reference/api/batches#get-batches.
+
+        Returns
+        -------
+        batch:
+            BatchResult instance containing limit, from, next and results containing a list of all batches.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await self.task_handler.get_batches(parameters=parameters)
+
+    async def get_batch(self, uid: int) -> Batch:
+        """Get one tasks batch.
+
+        Parameters
+        ----------
+        uid:
+            Identifier of the batch.
+
+        Returns
+        -------
+        batch:
+            Batch instance containing information about the progress of the asynchronous batch.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await self.task_handler.get_batch(uid)
+
+    # Tenant tokens are signed locally without any HTTP call, the sync implementation is reused.
+    generate_tenant_token = Client.generate_tenant_token
+    _base64url_encode = staticmethod(Client._base64url_encode)  # pylint: disable=protected-access
+    _valid_uuid = staticmethod(Client._valid_uuid)  # pylint: disable=protected-access
+
+    async def add_or_update_networks(
+        self, body: Union[MutableMapping[str, Any], None]
+    ) -> Dict[str, str]:
+        """Set all the Remote Networks
+
+        Parameters
+        ----------
+        body:
+            Remote networks that are allowed
+
+        Returns
+        -------
+        remote networks:
+            Remote Networks containing information about the networks allowed/present.
+            https://www.meilisearch.com/docs/reference/api/network
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+
+        return await self.http.patch(path=f"{self.config.paths.network}", body=body)
+
+    async def get_all_networks(self) -> Dict[str, str]:
+        """Fetches all the remote-networks present
+
+        Returns
+        -------
+        remote networks:
+            All remote networks containing information about each remote and their respective remote-name and searchApi key
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await self.http.get(path=f"{self.config.paths.network}")
+
+    async def create_chat_completion(
+        self,
+        workspace_uid: str,
+        messages: List[Dict[str, str]],
+        model: str = "gpt-3.5-turbo",
+        stream: bool = True,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Streams a chat completion from the Meilisearch chat API.
+
+        Parameters
+        ----------
+        workspace_uid:
+            Unique identifier of the chat workspace to use.
+        messages:
+            List of message dicts (e.g. {"role": "user", "content": "..."}) comprising the chat history.
+        model:
+            The model name to use for completion (should correspond to the LLM in workspace settings).
+        stream:
+            Whether to stream the response. Must be True for now (only streaming is supported).
+
+        Returns
+        -------
+        chunks:
+            Parsed chunks of the completion as Python dicts. Each chunk is a partial response (in OpenAI format).
+            Iteration ends when the completion is done.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        MeilisearchCommunicationError
+            If a network error occurs.
+        ValueError
+            If stream=False is passed (not currently supported), or if workspace_uid is empty or contains path separators.
+        """
+        if not stream:
+            # The API currently only supports streaming responses:
+            raise ValueError("Non-streaming chat completions are not supported. Use stream=True.")
+
+        # Basic security validation (only what's needed)
+        if not workspace_uid:
+            raise ValueError("workspace_uid is required and cannot be empty")
+        if "/" in workspace_uid or "\\" in workspace_uid:
+            raise ValueError("Invalid workspace_uid: must not contain path separators")
+
+        payload = {"model": model, "messages": messages, "stream": True}
+
+        # Construct the URL for the chat completions route.
+        endpoint = f"chats/{workspace_uid}/chat/completions"
+
+        # Initiate the HTTP POST request in streaming mode.
+        response = await self.http.post_stream(endpoint, body=payload)
+
+        try:
+            # Iterate over the streaming response lines
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+
+                if line.startswith("data: "):
+                    data = line[len("data: ") :]
+                    if data.strip() == "[DONE]":
+                        break
+
+                    try:
+                        chunk = self.config.transport.json_codec.loads(data)
+                        yield chunk
+                    except ValueError as e:
+                        raise MeilisearchCommunicationError(
+                            f"Failed to parse chat chunk: {e}"
+                        ) from e
+        finally:
+            await response.aclose()
+
+    async def get_chat_workspaces(
+        self,
+        *,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Get all chat workspaces.
+
+        Parameters
+        ----------
+        offset (optional):
+            Number of workspaces to skip.
+        limit (optional):
+            Maximum number of workspaces to return.
+
+        Returns
+        -------
+        workspaces
+            Dictionary containing the list of chat workspaces and pagination information.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        params = {}
+        if offset is not None:
+            params["offset"] = offset
+        if limit is not None:
+            params["limit"] = limit
+        path = "chats" + ("?" + parse.urlencode(params) if params else "")
+        return await self.http.get(path)
+
+    async def get_chat_workspace_settings(self, workspace_uid: str) -> Dict[str, Any]:
+        """Get the settings for a specific chat workspace.
+
+        Parameters
+        ----------
+        workspace_uid:
+            Unique identifier of the chat workspace.
+
+        Returns
+        -------
+        settings:
+            Dictionary containing the workspace settings.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        ValueError
+            If workspace_uid is empty or contains path separators.
+        """
+        # Basic security validation (only what's needed)
+        if not workspace_uid:
+            raise ValueError("workspace_uid is required and cannot be empty")
+        if "/" in workspace_uid or "\\" in workspace_uid:
+            raise ValueError("Invalid workspace_uid: must not contain path separators")
+
+        return await self.http.get(f"chats/{workspace_uid}/settings")
+
+    async def update_chat_workspace_settings(
+        self, workspace_uid: str, settings: Mapping[str, Any]
+    ) -> Dict[str, Any]:
+        """Update the settings for a specific chat workspace.
+
+        Parameters
+        ----------
+        workspace_uid:
+            Unique identifier of the chat workspace.
+        settings:
+            Dictionary containing the settings to update.
+
+        Returns
+        -------
+        settings:
+            Dictionary containing the updated workspace settings.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        ValueError
+            If workspace_uid is empty or contains path separators, or if settings is empty.
+        """
+        # Basic security validation (only what's needed)
+        if not workspace_uid:
+            raise ValueError("workspace_uid is required and cannot be empty")
+        if "/" in workspace_uid or "\\" in workspace_uid:
+            raise ValueError("Invalid workspace_uid: must not contain path separators")
+
+        if not settings:
+            raise ValueError("settings cannot be empty")
+
+        return await self.http.patch(f"chats/{workspace_uid}/settings", body=settings)
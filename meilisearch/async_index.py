@@ -0,0 +1,3041 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from collections import deque
+from datetime import datetime
+from functools import partial
+from itertools import chain, islice
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
+from urllib import parse
+from warnings import warn
+
+from camel_converter import to_snake
+
+from meilisearch._async_httprequests import AsyncHttpRequests
+from meilisearch._codec import JsonCodec
+from meilisearch._utils import (
+    DEFAULT_CHUNK_SIZE,
+    PayloadBatcher,
+    iso_to_date_time,
+    iterate_in_thread,
+    open_binary,
+    read_chunks,
+    split_records,
+)
+from meilisearch.async_task import AsyncTaskHandler
+from meilisearch.config import Config
+from meilisearch.errors import version_error_hint_message
+from meilisearch.export import NdjsonWriter
+from meilisearch.models.document import Document, DocumentsResults
+from meilisearch.models.embedders import (
+    CompositeEmbedder,
+    Embedders,
+    EmbedderType,
+    HuggingFaceEmbedder,
+    OllamaEmbedder,
+    OpenAiEmbedder,
+    RestEmbedder,
+    UserProvidedEmbedder,
+)
+from meilisearch.models.index import (
+    Faceting,
+    IndexStats,
+    LocalizedAttributes,
+    Pagination,
+    PrefixSearch,
+    ProximityPrecision,
+    TypoTolerance,
+)
+from meilisearch.models.task import Task, TaskInfo, TaskResults
+from meilisearch.polling import PollingStrategy
+
+if TYPE_CHECKING:
+    from json import JSONEncoder
+
+T = TypeVar("T")
+
+
+# pylint: disable=too-many-public-methods, too-many-lines
+class AsyncIndex:
+    """
+    Indexes routes wrapper for asyncio.
+
+    AsyncIndex class gives access to all indexes routes and child routes (inherited), every method
+    doing an HTTP call is a coroutine.
+    https://www.meilisearch.com/docs/reference/api/indexes
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        uid: str,
+        primary_key: Optional[str] = None,
+        created_at: Optional[Union[datetime, str]] = None,
+        updated_at: Optional[Union[datetime, str]] = None,
+        *,
+        http: Optional[AsyncHttpRequests] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        config:
+            Config object containing permission and location of Meilisearch.
+        uid:
+            UID of the index on which to perform the index actions.
+        primary_key:
+            Primary-key of the index.
+        http (optional):
+            Transport to reuse, usually the one of the Client. A new one is created if omitted.
+        """
+        self.config = config
+        self.http = http if http is not None else AsyncHttpRequests(config)
+        self.task_handler = AsyncTaskHandler(config, self.http)
+        self.uid = uid
+        self.primary_key = primary_key
+        self.created_at = iso_to_date_time(created_at)
+        self.updated_at = iso_to_date_time(updated_at)
+
+    async def delete(self) -> TaskInfo:
+        """Delete the index.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+
+        task = await self.http.delete(f"{self.config.paths.index}/{self.uid}")
+
+        return TaskInfo(**task)
+
+    async def update(self, primary_key: str) -> TaskInfo:
+        """Update the index primary-key.
+
+        Parameters
+        ----------
+        primary_key:
+            The primary key to use for the index.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        payload = {"primaryKey": primary_key}
+        task = await self.http.patch(f"{self.config.paths.index}/{self.uid}", payload)
+
+        return TaskInfo(**task)
+
+    async def fetch_info(self) -> AsyncIndex:
+        """Fetch the info of the index.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        index_dict = await self.http.get(f"{self.config.paths.index}/{self.uid}")
+        self.primary_key = index_dict["primaryKey"]
+        self.created_at = iso_to_date_time(index_dict["createdAt"])
+        self.updated_at = iso_to_date_time(index_dict["updatedAt"])
+        return self
+
+    async def get_primary_key(self) -> str | None:
+        """Get the primary key.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return (await self.fetch_info()).primary_key
+
+    @staticmethod
+    async def create(
+        config: Config,
+        uid: str,
+        options: Optional[Mapping[str, Any]] = None,
+        *,
+        http: Optional[AsyncHttpRequests] = None,
+    ) -> TaskInfo:
+        """Create the index.
+
+        Parameters
+        ----------
+        uid:
+            UID of the index.
+        options:
+            Options passed during index creation (ex: { 'primaryKey': 'name' }).
+        http (optional):
+            Transport to reuse, a new one is created from the config if omitted.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        if options is None:
+            options = {}
+        payload = {**options, "uid": uid}
+        if http is None:
+            http = AsyncHttpRequests(config)
+        task = await http.post(config.paths.index, payload)
+
+        return TaskInfo(**task)
+
+    async def get_tasks(self, parameters: Optional[MutableMapping[str, Any]] = None) -> TaskResults:
+        """Get all tasks of a specific index from the last one.
+
+        Parameters
+        ----------
+        parameters (optional):
+            parameters accepted by the get tasks route: https://www.meilisearch.com/docs/reference/api/tasks#get-tasks.
+
+        Returns
+        -------
+        tasks:
+        TaskResults instance with attributes:
+            - from
+            - next
+            - limit
+            - results : list of Task instances containing all enqueued, processing, succeeded or failed tasks of the index
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        if parameters is not None:
+            parameters.setdefault("indexUids", []).append(self.uid)
+        else:
+            parameters = {"indexUids": [self.uid]}
+
+        return await self.task_handler.get_tasks(parameters=parameters)
+
+    async def get_task(self, uid: int) -> Task:
+        """Get one task through the route of a specific index.
+
+        Parameters
+        ----------
+        uid:
+            identifier of the task.
+
+        Returns
+        -------
+        task:
+            Task instance containing information about the processed asynchronous task of an index.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await self.task_handler.get_task(uid)
+
+    async def wait_for_task(
+        self,
+        uid: int,
+        timeout_in_ms: int = 5000,
+        interval_in_ms: int = 50,
+        *,
+        polling: Optional[PollingStrategy] = None,
+    ) -> Task:
+        """Wait until Meilisearch processes a task until it fails or succeeds.
+
+        Parameters
+        ----------
+        uid:
+            identifier of the task to wait for being processed.
+        timeout_in_ms (optional):
+            time the method should wait before raising a MeilisearchTimeoutError.
+        interval_in_ms (optional):
+            time interval the method should wait (sleep) between requests.
+        polling (optional):
+            PollingStrategy controlling the intervals between requests, overrides interval_in_ms.
+
+        Returns
+        -------
+        task:
+            Task instance containing information about the processed asynchronous task.
+
+        Raises
+        ------
+        MeilisearchTimeoutError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await self.task_handler.wait_for_task(
+            uid, timeout_in_ms, interval_in_ms, polling=polling
+        )
+
+    async def wait_for_tasks(
+        self,
+        uids: Sequence[int],
+        timeout_in_ms: int = 5000,
+        interval_in_ms: int = 50,
+        *,
+        stop_on_failure: bool = False,
+        polling: Optional[PollingStrategy] = None,
+    ) -> List[Task]:
+        """Wait until Meilisearch processes several tasks until they fail or succeed.
+
+        The pending tasks are polled together with one request per interval.
+
+        Parameters
+        ----------
+        uids:
+            identifiers of the tasks to wait for being processed.
+        timeout_in_ms (optional):
+            time the method should wait for all the tasks before raising a MeilisearchTimeoutError.
+        interval_in_ms (optional):
+            time interval the method should wait (sleep) between requests.
+        stop_on_failure (optional):
+            return as soon as one of the tasks failed, without waiting for the others.
+        polling (optional):
+            PollingStrategy controlling the intervals between requests, overrides interval_in_ms.
+
+        Returns
+        -------
+        tasks:
+            List of Task instances of the processed tasks, in the order of uids.
+
+        Raises
+        ------
+        MeilisearchTimeoutError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await self.task_handler.wait_for_tasks(
+            uids,
+            timeout_in_ms,
+            interval_in_ms,
+            stop_on_failure=stop_on_failure,
+            polling=polling,
+        )
+
+    async def get_stats(self) -> IndexStats:
+        """Get stats of the index.
+
+        Get information about the number of documents, field frequencies, ...
+        https://www.meilisearch.com/docs/reference/api/stats
+
+        Returns
+        -------
+        stats:
+            IndexStats instance containing information about the given index.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        stats = await self.http.get(
+            f"{self.config.paths.index}/{self.uid}/{self.config.paths.stat}"
+        )
+        return IndexStats(**stats)
+
+    @overload
+    async def search(
+        self,
+        query: str,
+        opt_params: Optional[Mapping[str, Any]] = None,
+        *,
+        raw: Literal[False] = False,
+    ) -> Dict[str, Any]: ...
+
+    @overload
+    async def search(
+        self, query: str, opt_params: Optional[Mapping[str, Any]] = None, *, raw: Literal[True]
+    ) -> bytes: ...
+
+    @version_error_hint_message
+    async def search(
+        self, query: str, opt_params: Optional[Mapping[str, Any]] = None, *, raw: bool = False
+    ) -> Union[Dict[str, Any], bytes]:
+        """Search in the index.
+
+        https://www.meilisearch.com/docs/reference/api/search
+
+        Parameters
+        ----------
+        query:
+            String containing the searched word(s)
+        opt_params (optional):
+            Dictionary containing optional query parameters.
+            Common parameters include:
+            - hybrid: Dict with 'semanticRatio' and 'embedder' fields for hybrid search
+            - vector: Array of numbers for vector search
+            - retrieveVectors: Boolean to include vector data in search results
+            - filter: Filter queries by an attribute's value
+            - limit: Maximum number of documents returned
+            - offset: Number of documents to skip
+        raw (optional):
+            Return the body of the response as bytes, without decoding it, for instance to
+            forward it untouched. Defaults to False.
+
+        Returns
+        -------
+        results:
+            Dictionary with hits, offset, limit, processingTime and initial query, or the
+            encoded response when raw is True
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        if opt_params is None:
+            opt_params = {}
+
+        body = {"q": query, **opt_params}
+
+        return await self.http.post(
+            f"{self.config.paths.index}/{self.uid}/{self.config.paths.search}",
+            body=body,
+            raw=raw,
+        )
+
+    @version_error_hint_message
+    async def facet_search(
+        self,
+        facet_name: str,
+        facet_query: Optional[str] = None,
+        opt_params: Optional[Mapping[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Perform a facet search based on the given facet query and facet name.
+
+        Parameters
+        ----------
+        facet_name:
+            String containing the name of the facet on which the search is performed.
+        facet_query (optional):
+            String containing the searched words
+        opt_params (optional):
+            Dictionary containing optional query parameters.
+
+        Returns
+        -------
+        results:
+            Dictionary with facetHits, processingTime and initial facet query
+
+        """
+        if opt_params is None:
+            opt_params = {}
+        body = {"facetName": facet_name, "facetQuery": facet_query, **opt_params}
+        return await self.http.post(
+            f"{self.config.paths.index}/{self.uid}/{self.config.paths.facet_search}",
+            body=body,
+        )
+
+    async def get_document(
+        self, document_id: Union[str, int], parameters: Optional[MutableMapping[str, Any]] = None
+    ) -> Document:
+        """Get one document with given document identifier.
+
+        Parameters
+        ----------
+        document_id:
+            Unique identifier of the document.
+        parameters (optional):
+            parameters accepted by the get document route: https://www.meilisearch.com/docs/reference/api/documents#get-one-document
+
+        Returns
+        -------
+        document:
+            Document instance containing the documents information.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        if parameters is None:
+            parameters = {}
+        elif "fields" in parameters and isinstance(parameters["fields"], (list, tuple)):
+            parameters["fields"] = ",".join(parameters["fields"])
+
+        document = await self.http.get(
+            f"{self.config.paths.index}/{self.uid}/{self.config.paths.document}/{document_id}?{parse.urlencode(parameters)}"
+        )
+        return Document(document)
+
+    @overload
+    async def get_documents(
+        self,
+        parameters: Optional[MutableMapping[str, Any]] = None,
+        *,
+        raw: Literal[False] = False,
+    ) -> DocumentsResults: ...
+
+    @overload
+    async def get_documents(
+        self, parameters: Optional[MutableMapping[str, Any]] = None, *, raw: Literal[True]
+    ) -> bytes: ...
+
+    @version_error_hint_message
+    async def get_documents(
+        self, parameters: Optional[MutableMapping[str, Any]] = None, *, raw: bool = False
+    ) -> Union[DocumentsResults, bytes]:
+        """Get a set of documents from the index.
+
+        Parameters
+        ----------
+        parameters (optional):
+            parameters accepted by the get documents route: https://www.meilisearch.com/docs/reference/api/documents#get-documents
+            Note: The filter parameter is only available in Meilisearch >= 1.2.0.
+        raw (optional):
+            Return the body of the response as bytes, without decoding it, for instance to
+            forward it untouched. Defaults to False.
+
+        Returns
+        -------
+        documents:
+        DocumentsResults instance with attributes:
+            - total
+            - offset
+            - limit
+            - results : list of Document instances containing the documents information
+            - sort:  A list of attributes written as an array or as a comma-separated string
+            The encoded response when raw is True.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        if parameters is None:
+            parameters = {}
+
+        # convert comma-separated sort string to list
+        sort = parameters.get("sort")
+        if isinstance(sort, str):
+            parameters["sort"] = [s.strip() for s in sort.split(",") if s.strip()]
+
+        response = await self.http.post(
+            f"{self.config.paths.index}/{self.uid}/{self.config.paths.document}/fetch",
+            body=parameters,
+            raw=raw,
+        )
+        return response if raw else DocumentsResults(response)
+
+    def iter_documents(
+        self,
+        filter: Optional[  # pylint: disable=redefined-builtin
+            Union[str, List[Union[str, List[str]]]]
+        ] = None,
+        fields: Optional[List[str]] = None,
+        page_size: int = 1000,
+        prefetch: int = 2,
+    ) -> AsyncIterator[Document]:
+        """Iterate over the documents of the index, page by page.
+
+        The first page gives the total number of documents. The next pages are then fetched in
+        the background, at most `prefetch` pages ahead of the one being consumed, and the
+        iteration stops once `total` documents were requested.
+
+        Parameters
+        ----------
+        filter (optional):
+            Filter selecting the documents. Only available in Meilisearch >= 1.2.0.
+        fields (optional):
+            Attributes returned for each document, all of them by default.
+        page_size (optional):
+            Number of documents fetched per request.
+        prefetch (optional):
+            Maximum number of pages fetched ahead of the caller.
+
+        Returns
+        -------
+        documents:
+            Async iterator yielding Document instances.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        if page_size < 1:
+            raise ValueError("page_size should be greater than or equal to 1")
+        if prefetch < 1:
+            raise ValueError("prefetch should be greater than or equal to 1")
+
+        parameters: Dict[str, Any] = {"limit": page_size}
+        if filter is not None:
+            parameters["filter"] = filter
+        if fields is not None:
+            parameters["fields"] = fields
+
+        return _iter_documents(
+            lambda offset: self.get_documents({**parameters, "offset": offset}), page_size, prefetch
+        )
+
+    async def export_documents(
+        self,
+        file: Union[str, os.PathLike, IO[bytes]],
+        *,
+        partitions: Optional[Sequence[Union[str, List[Union[str, List[str]]]]]] = None,
+        fields: Optional[List[str]] = None,
+        page_size: int = 1000,
+        workers: int = 4,
+        compression: Optional[str] = None,
+    ) -> int:
+        """Export the documents of the index to an NDJSON file.
+
+        The pages of documents are fetched by `workers` concurrent requests and streamed to the
+        file in order, so at most `workers` pages are held in memory. Without `partitions` the
+        pages are offset ranges of the whole index. Each partition is a filter paged through on its
+        own, for instance the ranges built by `meilisearch.export.range_filters`, which keeps the
+        offsets small on large indexes. The partitions should be disjoint and cover every document
+        to export. Documents written to the index during the export may be missed or duplicated.
+
+        Parameters
+        ----------
+        file:
+            Path of the file, or a file object opened in binary mode.
+        partitions (optional):
+            Filters splitting the documents into disjoint partitions. The attributes they use must
+            be filterable.
+        fields (optional):
+            Attributes exported for each document, all of them by default.
+        page_size (optional):
+            Number of documents fetched per request.
+        workers (optional):
+            Number of pages fetched concurrently. Above the `pool_size` of the client, the
+            requests wait for a free connection.
+        compression (optional):
+            Compress the file with "gzip" or "deflate". Defaults to None, uncompressed.
+
+        Returns
+        -------
+        documents:
+            Number of documents written.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        if page_size < 1:
+            raise ValueError("page_size should be greater than or equal to 1")
+        if workers < 1:
+            raise ValueError("workers should be greater than or equal to 1")
+
+        path = f"{self.config.paths.index}/{self.uid}/{self.config.paths.document}/fetch"
+
+        async def fetch(partition: Any, offset: int, limit: int) -> Dict[str, Any]:
+            body: Dict[str, Any] = {"offset": offset, "limit": limit}
+            if partition is not None:
+                body["filter"] = partition
+            if fields is not None:
+                body["fields"] = fields
+            return await self.http.post(path, body=body)
+
+        filters = list(partitions) if partitions is not None else [None]
+        # A page of 0 documents only returns the size of the partition.
+        counts = (partial(fetch, partition, 0, 0) for partition in filters)
+        totals = [count["total"] async for count in _in_order(_aiter(counts), workers)]
+        pages = (
+            partial(fetch, partition, offset, page_size)
+            for partition, total in zip(filters, totals)
+            for offset in range(0, total, page_size)
+        )
+        # The file is opened, written and closed on a thread to keep the event loop free.
+        writer = await asyncio.to_thread(
+            NdjsonWriter, file, compression, codec=self.config.transport.json_codec
+        )
+        try:
+            await _write_pages(pages, workers, writer)
+        finally:
+            await asyncio.to_thread(writer.close)
+        return writer.documents
+
+    async def get_similar_documents(self, parameters: Mapping[str, Any]) -> Dict[str, Any]:
+        """Get the documents similar to a document.
+
+        Parameters
+        ----------
+        parameters:
+            parameters accepted by the get similar documents route: https://www.meilisearch.com/docs/reference/api/similar#body
+            "id" and "embedder" are required.
+
+        Returns
+        -------
+        results:
+            Dictionary with hits, offset, limit, processingTimeMs, and id
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await self.http.post(
+            f"{self.config.paths.index}/{self.uid}/{self.config.paths.similar}",
+            body=parameters,
+        )
+
+    async def add_documents(
+        self,
+        documents: Sequence[Mapping[str, Any]],
+        primary_key: Optional[str] = None,
+        *,
+        serializer: Optional[Type[JSONEncoder]] = None,
+    ) -> TaskInfo:
+        """Add documents to the index.
+
+        Parameters
+        ----------
+        documents:
+            List of documents. Each document should be a dictionary.
+        primary_key (optional):
+            The primary-key used in index. Ignored if already set up.
+        serializer (optional):
+            A custom JSONEncode to handle serializing fields that the build in json.dumps
+            cannot handle, for example UUID and datetime.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        url = self._build_url(primary_key)
+        add_document_task = await self.http.post(url, documents, serializer=serializer)
+        return TaskInfo(**add_document_task)
+
+    async def add_documents_in_batches(
+        self,
+        documents: Union[Iterable[Mapping[str, Any]], AsyncIterable[Mapping[str, Any]]],
+        batch_size: int = 1000,
+        primary_key: Optional[str] = None,
+        *,
+        serializer: Optional[Type[JSONEncoder]] = None,
+        concurrency: int = 1,
+        max_payload_size: Optional[int] = None,
+    ) -> List[TaskInfo]:
+        """Add documents to the index in batches.
+
+        Parameters
+        ----------
+        documents:
+            List, iterable, generator or async iterable of documents. Each document should be a dictionary.
+            The documents are consumed lazily, one batch at a time, so a generator or a database
+            cursor can be uploaded without loading the whole dataset in memory.
+        batch_size (optional):
+            The number of documents that should be included in each batch. Default = 1000
+        primary_key (optional):
+            The primary-key used in index. Ignored if already set up.
+        serializer (optional):
+            A custom JSONEncode to handle serializing fields that the build in json.dumps
+            cannot handle, for example UUID and datetime.
+        concurrency (optional):
+            The number of batches uploaded at the same time. Default = 1, the batches are sent one
+            after another. Keep it below the pool_size of the client to reuse the connections.
+            With more than one batch in flight Meilisearch may enqueue them out of order, the
+            returned list still follows the order of the batches.
+        max_payload_size (optional):
+            The maximum size in bytes of the JSON payload of a batch. When set, the batches are cut
+            as soon as the next document would not fit anymore, batch_size still caps the number of
+            documents in a batch. Each document is serialized only once. A document larger than
+            max_payload_size is sent alone. Default = None, the batches are built from batch_size.
+
+        Returns
+        -------
+        tasks_info:
+            List of TaskInfo instances containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request.
+            Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+
+        if max_payload_size is not None:
+
+            async def send_payload(payload: bytes) -> TaskInfo:
+                return await self.add_documents_json(payload, primary_key)
+
+            payloads = self._batch_payloads(
+                documents,
+                batch_size,
+                max_payload_size,
+                serializer,
+                self.config.transport.json_codec,
+            )
+            return await _send_batches(send_payload, payloads, concurrency)
+
+        async def send(document_batch: Sequence[Mapping[str, Any]]) -> TaskInfo:
+            return await self.add_documents(document_batch, primary_key, serializer=serializer)
+
+        return await _send_batches(send, self._batch(documents, batch_size), concurrency)
+
+    async def add_documents_json(
+        self,
+        str_documents: bytes,
+        primary_key: Optional[str] = None,
+        *,
+        serializer: Optional[Type[JSONEncoder]] = None,
+    ) -> TaskInfo:
+        """Add documents to the index from a byte-encoded JSON string.
+
+        Parameters
+        ----------
+        str_documents:
+            Byte-encoded JSON string.
+        primary_key (optional):
+            The primary-key used in index. Ignored if already set up.
+        serializer (optional):
+            A custom JSONEncode to handle serializing fields that the build in json.dumps
+            cannot handle, for example UUID and datetime.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await self.add_documents_raw(
+            str_documents, primary_key, "application/json", serializer=serializer
+        )
+
+    async def add_documents_csv(
+        self,
+        str_documents: bytes,
+        primary_key: Optional[str] = None,
+        csv_delimiter: Optional[str] = None,
+    ) -> TaskInfo:
+        """Add documents to the index from a byte-encoded CSV string.
+
+        Parameters
+        ----------
+        str_documents:
+            Byte-encoded CSV string.
+        primary_key (optional):
+            The primary-key used in index. Ignored if already set up.
+        csv_delimiter:
+            One ASCII character used to customize the delimiter for CSV. Comma used by default.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await self.add_documents_raw(str_documents, primary_key, "text/csv", csv_delimiter)
+
+    async def add_documents_ndjson(
+        self,
+        str_documents: bytes,
+        primary_key: Optional[str] = None,
+    ) -> TaskInfo:
+        """Add documents to the index from a byte-encoded NDJSON string.
+
+        Parameters
+        ----------
+        str_documents:
+            Byte-encoded NDJSON string.
+        primary_key (optional):
+            The primary-key used in index. Ignored if already set up.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await self.add_documents_raw(str_documents, primary_key, "application/x-ndjson")
+
+    async def add_documents_raw(
+        self,
+        str_documents: bytes,
+        primary_key: Optional[str] = None,
+        content_type: Optional[str] = None,
+        csv_delimiter: Optional[str] = None,
+        *,
+        serializer: Optional[Type[JSONEncoder]] = None,
+    ) -> TaskInfo:
+        """Add documents to the index from a byte-encoded string.
+
+        Parameters
+        ----------
+        str_documents:
+            Byte-encoded string.
+        content_type:
+            The content MIME type: 'application/json', 'application/x-dnjson', or 'text/csv'.
+        primary_key (optional):
+            The primary-key used in index. Ignored if already set up.
+        csv_delimiter (optional):
+            One ASCII character used to customize the delimiter for CSV.
+            Note: The csv delimiter can only be used with the Content-Type text/csv.
+        serializer (optional):
+            A custom JSONEncode to handle serializing fields that the build in json.dumps
+            cannot handle, for example UUID and datetime.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        url = self._build_url(primary_key=primary_key, csv_delimiter=csv_delimiter)
+        response = await self.http.post(url, str_documents, content_type, serializer=serializer)
+        return TaskInfo(**response)
+
+    async def add_documents_file(
+        self,
+        file: Union[str, os.PathLike, IO[bytes]],
+        content_type: str = "application/x-ndjson",
+        primary_key: Optional[str] = None,
+        csv_delimiter: Optional[str] = None,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> TaskInfo:
+        """Add documents to the index from a JSON, NDJSON or CSV file.
+
+        The file is streamed with chunked transfer encoding, it is never fully loaded in memory.
+
+        Parameters
+        ----------
+        file:
+            Path of the file, or a file object opened in binary mode.
+        content_type (optional):
+            The content MIME type: 'application/json', 'application/x-ndjson', or 'text/csv'.
+            Default = 'application/x-ndjson'
+        primary_key (optional):
+            The primary-key used in index. Ignored if already set up.
+        csv_delimiter (optional):
+            One ASCII character used to customize the delimiter for CSV.
+            Note: The csv delimiter can only be used with the Content-Type text/csv.
+        chunk_size (optional):
+            The number of bytes read from the file and sent at once. Default = 65536
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        url = self._build_url(primary_key=primary_key, csv_delimiter=csv_delimiter)
+        with open_binary(file) as stream:
+            response = await self.http.post(
+                url, iterate_in_thread(read_chunks(stream, chunk_size)), content_type
+            )
+        return TaskInfo(**response)
+
+    async def add_documents_file_in_batches(
+        self,
+        file: Union[str, os.PathLike, IO[bytes]],
+        batch_size: int = 1000,
+        content_type: str = "application/x-ndjson",
+        primary_key: Optional[str] = None,
+        csv_delimiter: Optional[str] = None,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> List[TaskInfo]:
+        """Add documents to the index from an NDJSON or CSV file, in batches.
+
+        The file is split on line, or row, boundaries and every batch is streamed with chunked
+        transfer encoding as its own task, so memory stays flat whatever the size of the file.
+
+        Parameters
+        ----------
+        file:
+            Path of the file, or a file object opened in binary mode.
+        batch_size (optional):
+            The number of lines, or CSV rows, that should be included in each batch. The CSV
+            header is repeated in every batch. Default = 1000
+        content_type (optional):
+            The content MIME type: 'application/x-ndjson' or 'text/csv'.
+            Default = 'application/x-ndjson'
+        primary_key (optional):
+            The primary-key used in index. Ignored if already set up.
+        csv_delimiter (optional):
+            One ASCII character used to customize the delimiter for CSV.
+            Note: The csv delimiter can only be used with the Content-Type text/csv.
+        chunk_size (optional):
+            The number of bytes read from the file and sent at once. Default = 65536
+
+        Returns
+        -------
+        tasks_info:
+            List of TaskInfo instances containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        url = self._build_url(primary_key=primary_key, csv_delimiter=csv_delimiter)
+        tasks = []
+        with open_binary(file) as stream:
+            batches = self._split_file(stream, batch_size, content_type, chunk_size)
+            async for batch in iterate_in_thread(batches):
+                response = await self.http.post(url, iterate_in_thread(batch), content_type)
+                tasks.append(TaskInfo(**response))
+        return tasks
+
+    async def update_documents(
+        self,
+        documents: Sequence[Mapping[str, Any]],
+        primary_key: Optional[str] = None,
+        *,
+        serializer: Optional[Type[JSONEncoder]] = None,
+    ) -> TaskInfo:
+        """Update documents in the index.
+
+        Parameters
+        ----------
+        documents:
+            List of documents. Each document should be a dictionary.
+        primary_key (optional):
+            The primary-key used in index. Ignored if already set up
+        serializer (optional):
+            A custom JSONEncode to handle serializing fields that the build in json.dumps
+            cannot handle, for example UUID and datetime.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        url = self._build_url(primary_key)
+        response = await self.http.put(url, documents, serializer=serializer)
+        return TaskInfo(**response)
+
+    async def update_documents_ndjson(
+        self,
+        str_documents: str,
+        primary_key: Optional[str] = None,
+    ) -> TaskInfo:
+        """Update documents as a ndjson string in the index.
+
+        Parameters
+        ----------
+        str_documents:
+            String of document from a NDJSON file.
+        primary_key (optional):
+            The primary-key used in index. Ignored if already set up
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await self.update_documents_raw(str_documents, primary_key, "application/x-ndjson")
+
+    async def update_documents_json(
+        self,
+        str_documents: Union[str, bytes],
+        primary_key: Optional[str] = None,
+        *,
+        serializer: Optional[Type[JSONEncoder]] = None,
+    ) -> TaskInfo:
+        """Update documents as a json string in the index.
+
+        Parameters
+        ----------
+        str_documents:
+            String of document from a JSON file.
+        primary_key (optional):
+            The primary-key used in index. Ignored if already set up
+        serializer (optional):
+            A custom JSONEncode to handle serializing fields that the build in json.dumps
+            cannot handle, for example UUID and datetime.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await self.update_documents_raw(
+            str_documents, primary_key, "application/json", serializer=serializer
+        )
+
+    async def update_documents_csv(
+        self,
+        str_documents: str,
+        primary_key: Optional[str] = None,
+        csv_delimiter: Optional[str] = None,
+    ) -> TaskInfo:
+        """Update documents as a csv string in the index.
+
+        Parameters
+        ----------
+        str_documents:
+            String of document from a CSV file.
+        primary_key (optional):
+            The primary-key used in index. Ignored if already set up.
+        csv_delimiter:
+            One ASCII character used to customize the delimiter for CSV. Comma used by default.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await self.update_documents_raw(
+            str_documents, primary_key, "text/csv", csv_delimiter
+        )
+
+    async def update_documents_raw(
+        self,
+        str_documents: Union[str, bytes],
+        primary_key: Optional[str] = None,
+        content_type: Optional[str] = None,
+        csv_delimiter: Optional[str] = None,
+        *,
+        serializer: Optional[Type[JSONEncoder]] = None,
+    ) -> TaskInfo:
+        """Update documents as a string in the index.
+
+        Parameters
+        ----------
+        str_documents:
+            String of document.
+        primary_key (optional):
+            The primary-key used in index. Ignored if already set up.
+        type:
+            The type of document. Type available: 'csv', 'json', 'jsonl'
+        csv_delimiter:
+            One ASCII character used to customize the delimiter for CSV.
+            Note: The csv delimiter can only be used with the Content-Type text/csv.
+        serializer (optional):
+            A custom JSONEncode to handle serializing fields that the build in json.dumps
+            cannot handle, for example UUID and datetime.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        url = self._build_url(primary_key=primary_key, csv_delimiter=csv_delimiter)
+        response = await self.http.put(url, str_documents, content_type, serializer=serializer)
+        return TaskInfo(**response)
+
+    async def update_documents_file(
+        self,
+        file: Union[str, os.PathLike, IO[bytes]],
+        content_type: str = "application/x-ndjson",
+        primary_key: Optional[str] = None,
+        csv_delimiter: Optional[str] = None,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> TaskInfo:
+        """Update documents in the index from a JSON, NDJSON or CSV file.
+
+        The file is streamed with chunked transfer encoding, it is never fully loaded in memory.
+
+        Parameters
+        ----------
+        file:
+            Path of the file, or a file object opened in binary mode.
+        content_type (optional):
+            The content MIME type: 'application/json', 'application/x-ndjson', or 'text/csv'.
+            Default = 'application/x-ndjson'
+        primary_key (optional):
+            The primary-key used in index. Ignored if already set up.
+        csv_delimiter (optional):
+            One ASCII character used to customize the delimiter for CSV.
+            Note: The csv delimiter can only be used with the Content-Type text/csv.
+        chunk_size (optional):
+            The number of bytes read from the file and sent at once. Default = 65536
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        url = self._build_url(primary_key=primary_key, csv_delimiter=csv_delimiter)
+        with open_binary(file) as stream:
+            response = await self.http.put(
+                url, iterate_in_thread(read_chunks(stream, chunk_size)), content_type
+            )
+        return TaskInfo(**response)
+
+    async def update_documents_file_in_batches(
+        self,
+        file: Union[str, os.PathLike, IO[bytes]],
+        batch_size: int = 1000,
+        content_type: str = "application/x-ndjson",
+        primary_key: Optional[str] = None,
+        csv_delimiter: Optional[str] = None,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> List[TaskInfo]:
+        """Update documents in the index from an NDJSON or CSV file, in batches.
+
+        The file is split on line, or row, boundaries and every batch is streamed with chunked
+        transfer encoding as its own task, so memory stays flat whatever the size of the file.
+
+        Parameters
+        ----------
+        file:
+            Path of the file, or a file object opened in binary mode.
+        batch_size (optional):
+            The number of lines, or CSV rows, that should be included in each batch. The CSV
+            header is repeated in every batch. Default = 1000
+        content_type (optional):
+            The content MIME type: 'application/x-ndjson' or 'text/csv'.
+            Default = 'application/x-ndjson'
+        primary_key (optional):
+            The primary-key used in index. Ignored if already set up.
+        csv_delimiter (optional):
+            One ASCII character used to customize the delimiter for CSV.
+            Note: The csv delimiter can only be used with the Content-Type text/csv.
+        chunk_size (optional):
+            The number of bytes read from the file and sent at once. Default = 65536
+
+        Returns
+        -------
+        tasks_info:
+            List of TaskInfo instances containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        url = self._build_url(primary_key=primary_key, csv_delimiter=csv_delimiter)
+        tasks = []
+        with open_binary(file) as stream:
+            batches = self._split_file(stream, batch_size, content_type, chunk_size)
+            async for batch in iterate_in_thread(batches):
+                response = await self.http.put(url, iterate_in_thread(batch), content_type)
+                tasks.append(TaskInfo(**response))
+        return tasks
+
+    async def update_documents_in_batches(
+        self,
+        documents: Union[Iterable[Mapping[str, Any]], AsyncIterable[Mapping[str, Any]]],
+        batch_size: int = 1000,
+        primary_key: Optional[str] = None,
+        serializer: Optional[Type[JSONEncoder]] = None,
+        *,
+        concurrency: int = 1,
+        max_payload_size: Optional[int] = None,
+    ) -> List[TaskInfo]:
+        """Update documents to the index in batches.
+
+        Parameters
+        ----------
+        documents:
+            List, iterable, generator or async iterable of documents. Each document should be a dictionary.
+            The documents are consumed lazily, one batch at a time, so a generator or a database
+            cursor can be uploaded without loading the whole dataset in memory.
+        batch_size (optional):
+            The number of documents that should be included in each batch. Default = 1000
+        primary_key (optional):
+            The primary-key used in index. Ignored if already set up.
+        serializer (optional):
+            A custom JSONEncode to handle serializing fields that the build in json.dumps
+            cannot handle, for example UUID and datetime.
+        concurrency (optional):
+            The number of batches uploaded at the same time. Default = 1, the batches are sent one
+            after another. Keep it below the pool_size of the client to reuse the connections.
+            With more than one batch in flight Meilisearch may enqueue them out of order, the
+            returned list still follows the order of the batches.
+        max_payload_size (optional):
+            The maximum size in bytes of the JSON payload of a batch. When set, the batches are cut
+            as soon as the next document would not fit anymore, batch_size still caps the number of
+            documents in a batch. Each document is serialized only once. A document larger than
+            max_payload_size is sent alone. Default = None, the batches are built from batch_size.
+
+        Returns
+        -------
+        tasks_info:
+            List of TaskInfo instances containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request.
+            Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+
+        if max_payload_size is not None:
+
+            async def send_payload(payload: bytes) -> TaskInfo:
+                return await self.update_documents_json(payload, primary_key)
+
+            payloads = self._batch_payloads(
+                documents,
+                batch_size,
+                max_payload_size,
+                serializer,
+                self.config.transport.json_codec,
+            )
+            return await _send_batches(send_payload, payloads, concurrency)
+
+        async def send(document_batch: Sequence[Mapping[str, Any]]) -> TaskInfo:
+            return await self.update_documents(document_batch, primary_key, serializer=serializer)
+
+        return await _send_batches(send, self._batch(documents, batch_size), concurrency)
+
+    async def delete_document(self, document_id: Union[str, int]) -> TaskInfo:
+        """Delete one document from the index.
+
+        Parameters
+        ----------
+        document_id:
+            Unique identifier of the document.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        response = await self.http.delete(
+            f"{self.config.paths.index}/{self.uid}/{self.config.paths.document}/{document_id}"
+        )
+        return TaskInfo(**response)
+
+    @version_error_hint_message
+    async def delete_documents(
+        self,
+        ids: Optional[List[Union[str, int]]] = None,
+        *,
+        filter: Optional[  # pylint: disable=redefined-builtin
+            Union[str, List[Union[str, List[str]]]]
+        ] = None,
+    ) -> TaskInfo:
+        """Delete multiple documents from the index by id or filter.
+
+        Parameters
+        ----------
+        ids:
+            List of unique identifiers of documents. Note: using ids is depreciated and will be
+            removed in a future version.
+        filter:
+            The filter value information.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        if ids:
+            warn(
+                "The use of ids is depreciated and will be removed in the future",
+                DeprecationWarning,
+            )
+            response = await self.http.post(
+                f"{self.config.paths.index}/{self.uid}/{self.config.paths.document}/delete-batch",
+                [str(i) for i in ids],
+            )
+        else:
+            response = await self.http.post(
+                f"{self.config.paths.index}/{self.uid}/{self.config.paths.document}/delete",
+                body={"filter": filter},
+            )
+        return TaskInfo(**response)
+
+    async def delete_all_documents(self) -> TaskInfo:
+        """Delete all documents from the index.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        response = await self.http.delete(
+            f"{self.config.paths.index}/{self.uid}/{self.config.paths.document}"
+        )
+        return TaskInfo(**response)
+
+    # GENERAL SETTINGS ROUTES
+
+    async def get_settings(self) -> Dict[str, Any]:
+        """Get settings of the index.
+
+        https://www.meilisearch.com/docs/reference/api/settings
+
+        Returns
+        -------
+        settings
+            Dictionary containing the settings of the index.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        settings = await self.http.get(
+            f"{self.config.paths.index}/{self.uid}/{self.config.paths.setting}"
+        )
+
+        if settings.get("embedders"):
+            embedders: dict[str, EmbedderType] = {}
+            for k, v in settings["embedders"].items():
+                if v.get("source") == "openAi":
+                    embedders[k] = OpenAiEmbedder(**v)
+                elif v.get("source") == "ollama":
+                    embedders[k] = OllamaEmbedder(**v)
+                elif v.get("source") == "huggingFace":
+                    embedders[k] = HuggingFaceEmbedder(**v)
+                elif v.get("source") == "rest":
+                    embedders[k] = RestEmbedder(**v)
+                elif v.get("source") == "composite":
+                    embedders[k] = CompositeEmbedder(**v)
+                else:
+                    embedders[k] = UserProvidedEmbedder(**v)
+
+            settings["embedders"] = embedders
+
+        return settings
+
+    async def update_settings(self, body: MutableMapping[str, Any]) -> TaskInfo:
+        """Update settings of the index.
+
+        https://www.meilisearch.com/docs/reference/api/settings#update-settings
+
+        Parameters
+        ----------
+        body:
+            Dictionary containing the settings of the index.
+            Supported settings include:
+            - 'rankingRules': List of ranking rules
+            - 'distinctAttribute': Attribute for deduplication
+            - 'searchableAttributes': Attributes that can be searched
+            - 'displayedAttributes': Attributes to display in search results
+            - 'stopWords': Words ignored in search queries
+            - 'synonyms': Dictionary of synonyms
+            - 'filterableAttributes': Attributes that can be used for filtering
+            - 'sortableAttributes': Attributes that can be used for sorting
+            - 'typoTolerance': Settings for typo tolerance
+            - 'pagination': Settings for pagination
+            - 'faceting': Settings for faceting
+            - 'dictionary': List of custom dictionary words
+            - 'separatorTokens': List of separator tokens
+            - 'nonSeparatorTokens': List of non-separator tokens
+            - 'embedders': Dictionary of embedder configurations for AI-powered search
+            - 'searchCutoffMs': Maximum search time in milliseconds
+            - 'proximityPrecision': Precision for proximity ranking
+            - 'localizedAttributes': Settings for localized attributes
+
+            More information:
+            https://www.meilisearch.com/docs/reference/api/settings#update-settings
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request.
+            Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        if body.get("embedders"):
+            for _, v in body["embedders"].items():
+                if "documentTemplateMaxBytes" in v and v["documentTemplateMaxBytes"] is None:
+                    del v["documentTemplateMaxBytes"]
+
+        task = await self.http.patch(
+            f"{self.config.paths.index}/{self.uid}/{self.config.paths.setting}", body
+        )
+
+        return TaskInfo(**task)
+
+    async def reset_settings(self) -> TaskInfo:
+        """Reset settings of the index to default values.
+
+        https://www.meilisearch.com/docs/reference/api/settings#reset-settings
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.delete(
+            f"{self.config.paths.index}/{self.uid}/{self.config.paths.setting}"
+        )
+
+        return TaskInfo(**task)
+
+    # RANKING RULES SUB-ROUTES
+
+    async def get_ranking_rules(self) -> List[str]:
+        """Get ranking rules of the index.
+
+        Returns
+        -------
+        settings: list
+            List containing the ranking rules of the index.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await self.http.get(self.__settings_url_for(self.config.paths.ranking_rules))
+
+    async def update_ranking_rules(self, body: Union[List[str], None]) -> TaskInfo:
+        """Update ranking rules of the index.
+
+        Parameters
+        ----------
+        body:
+            List containing the ranking rules.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.put(self.__settings_url_for(self.config.paths.ranking_rules), body)
+
+        return TaskInfo(**task)
+
+    async def reset_ranking_rules(self) -> TaskInfo:
+        """Reset ranking rules of the index to default values.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.delete(
+            self.__settings_url_for(self.config.paths.ranking_rules),
+        )
+
+        return TaskInfo(**task)
+
+    # DISTINCT ATTRIBUTE SUB-ROUTES
+
+    async def get_distinct_attribute(self) -> Optional[str]:
+        """Get distinct attribute of the index.
+
+        Returns
+        -------
+        settings:
+            String containing the distinct attribute of the index. If no distinct attribute None is returned.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await self.http.get(self.__settings_url_for(self.config.paths.distinct_attribute))
+
+    async def update_distinct_attribute(self, body: str) -> TaskInfo:
+        """Update distinct attribute of the index.
+
+        Parameters
+        ----------
+        body:
+            String containing the distinct attribute.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.put(
+            self.__settings_url_for(self.config.paths.distinct_attribute), body
+        )
+
+        return TaskInfo(**task)
+
+    async def reset_distinct_attribute(self) -> TaskInfo:
+        """Reset distinct attribute of the index to default values.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.delete(
+            self.__settings_url_for(self.config.paths.distinct_attribute),
+        )
+
+        return TaskInfo(**task)
+
+    # SEARCHABLE ATTRIBUTES SUB-ROUTES
+
+    async def get_searchable_attributes(self) -> List[str]:
+        """Get searchable attributes of the index.
+
+        Returns
+        -------
+        settings:
+            List containing the searchable attributes of the index.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await self.http.get(self.__settings_url_for(self.config.paths.searchable_attributes))
+
+    async def update_searchable_attributes(self, body: Union[List[str], None]) -> TaskInfo:
+        """Update searchable attributes of the index.
+
+        Parameters
+        ----------
+        body:
+            List containing the searchable attributes.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.put(
+            self.__settings_url_for(self.config.paths.searchable_attributes), body
+        )
+
+        return TaskInfo(**task)
+
+    async def reset_searchable_attributes(self) -> TaskInfo:
+        """Reset searchable attributes of the index to default values.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.delete(
+            self.__settings_url_for(self.config.paths.searchable_attributes),
+        )
+
+        return TaskInfo(**task)
+
+    # DISPLAYED ATTRIBUTES SUB-ROUTES
+
+    async def get_displayed_attributes(self) -> List[str]:
+        """Get displayed attributes of the index.
+
+        Returns
+        -------
+        settings:
+            List containing the displayed attributes of the index.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await self.http.get(self.__settings_url_for(self.config.paths.displayed_attributes))
+
+    async def update_displayed_attributes(self, body: Union[List[str], None]) -> TaskInfo:
+        """Update displayed attributes of the index.
+
+        Parameters
+        ----------
+        body:
+            List containing the displayed attributes.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.put(
+            self.__settings_url_for(self.config.paths.displayed_attributes), body
+        )
+
+        return TaskInfo(**task)
+
+    async def reset_displayed_attributes(self) -> TaskInfo:
+        """Reset displayed attributes of the index to default values.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.delete(
+            self.__settings_url_for(self.config.paths.displayed_attributes),
+        )
+
+        return TaskInfo(**task)
+
+    # STOP WORDS SUB-ROUTES
+
+    async def get_stop_words(self) -> List[str]:
+        """Get stop words of the index.
+
+        Returns
+        -------
+        settings:
+            List containing the stop words of the index.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await self.http.get(self.__settings_url_for(self.config.paths.stop_words))
+
+    async def update_stop_words(self, body: Union[List[str], None]) -> TaskInfo:
+        """Update stop words of the index.
+
+        Parameters
+        ----------
+        body: list
+            List containing the stop words.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.put(self.__settings_url_for(self.config.paths.stop_words), body)
+
+        return TaskInfo(**task)
+
+    async def reset_stop_words(self) -> TaskInfo:
+        """Reset stop words of the index to default values.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.delete(
+            self.__settings_url_for(self.config.paths.stop_words),
+        )
+
+        return TaskInfo(**task)
+
+    # SYNONYMS SUB-ROUTES
+
+    async def get_synonyms(self) -> Dict[str, List[str]]:
+        """Get synonyms of the index.
+
+        Returns
+        -------
+        settings: dict
+            Dictionary containing the synonyms of the index.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await self.http.get(self.__settings_url_for(self.config.paths.synonyms))
+
+    async def update_synonyms(self, body: Union[Dict[str, List[str]], None]) -> TaskInfo:
+        """Update synonyms of the index.
+
+        Parameters
+        ----------
+        body: dict
+            Dictionary containing the synonyms.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.put(self.__settings_url_for(self.config.paths.synonyms), body)
+
+        return TaskInfo(**task)
+
+    async def reset_synonyms(self) -> TaskInfo:
+        """Reset synonyms of the index to default values.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.delete(
+            self.__settings_url_for(self.config.paths.synonyms),
+        )
+
+        return TaskInfo(**task)
+
+    # FILTERABLE ATTRIBUTES SUB-ROUTES
+
+    async def get_filterable_attributes(self) -> List[str]:
+        """Get filterable attributes of the index.
+
+        Returns
+        -------
+        settings:
+            List containing the filterable attributes of the index
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await self.http.get(self.__settings_url_for(self.config.paths.filterable_attributes))
+
+    async def update_filterable_attributes(self, body: Union[List[str], None]) -> TaskInfo:
+        """Update filterable attributes of the index.
+
+        Parameters
+        ----------
+        body:
+            List containing the filterable attributes.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.put(
+            self.__settings_url_for(self.config.paths.filterable_attributes), body
+        )
+
+        return TaskInfo(**task)
+
+    async def reset_filterable_attributes(self) -> TaskInfo:
+        """Reset filterable attributes of the index to default values.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.delete(
+            self.__settings_url_for(self.config.paths.filterable_attributes),
+        )
+
+        return TaskInfo(**task)
+
+    # SORTABLE ATTRIBUTES SUB-ROUTES
+
+    async def get_sortable_attributes(self) -> List[str]:
+        """Get sortable attributes of the index.
+
+        Returns
+        -------
+        settings:
+            List containing the sortable attributes of the index
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await self.http.get(self.__settings_url_for(self.config.paths.sortable_attributes))
+
+    async def update_sortable_attributes(self, body: Union[List[str], None]) -> TaskInfo:
+        """Update sortable attributes of the index.
+
+        Parameters
+        ----------
+        body:
+            List containing the sortable attributes.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.put(
+            self.__settings_url_for(self.config.paths.sortable_attributes), body
+        )
+
+        return TaskInfo(**task)
+
+    async def reset_sortable_attributes(self) -> TaskInfo:
+        """Reset sortable attributes of the index to default values.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.delete(
+            self.__settings_url_for(self.config.paths.sortable_attributes),
+        )
+
+        return TaskInfo(**task)
+
+    # TYPO TOLERANCE SUB-ROUTES
+
+    async def get_typo_tolerance(self) -> TypoTolerance:
+        """Get typo tolerance of the index.
+
+        Returns
+        -------
+        settings:
+            The typo tolerance settings of the index.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        typo_tolerance = await self.http.get(
+            self.__settings_url_for(self.config.paths.typo_tolerance)
+        )
+
+        return TypoTolerance(**typo_tolerance)
+
+    async def update_typo_tolerance(self, body: Union[Mapping[str, Any], None]) -> TaskInfo:
+        """Update typo tolerance of the index.
+
+        Parameters
+        ----------
+        body: dict
+            Dictionary containing the typo tolerance.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.patch(
+            self.__settings_url_for(self.config.paths.typo_tolerance), body
+        )
+
+        return TaskInfo(**task)
+
+    async def reset_typo_tolerance(self) -> TaskInfo:
+        """Reset typo tolerance of the index to default values.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.delete(
+            self.__settings_url_for(self.config.paths.typo_tolerance),
+        )
+
+        return TaskInfo(**task)
+
+    async def get_pagination_settings(self) -> Pagination:
+        """Get pagination settngs of the index.
+
+        Returns
+        -------
+        settings:
+            The pagination settings of the index.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        pagination = await self.http.get(self.__settings_url_for(self.config.paths.pagination))
+
+        return Pagination(**pagination)
+
+    async def update_pagination_settings(self, body: Union[Dict[str, Any], None]) -> TaskInfo:
+        """Update the pagination settings of the index.
+
+        Parameters
+        ----------
+        body: dict
+            Dictionary containing the pagination settings.
+            https://www.meilisearch.com/docs/reference/api/settings#update-pagination-settings
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.patch(
+            path=self.__settings_url_for(self.config.paths.pagination), body=body
+        )
+
+        return TaskInfo(**task)
+
+    async def reset_pagination_settings(self) -> TaskInfo:
+        """Reset pagination settings of the index to default values.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.delete(self.__settings_url_for(self.config.paths.pagination))
+
+        return TaskInfo(**task)
+
+    async def get_facet_search_settings(self) -> bool:
+        """Get the facet search settings of an index.
+
+        Returns
+        -------
+        bool:
+            True if facet search is enabled, False if disabled.
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+
+        return await self.http.get(self.__settings_url_for(self.config.paths.facet_search))
+
+    async def update_facet_search_settings(self, body: Union[bool, None]) -> TaskInfo:
+        """Update the facet search settings of the index.
+
+        Parameters
+        ----------
+        body: bool
+            True to enable facet search, False to disable it.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.put(
+            self.__settings_url_for(self.config.paths.facet_search), body=body
+        )
+
+        return TaskInfo(**task)
+
+    async def reset_facet_search_settings(self) -> TaskInfo:
+        """Reset facet search settings of the index to default values.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks
+        """
+        task = await self.http.delete(self.__settings_url_for(self.config.paths.facet_search))
+
+        return TaskInfo(**task)
+
+    async def get_faceting_settings(self) -> Faceting:
+        """Get the faceting settings of an index.
+
+        Returns
+        -------
+        settings:
+            The faceting settings of the index.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        faceting = await self.http.get(self.__settings_url_for(self.config.paths.faceting))
+
+        return Faceting(**faceting)
+
+    async def update_faceting_settings(self, body: Union[Mapping[str, Any], None]) -> TaskInfo:
+        """Update the faceting settings of the index.
+
+        Parameters
+        ----------
+        body: dict
+            Dictionary containing the faceting settings.
+            https://www.meilisearch.com/docs/reference/api/settings#update-pagination-settings
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.patch(
+            path=self.__settings_url_for(self.config.paths.faceting), body=body
+        )
+
+        return TaskInfo(**task)
+
+    async def reset_faceting_settings(self) -> TaskInfo:
+        """Reset faceting settings of the index to default values.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.delete(self.__settings_url_for(self.config.paths.faceting))
+
+        return TaskInfo(**task)
+
+    # USER DICTIONARY SUB-ROUTES
+
+    async def get_dictionary(self) -> List[str]:
+        """Get the dictionary entries of the index.
+
+        Returns
+        -------
+        settings:
+            List containing the dictionary entries of the index.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await self.http.get(self.__settings_url_for(self.config.paths.dictionary))
+
+    async def update_dictionary(self, body: Union[List[str], None]) -> TaskInfo:
+        """Update the dictionary of the index.
+
+        Parameters
+        ----------
+        body:
+            List of the new dictionary entries.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.put(self.__settings_url_for(self.config.paths.dictionary), body)
+
+        return TaskInfo(**task)
+
+    async def reset_dictionary(self) -> TaskInfo:
+        """Clear all entries in dictionary
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.delete(
+            self.__settings_url_for(self.config.paths.dictionary),
+        )
+
+        return TaskInfo(**task)
+
+    # TEXT SEPARATOR SUB-ROUTES
+
+    async def get_separator_tokens(self) -> List[str]:
+        """Get the additional text separator tokens set on this index.
+
+        Returns
+        -------
+        settings:
+            List containing the separator tokens of the index.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await self.http.get(self.__settings_url_for(self.config.paths.separator_tokens))
+
+    async def get_non_separator_tokens(self) -> List[str]:
+        """Get the list of disabled text separator tokens on this index.
+
+        Returns
+        -------
+        settings:
+            List containing the disabled separator tokens of the index.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await self.http.get(self.__settings_url_for(self.config.paths.non_separator_tokens))
+
+    async def update_separator_tokens(self, body: Union[List[str], None]) -> TaskInfo:
+        """Update the additional separator tokens of the index.
+
+        Parameters
+        ----------
+        body:
+            List of the new separator tokens.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.put(
+            self.__settings_url_for(self.config.paths.separator_tokens), body
+        )
+
+        return TaskInfo(**task)
+
+    async def update_non_separator_tokens(self, body: Union[List[str], None]) -> TaskInfo:
+        """Update the disabled separator tokens of the index.
+
+        Parameters
+        ----------
+        body:
+            List of the newly disabled separator tokens.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.put(
+            self.__settings_url_for(self.config.paths.non_separator_tokens), body
+        )
+
+        return TaskInfo(**task)
+
+    async def reset_separator_tokens(self) -> TaskInfo:
+        """Clear all additional separator tokens
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.delete(
+            self.__settings_url_for(self.config.paths.separator_tokens),
+        )
+
+        return TaskInfo(**task)
+
+    async def reset_non_separator_tokens(self) -> TaskInfo:
+        """Clear all disabled separator tokens
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.delete(
+            self.__settings_url_for(self.config.paths.non_separator_tokens),
+        )
+
+        return TaskInfo(**task)
+
+    # EMBEDDERS SUB-ROUTES
+
+    async def get_embedders(self) -> Embedders | None:
+        """Get embedders of the index.
+
+        Retrieves the current embedder configuration from Meilisearch.
+
+        Returns
+        -------
+        Embedders:
+            The embedders settings of the index, or None if no embedders are configured.
+            Contains a dictionary of embedder configurations, where keys are embedder names.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        response = await self.http.get(self.__settings_url_for(self.config.paths.embedders))
+
+        if not response:
+            return None
+
+        embedders: dict[str, EmbedderType] = {}
+        for k, v in response.items():
+            source = v.get("source")
+            if source == "openAi":
+                embedders[k] = OpenAiEmbedder(**v)
+            elif source == "huggingFace":
+                embedders[k] = HuggingFaceEmbedder(**v)
+            elif source == "ollama":
+                embedders[k] = OllamaEmbedder(**v)
+            elif source == "rest":
+                embedders[k] = RestEmbedder(**v)
+            elif source == "composite":
+                embedders[k] = CompositeEmbedder(**v)
+            elif source == "userProvided":
+                embedders[k] = UserProvidedEmbedder(**v)
+            else:
+                # Default to UserProvidedEmbedder for unknown sources
+                embedders[k] = UserProvidedEmbedder(**v)
+
+        return Embedders(embedders=embedders)
+
+    async def update_embedders(self, body: Union[MutableMapping[str, Any], None]) -> TaskInfo:
+        """Update embedders of the index.
+
+        Updates the embedder configuration for the index. The embedder configuration
+        determines how Meilisearch generates vector embeddings for documents.
+
+        Parameters
+        ----------
+        body: dict
+            Dictionary containing the embedders configuration.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request.
+            Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        if body is not None and body.get("embedders"):
+            embedders: dict[str, EmbedderType] = {}
+            for k, v in body["embedders"].items():
+                source = v.get("source")
+                if source == "openAi":
+                    embedders[k] = OpenAiEmbedder(**v)
+                elif source == "huggingFace":
+                    embedders[k] = HuggingFaceEmbedder(**v)
+                elif source == "ollama":
+                    embedders[k] = OllamaEmbedder(**v)
+                elif source == "rest":
+                    embedders[k] = RestEmbedder(**v)
+                elif source == "composite":
+                    embedders[k] = CompositeEmbedder(**v)
+                elif source == "userProvided":
+                    embedders[k] = UserProvidedEmbedder(**v)
+                else:
+                    # Default to UserProvidedEmbedder for unknown sources
+                    embedders[k] = UserProvidedEmbedder(**v)
+
+            body = {"embedders": {k: v.model_dump(by_alias=True) for k, v in embedders.items()}}
+
+        task = await self.http.patch(self.__settings_url_for(self.config.paths.embedders), body)
+
+        return TaskInfo(**task)
+
+    async def reset_embedders(self) -> TaskInfo:
+        """Reset embedders of the index to default values.
+
+        Removes all embedder configurations from the index.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.delete(
+            self.__settings_url_for(self.config.paths.embedders),
+        )
+
+        return TaskInfo(**task)
+
+    # SEARCH CUTOFF MS SETTINGS
+
+    async def get_search_cutoff_ms(self) -> int | None:
+        """Get the search cutoff in ms of the index.
+
+        Returns
+        -------
+        settings:
+            Integer value of search cutoff in ms of the index.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return await self.http.get(self.__settings_url_for(self.config.paths.search_cutoff_ms))
+
+    async def update_search_cutoff_ms(self, body: Union[int, None]) -> TaskInfo:
+        """Update the search cutoff in ms of the index.
+
+        Parameters
+        ----------
+        body:
+            Integer value of the search cutoff time in ms.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.put(
+            self.__settings_url_for(self.config.paths.search_cutoff_ms), body
+        )
+
+        return TaskInfo(**task)
+
+    async def reset_search_cutoff_ms(self) -> TaskInfo:
+        """Reset the search cutoff of the index
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.delete(
+            self.__settings_url_for(self.config.paths.search_cutoff_ms),
+        )
+
+        return TaskInfo(**task)
+
+    # PREFIX SEARCH
+
+    async def get_prefix_search(self) -> PrefixSearch:
+        """Get the prefix search settings of an index.
+
+        Returns
+        -------
+        settings:
+            The prefix search settings of the index.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        prefix_search = await self.http.get(
+            self.__settings_url_for(self.config.paths.prefix_search)
+        )
+
+        return PrefixSearch[to_snake(prefix_search).upper()]
+
+    async def update_prefix_search(self, body: Union[PrefixSearch, None]) -> TaskInfo:
+        """Update the prefix search settings of the index.
+
+        Parameters
+        ----------
+        body:
+            Prefix search settings
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks
+        """
+        task = await self.http.put(self.__settings_url_for(self.config.paths.prefix_search), body)
+
+        return TaskInfo(**task)
+
+    async def reset_prefix_search(self) -> TaskInfo:
+        """Reset the prefix search settings of the index
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks
+        """
+        task = await self.http.delete(
+            self.__settings_url_for(self.config.paths.prefix_search),
+        )
+
+        return TaskInfo(**task)
+
+    # PROXIMITY PRECISION SETTINGS
+
+    async def get_proximity_precision(self) -> ProximityPrecision:
+        """Get the proximity_precision of the index.
+
+        Returns
+        -------
+        settings:
+            proximity_precision of the index.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        response = await self.http.get(
+            self.__settings_url_for(self.config.paths.proximity_precision)
+        )
+        return ProximityPrecision[to_snake(response).upper()]
+
+    async def update_proximity_precision(self, body: Union[ProximityPrecision, None]) -> TaskInfo:
+        """Update the proximity_precision of the index.
+
+        Parameters
+        ----------
+        body:
+            proximity_precision
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.put(
+            self.__settings_url_for(self.config.paths.proximity_precision), body
+        )
+
+        return TaskInfo(**task)
+
+    async def reset_proximity_precision(self) -> TaskInfo:
+        """Reset the proximity_precision of the index
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.delete(
+            self.__settings_url_for(self.config.paths.proximity_precision),
+        )
+
+        return TaskInfo(**task)
+
+    # LOCALIZED ATTRIBUTES SETTINGS
+
+    async def get_localized_attributes(self) -> Union[List[LocalizedAttributes], None]:
+        """Get the localized_attributes of the index.
+
+        Returns
+        -------
+        settings:
+            localized_attributes of the index.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        response = await self.http.get(
+            self.__settings_url_for(self.config.paths.localized_attributes)
+        )
+
+        if not response:
+            return None
+
+        return [LocalizedAttributes(**attrs) for attrs in response]
+
+    async def update_localized_attributes(
+        self, body: Union[List[Mapping[str, List[str]]], None]
+    ) -> TaskInfo:
+        """Update the localized_attributes of the index.
+
+        Parameters
+        ----------
+        body:
+            localized_attributes
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.put(
+            self.__settings_url_for(self.config.paths.localized_attributes), body
+        )
+
+        return TaskInfo(**task)
+
+    async def reset_localized_attributes(self) -> TaskInfo:
+        """Reset the localized_attributes of the index
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.delete(
+            self.__settings_url_for(self.config.paths.localized_attributes),
+        )
+
+        return TaskInfo(**task)
+
+    @staticmethod
+    async def _batch(
+        documents: Union[Iterable[Mapping[str, Any]], AsyncIterable[Mapping[str, Any]]],
+        batch_size: int,
+    ) -> AsyncGenerator[Sequence[Mapping[str, Any]], None]:
+        if batch_size < 1:
+            raise ValueError("batch_size should be greater than or equal to 1")
+
+        if isinstance(documents, Sequence):
+            for i in range(0, len(documents), batch_size):
+                yield documents[i : i + batch_size]
+        elif isinstance(documents, AsyncIterable):
+            batch: List[Mapping[str, Any]] = []
+            async for document in documents:
+                batch.append(document)
+                if len(batch) == batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+        else:
+            iterator = iter(documents)
+            while batch := list(islice(iterator, batch_size)):
+                yield batch
+
+    @staticmethod
+    async def _batch_payloads(
+        documents: Union[Iterable[Mapping[str, Any]], AsyncIterable[Mapping[str, Any]]],
+        batch_size: int,
+        max_payload_size: int,
+        serializer: Optional[Type[JSONEncoder]] = None,
+        codec: Optional[JsonCodec] = None,
+    ) -> AsyncGenerator[bytes, None]:
+        batcher = PayloadBatcher(batch_size, max_payload_size, serializer, codec)
+        if isinstance(documents, AsyncIterable):
+            async for document in documents:
+                payload = batcher.add(document)
+                if payload is not None:
+                    yield payload
+        else:
+            for document in documents:
+                payload = batcher.add(document)
+                if payload is not None:
+                    yield payload
+
+        payload = batcher.flush()
+        if payload is not None:
+            yield payload
+
+    @staticmethod
+    def _split_file(
+        file: IO[bytes], batch_size: int, content_type: str, chunk_size: int
+    ) -> Iterator[Iterator[bytes]]:
+        if content_type not in ("application/x-ndjson", "text/csv"):
+            raise ValueError("Only NDJSON and CSV files can be split in batches")
+
+        return split_records(
+            file, batch_size, csv=content_type == "text/csv", chunk_size=chunk_size
+        )
+
+    def __settings_url_for(self, sub_route: str) -> str:
+        return f"{self.config.paths.index}/{self.uid}/{self.config.paths.setting}/{sub_route}"
+
+    def _build_url(
+        self,
+        primary_key: Optional[str] = None,
+        csv_delimiter: Optional[str] = None,
+    ) -> str:
+        parameters = {}
+        if primary_key:
+            parameters["primaryKey"] = primary_key
+        if csv_delimiter:
+            parameters["csvDelimiter"] = csv_delimiter
+        if primary_key is None and csv_delimiter is None:
+            return f"{self.config.paths.index}/{self.uid}/{self.config.paths.document}"
+        return f"{self.config.paths.index}/{self.uid}/{self.config.paths.document}?{parse.urlencode(parameters)}"
+
+    async def compact(self) -> TaskInfo:
+        """
+        Trigger the compaction of the index.
+        This is an asynchronous operation in Meilisearch.
+
+        Returns
+        -------
+        task_info: TaskInfo
+            Contains information to track the progress of the compaction task.
+        """
+        path = f"{self.config.paths.index}/{self.uid}/compact"
+        task = await self.http.post(path)
+        return TaskInfo(**task)
+
+
+async def _iter_documents(
+    fetch: Callable[[int], Awaitable[DocumentsResults]], page_size: int, prefetch: int
+) -> AsyncGenerator[Document, None]:
+    """Yield the documents of every page while the next pages are fetched by other tasks."""
+    first = await fetch(0)
+
+    async def first_page() -> DocumentsResults:
+        return first
+
+    pages: Iterator[Callable[[], Awaitable[DocumentsResults]]] = chain(
+        [first_page],
+        (partial(fetch, offset) for offset in range(page_size, first.total, page_size)),
+    )
+    # The first page is already fetched, one more slot keeps `prefetch` pages in flight.
+    results = _in_order(_aiter(pages), prefetch + 1)
+    try:
+        async for page in results:
+            for document in page.results:
+                yield document
+    finally:
+        await results.aclose()
+
+
+async def _write_pages(
+    pages: Iterator[Callable[[], Awaitable[Dict[str, Any]]]],
+    workers: int,
+    writer: NdjsonWriter,
+) -> None:
+    """Fetch the pages with at most `workers` requests in flight and write them in order."""
+    results = _in_order(_aiter(pages), workers)
+    try:
+        async for page in results:
+            await asyncio.to_thread(writer.write, page["results"])
+    finally:
+        await results.aclose()
+
+
+async def _send_batches(
+    send: Callable[[T], Awaitable[TaskInfo]],
+    batches: AsyncIterator[T],
+    concurrency: int,
+) -> List[TaskInfo]:
+    """Send the batches with at most `concurrency` requests in flight.
+
+    The batches are pulled from the iterator only when a slot is free and the tasks are returned
+    in the order of the batches.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency should be greater than or equal to 1")
+
+    calls = (partial(send, batch) async for batch in batches)
+    return [task async for task in _in_order(calls, concurrency)]
+
+
+async def _in_order(
+    calls: AsyncIterator[Callable[[], Awaitable[T]]], limit: int
+) -> AsyncGenerator[T, None]:
+    """Await the calls with at most `limit` of them in flight and yield their results in order.
+
+    The next call is pulled from `calls` once the oldest one in flight is answered. The calls
+    not started yet are cancelled when one of them fails or the caller stops iterating.
+    """
+    in_flight: Deque[asyncio.Future[T]] = deque()
+    try:
+        async for call in calls:
+            if len(in_flight) == limit:
+                yield await in_flight.popleft()
+            in_flight.append(asyncio.ensure_future(call()))
+        while in_flight:
+            yield await in_flight.popleft()
+    finally:
+        for future in in_flight:
+            future.cancel()
+
+
+async def _aiter(items: Iterable[T]) -> AsyncGenerator[T, None]:
+    for item in items:
+        yield item
@@ -0,0 +1,302 @@
+from __future__ import annotations
+
+import asyncio
+from time import monotonic
+from typing import Any, Dict, Iterable, List, MutableMapping, Optional, Sequence
+from urllib import parse
+
+from meilisearch._async_httprequests import AsyncHttpRequests
+from meilisearch.config import Config
+from meilisearch.errors import MeilisearchTimeoutError
+from meilisearch.models.task import Batch, BatchResults, Task, TaskInfo, TaskResults
+from meilisearch.polling import PollingStrategy, ProgressTracker, default_polling
+from meilisearch.task import FINISHED_STATUSES, TASK_UIDS_PER_REQUEST
+
+
+class AsyncTaskHandler:
+    """
+    A class covering the Meilisearch Task API with asyncio
+
+    The task class gives access to all task routes and gives information about the progress of asynchronous operations.
+    https://www.meilisearch.com/docs/reference/api/tasks
+    """
+
+    def __init__(self, config: Config, http: Optional[AsyncHttpRequests] = None):
+        """Parameters
+        ----------
+            config: Config object containing permission and location of Meilisearch.
+            http (optional): Transport to reuse, a new one is created from the config if omitted.
+        """
+        self.config = config
+        self.http = http if http is not None else AsyncHttpRequests(config)
+
+    async def get_batches(
+        self, parameters: Optional[MutableMapping[str, Any]] = None
+    ) -> BatchResults:
+        """Get all task batches.
+
+        Parameters
+        ----------
+        parameters (optional):
+            parameters accepted by the get batches route: https://www.meilisearch.com/docs/reference/api/batches#get-batches.
+
+        Returns
+        -------
+        batch:
+            BatchResults instance contining limit, from, next and results containing a list of all batches.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        if parameters is None:
+            parameters = {}
+        for param in parameters:
+            if isinstance(parameters[param], (list, tuple)):
+                parameters[param] = ",".join(parameters[param])
+        batches = await self.http.get(f"{self.config.paths.batch}?{parse.urlencode(parameters)}")
+        return BatchResults(**batches)
+
+    async def get_batch(self, uid: int) -> Batch:
+        """Get one tasks batch.
+
+        Parameters
+        ----------
+        uid:
+            Identifier of the batch.
+
+        Returns
+        -------
+        task:
+            Batch instance containing information about the progress of the asynchronous batch.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        batch = await self.http.get(f"{self.config.paths.batch}/{uid}")
+        return Batch(**batch)
+
+    async def get_tasks(self, parameters: Optional[MutableMapping[str, Any]] = None) -> TaskResults:
+        """Get all tasks.
+
+        Parameters
+        ----------
+        parameters (optional):
+            parameters accepted by the get tasks route: https://www.meilisearch.com/docs/reference/api/tasks#get-tasks.
+
+        Returns
+        -------
+        task:
+            TaskResults instance contining limit, from, next and results containing a list of all
+            enqueued, processing, succeeded or failed tasks.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        if parameters is None:
+            parameters = {}
+        for param in parameters:
+            if isinstance(parameters[param], (list, tuple)):
+                parameters[param] = ",".join(parameters[param])
+        tasks = await self.http.get(f"{self.config.paths.task}?{parse.urlencode(parameters)}")
+        return TaskResults(**tasks)
+
+    async def get_task(self, uid: int) -> Task:
+        """Get one task.
+
+        Parameters
+        ----------
+        uid:
+            Identifier of the task.
+
+        Returns
+        -------
+        task:
+            Task instance containing information about the processed asynchronous task.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.get(f"{self.config.paths.task}/{uid}")
+        return Task(**task)
+
+    async def cancel_tasks(self, parameters: MutableMapping[str, Any]) -> TaskInfo:
+        """Cancel a list of enqueued or processing tasks.
+
+        Parameters
+        ----------
+        parameters:
+            parameters accepted by the cancel tasks https://www.meilisearch.com/docs/reference/api/tasks#cancel-task.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        for param in parameters:
+            if isinstance(parameters[param], (list, tuple)):
+                parameters[param] = ",".join(parameters[param])
+        response = await self.http.post(
+            f"{self.config.paths.task}/cancel?{parse.urlencode(parameters)}"
+        )
+        return TaskInfo(**response)
+
+    async def delete_tasks(self, parameters: MutableMapping[str, Any]) -> TaskInfo:
+        """Delete a list of enqueued or processing tasks.
+        Parameters
+        ----------
+        config:
+            Config object containing permission and location of Meilisearch.
+        parameters:
+            parameters accepted by the delete tasks route:https://www.meilisearch.com/docs/reference/api/tasks#delete-task.
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        for param in parameters:
+            if isinstance(parameters[param], (list, tuple)):
+                parameters[param] = ",".join(parameters[param])
+        response = await self.http.delete(f"{self.config.paths.task}?{parse.urlencode(parameters)}")
+        return TaskInfo(**response)
+
+    async def wait_for_task(
+        self,
+        uid: int,
+        timeout_in_ms: int = 5000,
+        interval_in_ms: int = 50,
+        *,
+        polling: Optional[PollingStrategy] = None,
+    ) -> Task:
+        """Wait until the task fails or succeeds in Meilisearch.
+
+        Parameters
+        ----------
+        uid:
+            Identifier of the task to wait for being processed.
+        timeout_in_ms (optional):
+            Time the method should wait before raising a MeilisearchTimeoutError.
+        interval_in_ms (optional):
+            Time interval the method should wait (sleep) before the second request. The following
+            intervals grow exponentially up to one second, or interval_in_ms if it is larger.
+        polling (optional):
+            PollingStrategy controlling the intervals between requests, overrides interval_in_ms.
+            Use PollingStrategy.fixed(interval_in_ms) to poll at a fixed interval.
+
+        Returns
+        -------
+        task:
+            Task instance containing information about the processed asynchronous task.
+
+        Raises
+        ------
+        MeilisearchTimeoutError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        polling = polling or default_polling(interval_in_ms)
+        progress = ProgressTracker()
+        interval: Optional[float] = None
+        deadline = monotonic() + timeout_in_ms / 1000
+        while monotonic() < deadline:
+            task = await self.get_task(uid)
+            if task.status not in ("enqueued", "processing"):
+                return task
+            remaining = None
+            if polling.use_progress and task.status == "processing" and task.batch_uid is not None:
+                remaining = progress.update((await self.get_batch(task.batch_uid)).progress)
+            interval = polling.next_interval(interval, remaining)
+            await asyncio.sleep(min(interval / 1000, max(deadline - monotonic(), 0)))
+        raise MeilisearchTimeoutError(
+            f"timeout of ${timeout_in_ms}ms has exceeded on process ${uid} when waiting for task to be resolve."
+        )
+
+    async def wait_for_tasks(
+        self,
+        uids: Sequence[int],
+        timeout_in_ms: int = 5000,
+        interval_in_ms: int = 50,
+        *,
+        stop_on_failure: bool = False,
+        polling: Optional[PollingStrategy] = None,
+    ) -> List[Task]:
+        """Wait until several tasks fail or succeed in Meilisearch.
+
+        The tasks still pending are fetched together from the get tasks route once per interval,
+        instead of polling every task on its own.
+
+        Parameters
+        ----------
+        uids:
+            Identifiers of the tasks to wait for being processed.
+        timeout_in_ms (optional):
+            Time the method should wait for all the tasks before raising a MeilisearchTimeoutError.
+        interval_in_ms (optional):
+            Time interval the method should wait (sleep) before the second request. The following
+            intervals grow exponentially up to one second, or interval_in_ms if it is larger.
+        stop_on_failure (optional):
+            Return as soon as one of the tasks failed, without waiting for the others.
+        polling (optional):
+            PollingStrategy controlling the intervals between requests, overrides interval_in_ms.
+
+        Returns
+        -------
+        tasks:
+            List of Task instances of the processed tasks, in the order of uids. With
+            stop_on_failure only the tasks finished when the failure was seen are returned.
+
+        Raises
+        ------
+        MeilisearchTimeoutError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        polling = polling or default_polling(interval_in_ms)
+        interval: Optional[float] = None
+        deadline = monotonic() + timeout_in_ms / 1000
+        pending = set(uids)
+        finished: Dict[int, Task] = {}
+        while True:
+            for task in await self._get_finished_tasks(pending):
+                finished[task.uid] = task
+                pending.discard(task.uid)
+                if stop_on_failure and task.status == "failed":
+                    return [finished[uid] for uid in uids if uid in finished]
+            if not pending:
+                return [finished[uid] for uid in uids]
+            if monotonic() >= deadline:
+                raise MeilisearchTimeoutError(
+                    f"timeout of {timeout_in_ms}ms has exceeded when waiting for {len(pending)} "
+                    "tasks to be resolved."
+                )
+            interval = polling.next_interval(interval)
+            await asyncio.sleep(min(interval / 1000, max(deadline - monotonic(), 0)))
+
+    async def _get_finished_tasks(self, uids: Iterable[int]) -> List[Task]:
+        ordered = sorted(uids)
+        tasks: List[Task] = []
+        for i in range(0, len(ordered), TASK_UIDS_PER_REQUEST):
+            chunk = ordered[i : i + TASK_UIDS_PER_REQUEST]
+            parameters = {
+                "uids": [str(uid) for uid in chunk],
+                "statuses": list(FINISHED_STATUSES),
+                "limit": len(chunk),
+            }
+            tasks.extend((await self.get_tasks(parameters)).results)
+        return tasks
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import asyncio
+import re
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from meilisearch.errors import MeilisearchApiError
+
+_SEARCH_PATH = re.compile(r"^indexes/([^/]+)/search$")
+
+
+class _Resend(Exception):
+    """The search is sent on its own: it was alone in its batch or the multi-search failed."""
+
+
+class _Batch:
+    def __init__(self, full: Any) -> None:
+        self.searches: List[Tuple[str, Dict[str, Any], Any]] = []
+        self.full = full
+
+
+class SearchBatcher:
+    """
+    Merge the searches sent at the same time into a single multi-search
+
+    The first search of a batch waits up to `window_in_ms` for other searches, from other threads
+    or tasks, then the batch is sent as one multi-search request and every caller gets its own
+    result back. A batch is sent as soon as it holds `max_batch_size` searches. When Meilisearch
+    refuses the multi-search, for instance because one of the searches is invalid, the searches
+    are sent again one by one so that each caller gets its own result or error.
+    """
+
+    def __init__(self, window_in_ms: float = 2, max_batch_size: int = 20) -> None:
+        """
+        Parameters
+        ----------
+        window_in_ms (optional):
+            Time the first search of a batch waits for other searches.
+        max_batch_size (optional):
+            Maximum number of searches merged in one multi-search.
+        """
+        if window_in_ms < 0:
+            raise ValueError("window_in_ms should be greater than or equal to 0")
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size should be greater than or equal to 1")
+
+        self.window_in_ms = window_in_ms
+        self.max_batch_size = max_batch_size
+        self._lock = threading.Lock()
+        self._batch: Optional[_Batch] = None
+        self._async_batch: Optional[_Batch] = None
+
+    def index_uid(self, method: str, path: str) -> Optional[str]:
+        """Uid of the index searched by the request, None when it is not a single search."""
+        match = _SEARCH_PATH.match(path) if method.upper() == "POST" else None
+        return match.group(1) if match is not None else None
+
+    def search(self, send: Callable[[str, Any], Any], index_uid: str, body: Dict[str, Any]) -> Any:
+        """Send the search of the calling thread within the next batch.
+
+        Parameters
+        ----------
+        send:
+            Send a POST request to the path with the body and return the decoded response.
+        index_uid:
+            Uid of the index searched.
+        body:
+            Body of the search request.
+        """
+        future: Future = Future()
+        with self._lock:
+            batch, leader = self._join(self._batch, index_uid, body, future, threading.Event)
+            self._batch = None if batch.full.is_set() else batch
+
+        if leader:
+            batch.full.wait(self.window_in_ms / 1000)
+            with self._lock:
+                if self._batch is batch:
+                    self._batch = None
+            self._send_batch(send, batch)
+
+        try:
+            return future.result()
+        except _Resend:
+            return send(f"indexes/{index_uid}/search", body)
+
+    async def asearch(
+        self, send: Callable[[str, Any], Awaitable[Any]], index_uid: str, body: Dict[str, Any]
+    ) -> Any:
+        """Send the search of the calling task within the next batch, see `search`."""
+        future = asyncio.get_running_loop().create_future()
+        batch, leader = self._join(self._async_batch, index_uid, body, future, asyncio.Event)
+        self._async_batch = None if batch.full.is_set() else batch
+
+        if leader:
+            try:
+                await asyncio.wait_for(batch.full.wait(), self.window_in_ms / 1000)
+            except asyncio.TimeoutError:
+                pass
+            if self._async_batch is batch:
+                self._async_batch = None
+            if len(batch.searches) == 1:
+                _settle(batch, None, _Resend())
+            else:
+                try:
+                    _settle(batch, await send("multi-search", _multi_search_body(batch)))
+                except MeilisearchApiError:
+                    _settle(batch, None, _Resend())
+                except Exception as err:  # pylint: disable=broad-except
+                    _settle(batch, None, err)
+
+        try:
+            return await future
+        except _Resend:
+            return await send(f"indexes/{index_uid}/search", body)
+
+    def _join(
+        self,
+        batch: Optional[_Batch],
+        index_uid: str,
+        body: Dict[str, Any],
+        future: Any,
+        event: Callable[[], Any],
+    ) -> Tuple[_Batch, bool]:
+        leader = batch is None
+        if batch is None:
+            batch = _Batch(event())
+        batch.searches.append((index_uid, body, future))
+        if len(batch.searches) >= self.max_batch_size:
+            batch.full.set()
+        return batch, leader
+
+    def _send_batch(self, send: Callable[[str, Any], Any], batch: _Batch) -> None:
+        if len(batch.searches) == 1:
+            _settle(batch, None, _Resend())
+            return
+        try:
+            _settle(batch, send("multi-search", _multi_search_body(batch)))
+        except MeilisearchApiError:
+            _settle(batch, None, _Resend())
+        except Exception as err:  # pylint: disable=broad-except
+            _settle(batch, None, err)
+
+
+def _multi_search_body(batch: _Batch) -> Dict[str, Any]:
+    return {"queries": [{**body, "indexUid": uid} for uid, body, _ in batch.searches]}
+
+
+def _settle(
+    batch: _Batch, response: Optional[Dict[str, Any]], error: Optional[BaseException] = None
+) -> None:
+    """Resolve the futures of the batch with their result, or all of them with the error."""
+    for position, (_, _, future) in enumerate(batch.searches):
+        if future.done():
+            continue
+        if error is not None:
+            future.set_exception(error)
+        else:
+            result = (response or {})["results"][position]
+            # The single search route does not return the uid of the index.
+            result.pop("indexUid", None)
+            future.set_result(result)
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import json
+import re
+import threading
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from meilisearch._codec import JsonCodec
+
+_CACHED_PATH = re.compile(r"^(multi-search|indexes/([^/]+)/(search|facet-search))$")
+_INDEX_PATH = re.compile(r"^indexes/([^/?]+)")
+
+
+class SearchCache:
+    """
+    Cache the responses of the searches sent by a client
+
+    Index.search, Index.facet_search and Client.multi_search responses are kept for `ttl_in_ms`,
+    keyed on the route and the normalized request body. The least recently used entries are
+    evicted beyond `max_entries` or `max_bytes`. Every write this client sends to an index, such
+    as a document addition, a deletion or a settings update, drops the entries of that index. The
+    writes sent by other clients are only caught up with once the entries expire.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: Optional[int] = None,
+        ttl_in_ms: float = 60000,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        max_entries (optional):
+            Maximum number of responses kept.
+        max_bytes (optional):
+            Maximum total size of the responses kept, as encoded JSON. Unbounded by default.
+        ttl_in_ms (optional):
+            Time a response is served from the cache.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries should be greater than or equal to 1")
+
+        self.max_bytes = max_bytes
+        self.ttl_in_ms = ttl_in_ms
+        self.hits = 0
+        self.misses = 0
+        self._entries = _Entries(max_entries, max_bytes)
+        self._generations = _Generations()
+        self._lock = threading.Lock()
+
+    def applies(self, method: str, path: str) -> bool:
+        """Whether the response of the request can be cached."""
+        return method.upper() == "POST" and bool(_CACHED_PATH.match(path))
+
+    def key(self, path: str, body: Any) -> Tuple[Hashable, Tuple[str, ...]]:
+        """Build the cache key of a search and the uids of the indexes it reads."""
+        normalized = json.dumps(body, sort_keys=True, separators=(",", ":"), default=str)
+        match = _CACHED_PATH.match(path)
+        if match is not None and match.group(2) is not None:
+            indexes: Tuple[str, ...] = (match.group(2),)
+        else:
+            queries: List[Any] = (body or {}).get("queries") or []
+            indexes = tuple(sorted({query.get("indexUid") for query in queries}))
+        return (path, normalized), indexes
+
+    def generation(self, indexes: Tuple[str, ...]) -> Tuple[int, ...]:
+        """Snapshot the invalidations of the indexes, taken before sending a search."""
+        with self._lock:
+            return self._generations.current(indexes)
+
+    def get(self, key: Hashable, codec: JsonCodec) -> Optional[Any]:
+        """Return a fresh copy of the cached response, None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= monotonic():
+                if entry is not None:
+                    self._entries.remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            data = entry[1]
+        # Decoding on every hit hands each caller its own objects to mutate.
+        return codec.loads(data)
+
+    def put(
+        self,
+        key: Hashable,
+        response: Any,
+        indexes: Tuple[str, ...],
+        generation: Tuple[int, ...],
+        codec: JsonCodec,
+    ) -> None:
+        """Store a response, unless one of its indexes was written to while it was fetched."""
+        data = codec.dumps(response)
+        if self.max_bytes is not None and len(data) > self.max_bytes:
+            return
+        with self._lock:
+            if generation != self._generations.current(indexes):
+                return
+            self._entries.add(key, (monotonic() + self.ttl_in_ms / 1000, data, indexes))
+
+    def invalidate(self, index_uid: Optional[str] = None) -> None:
+        """Drop the entries reading `index_uid`, or every entry when it is None."""
+        with self._lock:
+            self._generations.bump(index_uid)
+            if index_uid is None:
+                self._entries.clear()
+                return
+            for key in [key for key, entry in self._entries.items() if index_uid in entry[2]]:
+                self._entries.remove(key)
+
+    def invalidate_for_write(self, path: str) -> None:
+        """Drop the entries made stale by a write request sent by the client."""
+        if path.split("?", 1)[0] == "swap-indexes":
+            self.invalidate()
+            return
+        match = _INDEX_PATH.match(path)
+        if match is not None:
+            self.invalidate(match.group(1))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class _Entries(OrderedDict):
+    """Cache entries in least recently used order, evicted beyond a count or a total size."""
+
+    def __init__(self, max_entries: int, max_bytes: Optional[int]) -> None:
+        super().__init__()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+
+    def add(self, key: Hashable, entry: Tuple[float, bytes, Tuple[str, ...]]) -> None:
+        if key in self:
+            self.remove(key)
+        self[key] = entry
+        self.size += len(entry[1])
+        while len(self) > self.max_entries or (
+            self.max_bytes is not None and self.size > self.max_bytes
+        ):
+            self.remove(next(iter(self)))
+
+    def remove(self, key: Hashable) -> None:
+        self.size -= len(self.pop(key)[1])
+
+    def clear(self) -> None:
+        super().clear()
+        self.size = 0
+
+
+class _Generations:
+    """Count the invalidations of every index, and of the whole cache."""
+
+    def __init__(self) -> None:
+        self.indexes: Dict[str, int] = {}
+        self.all = 0
+
+    def current(self, indexes: Tuple[str, ...]) -> Tuple[int, ...]:
+        return (self.all, *(self.indexes.get(uid, 0) for uid in indexes))
+
+    def bump(self, index_uid: Optional[str]) -> None:
+        if index_uid is None:
+            self.all += 1
+        else:
+            self.indexes[index_uid] = self.indexes.get(index_uid, 0) + 1
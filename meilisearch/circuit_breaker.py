@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from time import monotonic
+from typing import Deque, Dict, Tuple
+
+from meilisearch.errors import MeilisearchCommunicationError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class _Circuit:
+    def __init__(self) -> None:
+        self.state = CLOSED
+        self.outcomes: Deque[Tuple[float, bool]] = deque()
+        self.failures = 0
+        self.opened_until = 0.0
+
+
+class CircuitBreaker:
+    """
+    Fail fast while a Meilisearch node keeps failing
+
+    The outcome of every request is tracked per url of Meilisearch over a sliding window. Once
+    `failure_rate` of at least `minimum_requests` requests failed with a timeout, a connection
+    error or a 5xx status, the circuit opens: the requests to that url immediately raise a
+    MeilisearchCommunicationError instead of waiting for the timeout. After `open_duration_in_ms`
+    the next request first probes the health route; the circuit closes again if it answers, or
+    stays open for another period otherwise.
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        minimum_requests: int = 10,
+        window_in_ms: float = 10000,
+        open_duration_in_ms: float = 5000,
+        probe_timeout_in_ms: float = 1000,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        failure_rate (optional):
+            Fraction of failed requests in the window opening the circuit.
+        minimum_requests (optional):
+            Number of requests in the window below which the circuit never opens.
+        window_in_ms (optional):
+            Duration of the sliding window the failure rate is computed over.
+        open_duration_in_ms (optional):
+            Time the requests fail fast before the health of the node is probed again.
+        probe_timeout_in_ms (optional):
+            Timeout of the health probe.
+        """
+        if not 0 < failure_rate <= 1:
+            raise ValueError("failure_rate should be greater than 0 and at most 1")
+        if minimum_requests < 1:
+            raise ValueError("minimum_requests should be greater than or equal to 1")
+
+        self.failure_rate = failure_rate
+        self.minimum_requests = minimum_requests
+        self.window_in_ms = window_in_ms
+        self.open_duration_in_ms = open_duration_in_ms
+        self.probe_timeout_in_ms = probe_timeout_in_ms
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def state(self, url: str) -> str:
+        """State of the circuit of `url`: "closed", "open" or "half_open"."""
+        with self._lock:
+            return self._circuit(url).state
+
+    def before_request(self, url: str) -> bool:
+        """Check the circuit of `url` before sending a request to it.
+
+        Returns
+        -------
+        probe:
+            True when the caller should probe the health of the node and report the result with
+            `record_probe` before sending its request.
+
+        Raises
+        ------
+        MeilisearchCommunicationError
+            The circuit is open, or another request is already probing the node.
+        """
+        with self._lock:
+            circuit = self._circuit(url)
+            if circuit.state == CLOSED:
+                return False
+            if circuit.state == OPEN and monotonic() >= circuit.opened_until:
+                circuit.state = HALF_OPEN
+                return True
+        raise MeilisearchCommunicationError(
+            f"Circuit breaker open for {url}, the requests fail fast until it recovers."
+        )
+
+    def record_probe(self, url: str, healthy: bool) -> None:
+        """Close the circuit of `url` after a successful probe, keep it open otherwise."""
+        with self._lock:
+            circuit = self._circuit(url)
+            if healthy:
+                circuit.state = CLOSED
+                circuit.outcomes.clear()
+                circuit.failures = 0
+            else:
+                self._open(circuit)
+
+    def record(self, url: str, success: bool) -> None:
+        """Record the outcome of a request sent to `url`."""
+        now = monotonic()
+        with self._lock:
+            circuit = self._circuit(url)
+            circuit.outcomes.append((now, success))
+            circuit.failures += not success
+            while circuit.outcomes and circuit.outcomes[0][0] < now - self.window_in_ms / 1000:
+                circuit.failures -= not circuit.outcomes.popleft()[1]
+
+            if (
+                circuit.state == CLOSED
+                and len(circuit.outcomes) >= self.minimum_requests
+                and circuit.failures >= self.failure_rate * len(circuit.outcomes)
+            ):
+                self._open(circuit)
+
+    def _open(self, circuit: _Circuit) -> None:
+        circuit.state = OPEN
+        circuit.opened_until = monotonic() + self.open_duration_in_ms / 1000
+
+    def _circuit(self, url: str) -> _Circuit:
+        circuit = self._circuits.get(url)
+        if circuit is None:
+            circuit = self._circuits[url] = _Circuit()
+        return circuit
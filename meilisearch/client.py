@@ -8,22 +8,25 @@ import hashlib
 import hmac
 import json
 import re
+from concurrent.futures import Future
 from typing import (
     Any,
     Dict,
     Iterator,
     List,
+    Literal,
     Mapping,
     MutableMapping,
     Optional,
     Sequence,
     Tuple,
     Union,
+    overload,
 )
 from urllib import parse
 
 from meilisearch._httprequests import HttpRequests
-from meilisearch.config import Config
+from meilisearch.config import Config, Middleware, Transport
 from meilisearch.errors import (  # noqa: F401
     MeilisearchApiError,
     MeilisearchCommunicationError,
@@ -33,7 +36,9 @@ from meilisearch.index import Index
 from meilisearch.models.key import Key, KeysResults
 from meilisearch.models.task import Batch, BatchResults, Task, TaskInfo, TaskResults
 from meilisearch.models.webhook import Webhook, WebhooksResults
-from meilisearch.task import TaskHandler
+from meilisearch.polling import PollingStrategy
+from meilisearch.task import TaskHandler, TaskWatcher
+from meilisearch.task_webhook import TaskWebhookReceiver
 
 
 class Client:
@@ -49,17 +54,22 @@ class Client:
 
     def __init__(
         self,
-        url: str,
+        url: Union[str, Sequence[str]],
         api_key: Optional[str] = None,
         timeout: Optional[int] = None,
         client_agents: Optional[Tuple[str, ...]] = None,
         custom_headers: Optional[Mapping[str, str]] = None,
+        transport: Optional[Transport] = None,
+        middleware: Optional[Middleware] = None,
     ) -> None:
         """
         Parameters
         ----------
         url:
-            The url to the Meilisearch API (ex: http://localhost:7700)
+            The url to the Meilisearch API (ex: http://localhost:7700), or a list of the urls of
+            several nodes. The first one is the primary receiving the writes and the task polling,
+            the searches, facet searches and document reads are spread over all of them and fail
+            over to the next node when one does not answer.
         api_key:
             The optional API key for Meilisearch
         timeout (optional):
@@ -70,13 +80,142 @@ class Client:
             of this client.
         custom_headers (optional):
             Custom headers to add when sending data to Meilisearch.
+        transport (optional):
+            Transport setting how the requests are sent: size of the connection pool shared by
+            this client and every Index created from it, keep-alive, JSON codec, compression of
+            the request bodies and load balancing over several nodes. Defaults to Transport().
+        middleware (optional):
+            Middleware taking part in every request, such as a RetryPolicy, a SearchCache or a
+            TracingHook. Defaults to none of them.
         """
 
-        self.config = Config(url, api_key, timeout=timeout, client_agents=client_agents)
+        self.config = Config(
+            url,
+            api_key,
+            timeout=timeout,
+            client_agents=client_agents,
+            transport=transport,
+            middleware=middleware,
+        )
 
         self.http = HttpRequests(self.config, custom_headers)
 
-        self.task_handler = TaskHandler(self.config)
+        self.task_handler = TaskHandler(self.config, self.http)
+        # Built upfront so that concurrent callers share one watcher, its thread starts on the
+        # first watched task.
+        self.task_watcher = TaskWatcher(self.task_handler)
+        self._task_webhook: Optional[TaskWebhookReceiver] = None
+        self._task_webhook_uuid: Optional[str] = None
+
+    def __enter__(self) -> Client:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the connections of the pool shared by this client and its indexes."""
+        if self._task_webhook is not None:
+            self.disable_task_webhook()
+        self.task_watcher.close()
+        self.http.close()
+
+    def watch_task(self, task: Union[int, TaskInfo]) -> Future[Task]:
+        """Wait in the background until a task fails or succeeds.
+
+        All the tasks watched through this client are polled together by a single background
+        thread, so watching many tasks does not multiply the requests to Meilisearch.
+
+        Parameters
+        ----------
+        task:
+            TaskInfo returned by a write method, or the uid of the task.
+
+        Returns
+        -------
+        future:
+            concurrent.futures.Future resolved with the Task instance of the processed task.
+        """
+        return self.task_watcher.watch(task)
+
+    def enable_task_webhook(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        *,
+        public_url: Optional[str] = None,
+        fallback_interval_in_ms: float = 5000,
+    ) -> TaskWebhookReceiver:
+        """Get notified by Meilisearch of the finished tasks instead of polling them.
+
+        Starts an embedded HTTP server and registers it as a Meilisearch webhook. The futures of
+        `watch_task`, `wait_for_task` and `wait_for_tasks` then resolve as soon as the notification
+        arrives, as well as the ones of the indexes of this client. The tasks are still polled every
+        fallback_interval_in_ms, in case a notification gets lost.
+
+        Parameters
+        ----------
+        host (optional):
+            Interface the server listens on. Use "0.0.0.0" when Meilisearch runs on another host.
+        port (optional):
+            Port the server listens on, 0 picks a free one.
+        public_url (optional):
+            URL under which Meilisearch reaches the server, when it differs from the listening
+            address.
+        fallback_interval_in_ms (optional):
+            Time interval between two polls of the tasks still pending.
+
+        Returns
+        -------
+        receiver:
+            The running TaskWebhookReceiver.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        if self._task_webhook is not None:
+            return self._task_webhook
+
+        receiver = TaskWebhookReceiver(
+            host, port, public_url=public_url, codec=self.config.transport.json_codec
+        )
+        receiver.add_listener(self.task_watcher.notify)
+        receiver.start()
+        try:
+            webhook = self.create_webhook({"url": receiver.public_url, "headers": receiver.headers})
+        except Exception:
+            receiver.close()
+            raise
+
+        self.task_watcher.polling = PollingStrategy(
+            fallback_interval_in_ms, fallback_interval_in_ms, multiplier=1
+        )
+        self.task_handler.watcher = self.task_watcher
+        self._task_webhook, self._task_webhook_uuid = receiver, webhook.uuid
+        return receiver
+
+    def disable_task_webhook(self) -> None:
+        """Unregister the webhook of `enable_task_webhook`, stop its server and go back to polling.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        if self._task_webhook is None:
+            return
+
+        receiver, webhook_uuid = self._task_webhook, self._task_webhook_uuid
+        self._task_webhook = self._task_webhook_uuid = None
+        self.task_handler.watcher = None
+        self.task_watcher.polling = PollingStrategy()
+        try:
+            if webhook_uuid is not None:
+                self.delete_webhook(webhook_uuid)
+        finally:
+            receiver.close()
 
     def create_index(self, uid: str, options: Optional[Mapping[str, Any]] = None) -> TaskInfo:
         """Create an index.
@@ -99,7 +238,7 @@ class Client:
         MeilisearchApiError
             An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
         """
-        return Index.create(self.config, uid, options)
+        return Index.create(self.config, uid, options, http=self.http)
 
     def delete_index(self, uid: str) -> TaskInfo:
         """Deletes an index
@@ -153,6 +292,8 @@ class Client:
                 index["primaryKey"],
                 index["createdAt"],
                 index["updatedAt"],
+                http=self.http,
+                task_handler=self.task_handler,
             )
             for index in response["results"]
         ]
@@ -201,7 +342,7 @@ class Client:
         MeilisearchApiError
             An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
         """
-        return Index(self.config, uid).fetch_info()
+        return Index(self.config, uid, http=self.http, task_handler=self.task_handler).fetch_info()
 
     def get_raw_index(self, uid: str) -> Dict[str, Any]:
         """Get the index as a dictionary.
@@ -239,12 +380,34 @@ class Client:
             An Index instance.
         """
         if uid is not None:
-            return Index(self.config, uid=uid)
+            return Index(self.config, uid=uid, http=self.http, task_handler=self.task_handler)
         raise ValueError("The index UID should not be None")
 
+    @overload
+    def multi_search(
+        self,
+        queries: Sequence[Mapping[str, Any]],
+        federation: Optional[Dict[str, Any]] = None,
+        *,
+        raw: Literal[False] = False,
+    ) -> Dict[str, List[Dict[str, Any]]]: ...
+
+    @overload
     def multi_search(
-        self, queries: Sequence[Mapping[str, Any]], federation: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, List[Dict[str, Any]]]:
+        self,
+        queries: Sequence[Mapping[str, Any]],
+        federation: Optional[Dict[str, Any]] = None,
+        *,
+        raw: Literal[True],
+    ) -> bytes: ...
+
+    def multi_search(
+        self,
+        queries: Sequence[Mapping[str, Any]],
+        federation: Optional[Dict[str, Any]] = None,
+        *,
+        raw: bool = False,
+    ) -> Union[Dict[str, List[Dict[str, Any]]], bytes]:
         """Multi-index search.
 
         Parameters
@@ -257,11 +420,15 @@ class Client:
         federation: (optional):
             Dictionary containing offset and limit
             https://www.meilisearch.com/docs/reference/api/multi_search
+        raw (optional):
+            Return the body of the response as bytes, without decoding it, for instance to
+            forward it untouched. Defaults to False.
 
         Returns
         -------
         results:
             Dictionary of results for each search query
+            The encoded response when raw is True.
 
         Raises
         ------
@@ -271,6 +438,7 @@ class Client:
         return self.http.post(
             f"{self.config.paths.multi_search}",
             body={"queries": queries, "federation": federation},
+            raw=raw,
         )
 
     def update_documents_by_function(
@@ -752,6 +920,8 @@ class Client:
         uid: int,
         timeout_in_ms: int = 5000,
         interval_in_ms: int = 50,
+        *,
+        polling: Optional[PollingStrategy] = None,
     ) -> Task:
         """Wait until Meilisearch processes a task until it fails or succeeds.
 
@@ -763,6 +933,10 @@ class Client:
             Time the method should wait before raising a MeilisearchTimeoutError
         interval_in_ms (optional):
             Time interval the method should wait (sleep) between requests
+        polling (optional):
+            PollingStrategy controlling the intervals between requests, overrides interval_in_ms.
+            Once enable_task_webhook is called, the task is awaited through the webhook
+            notifications unless a polling strategy is given.
 
         Returns
         -------
@@ -774,7 +948,53 @@ class Client:
         MeilisearchTimeoutError
             An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
         """
-        return self.task_handler.wait_for_task(uid, timeout_in_ms, interval_in_ms)
+        return self.task_handler.wait_for_task(uid, timeout_in_ms, interval_in_ms, polling=polling)
+
+    def wait_for_tasks(
+        self,
+        uids: Sequence[int],
+        timeout_in_ms: int = 5000,
+        interval_in_ms: int = 50,
+        *,
+        stop_on_failure: bool = False,
+        polling: Optional[PollingStrategy] = None,
+    ) -> List[Task]:
+        """Wait until Meilisearch processes several tasks until they fail or succeed.
+
+        The pending tasks are polled together with one request per interval.
+
+        Parameters
+        ----------
+        uids:
+            Identifiers of the tasks to wait for being processed.
+        timeout_in_ms (optional):
+            Time the method should wait for all the tasks before raising a MeilisearchTimeoutError.
+        interval_in_ms (optional):
+            Time interval the method should wait (sleep) between requests.
+        stop_on_failure (optional):
+            Return as soon as one of the tasks failed, without waiting for the others.
+        polling (optional):
+            PollingStrategy controlling the intervals between requests, overrides interval_in_ms.
+            Once enable_task_webhook is called, the tasks are awaited through the webhook
+            notifications unless a polling strategy is given.
+
+        Returns
+        -------
+        tasks:
+            List of Task instances of the processed tasks, in the order of uids.
+
+        Raises
+        ------
+        MeilisearchTimeoutError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return self.task_handler.wait_for_tasks(
+            uids,
+            timeout_in_ms,
+            interval_in_ms,
+            stop_on_failure=stop_on_failure,
+            polling=polling,
+        )
 
     def get_batches(self, parameters: Optional[MutableMapping[str, Any]] = None) -> BatchResults:
         """Get all batches.
@@ -993,9 +1213,9 @@ class Client:
                         break
 
                     try:
-                        chunk = json.loads(data)
+                        chunk = self.config.transport.json_codec.loads(data)
                         yield chunk
-                    except json.JSONDecodeError as e:
+                    except ValueError as e:
                         raise MeilisearchCommunicationError(
                             f"Failed to parse chat chunk: {e}"
                         ) from e
@@ -1,6 +1,122 @@
 from __future__ import annotations
 
-from typing import Optional, Tuple
+from typing import NamedTuple, Optional, Sequence, Tuple, Union
+
+from meilisearch._codec import JsonCodec, get_json_codec
+from meilisearch._nodes import LOAD_BALANCING
+from meilisearch.batching import SearchBatcher
+from meilisearch.cache import SearchCache
+from meilisearch.circuit_breaker import CircuitBreaker
+from meilisearch.hedging import HedgingPolicy
+from meilisearch.hooks import RequestHook
+from meilisearch.metrics import MetricsSink
+from meilisearch.retry import RetryPolicy
+from meilisearch.single_flight import SingleFlight
+
+
+class Middleware(NamedTuple):
+    """
+    Components taking part in every request sent by a client
+
+    Parameters
+    ----------
+    retry (optional):
+        RetryPolicy retrying the requests failing with a connection error, a timeout or a
+        transient status such as 503. Defaults to None, the requests are not retried.
+    circuit_breaker (optional):
+        CircuitBreaker making the requests fail fast with a MeilisearchCommunicationError while
+        Meilisearch keeps timing out or failing, instead of waiting for the timeout. Defaults to
+        None.
+    hedging (optional):
+        HedgingPolicy sending a duplicate of the searches and multi-searches still unanswered
+        after a percentile of the recent latencies, the first response wins. Defaults to None.
+    search_cache (optional):
+        SearchCache answering repeated searches, facet searches and multi-searches from memory.
+        The entries of an index are dropped when the client writes to it. Defaults to None.
+    search_batcher (optional):
+        SearchBatcher merging the searches sent at the same time by several threads or tasks
+        into one multi-search request. Defaults to None.
+    single_flight (optional):
+        SingleFlight sharing one request between the identical reads, such as settings, stats or
+        searches, sent at the same time by several threads or tasks. Defaults to None.
+    metrics (optional):
+        MetricsSinks receiving the duration of the serialization, network and decoding phases,
+        the body sizes, the status and the retries of every request, for instance a
+        PrometheusSink. Defaults to none.
+    hooks (optional):
+        RequestHooks called before every request with its method, path and headers, and after
+        it with its measures and its response, for instance a TracingHook opening a span per
+        request. Defaults to none.
+    """
+
+    retry: Optional[RetryPolicy] = None
+    circuit_breaker: Optional[CircuitBreaker] = None
+    hedging: Optional[HedgingPolicy] = None
+    search_cache: Optional[SearchCache] = None
+    search_batcher: Optional[SearchBatcher] = None
+    single_flight: Optional[SingleFlight] = None
+    metrics: Sequence[MetricsSink] = ()
+    hooks: Sequence[RequestHook] = ()
+
+
+class Transport:
+    """
+    How a client sends its requests to Meilisearch
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        keep_alive: bool = True,
+        json_codec: Optional[Union[str, JsonCodec]] = None,
+        compression: Optional[str] = None,
+        compression_level: int = -1,
+        compression_threshold: int = 1024,
+        load_balancing: str = "round_robin",
+    ) -> None:
+        """
+        Parameters
+        ----------
+        pool_size (optional):
+            Maximum number of connections kept open to Meilisearch by the connection pool.
+        keep_alive (optional):
+            Reuse connections between requests. When False every request opens a new connection.
+            Defaults to True.
+        json_codec (optional):
+            Codec encoding the request bodies and decoding the responses: "json", "orjson",
+            "msgspec", or "auto" to use the fastest one installed. A JsonCodec instance is also
+            accepted. Defaults to the standard library json module. Custom serializer classes
+            passed to the document methods keep using it.
+        compression (optional):
+            Content-Encoding used to compress the request bodies: "gzip" or "deflate". Defaults to
+            None, the bodies are sent uncompressed.
+        compression_level (optional):
+            Compression level from 0 to 9. Defaults to -1, the zlib default level.
+        compression_threshold (optional):
+            Bodies smaller than this number of bytes are sent uncompressed. Streamed bodies are
+            always compressed. Defaults to 1024.
+        load_balancing (optional):
+            How the reads are spread over several nodes: "round_robin", or "least_outstanding" to
+            pick the node with the fewest requests in flight. Defaults to "round_robin".
+        """
+        if compression not in Config.COMPRESSIONS:
+            raise ValueError(
+                f"Unsupported compression {compression!r}, expected one of: gzip, deflate"
+            )
+
+        if load_balancing not in LOAD_BALANCING:
+            raise ValueError(
+                f"Unsupported load_balancing {load_balancing!r}, expected one of: "
+                f"{', '.join(LOAD_BALANCING)}"
+            )
+
+        self.pool_size = pool_size
+        self.keep_alive = keep_alive
+        self.json_codec = get_json_codec(json_codec)
+        self.compression = compression
+        self.compression_level = compression_level
+        self.compression_threshold = compression_threshold
+        self.load_balancing = load_balancing
 
 
 class Config:
@@ -49,24 +165,46 @@ class Config:
         network = "network"
         webhooks = "webhooks"
 
+    COMPRESSIONS = (None, "gzip", "deflate")
+
     def __init__(
         self,
-        url: str,
+        url: Union[str, Sequence[str]],
         api_key: Optional[str] = None,
         timeout: Optional[int] = None,
         client_agents: Optional[Tuple[str, ...]] = None,
+        transport: Optional[Transport] = None,
+        middleware: Optional[Middleware] = None,
     ) -> None:
         """
         Parameters
         ----------
         url:
-            The url to the Meilisearch API (ex: http://localhost:7700)
+            The url to the Meilisearch API (ex: http://localhost:7700), or the urls of several
+            nodes. The first one is the primary receiving the writes and the task polling, the
+            searches and document reads are spread over all of them.
         api_key:
             The optional API key to access Meilisearch
+        transport (optional):
+            Transport settings: connection pool, JSON codec, compression and load balancing.
+            Defaults to Transport().
+        middleware (optional):
+            Middleware taking part in every request: retries, circuit breaker, hedging, search
+            cache and batching, single flight, metrics and hooks. Defaults to none of them.
         """
+        urls = (url,) if isinstance(url, str) else tuple(url)
+        if not urls:
+            raise ValueError("At least one url is required")
 
-        self.url = url
+        self.urls = urls
         self.api_key = api_key
         self.timeout = timeout
         self.client_agents = client_agents
+        self.transport = transport or Transport()
+        self.middleware = middleware or Middleware()
         self.paths = self.Paths()
+
+    @property
+    def url(self) -> str:
+        """Url of the primary node."""
+        return self.urls[0]
@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import json
 from functools import wraps
-from typing import TYPE_CHECKING, Any, Callable, TypeVar
+from inspect import iscoroutinefunction
+from typing import TYPE_CHECKING, Any, Callable, TypeVar, Union
 
 from requests import Response
 
 if TYPE_CHECKING:  # pragma: no cover
+    import httpx
+
     from meilisearch.client import Client
     from meilisearch.index import Index
     from meilisearch.task import TaskHandler
@@ -28,7 +31,7 @@ class MeilisearchError(Exception):  # pragma: no cover
 class MeilisearchApiError(MeilisearchError):
     """Error sent by Meilisearch API"""
 
-    def __init__(self, error: str, request: Response) -> None:
+    def __init__(self, error: str, request: Union[Response, httpx.Response]) -> None:
         self.status_code = request.status_code
         self.code = None
         self.link = None
@@ -66,6 +69,18 @@ class MeilisearchTimeoutError(MeilisearchError):
 
 
 def version_error_hint_message(func: Callable[..., T]) -> Callable[..., T]:
+    if iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return await func(*args, **kwargs)
+            except MeilisearchApiError as exc:
+                exc.message = f"{exc.message}. Hint: It might not be working because you're not up to date with the Meilisearch version that {func.__name__} call requires."
+                raise exc
+
+        return async_wrapper  # type: ignore[return-value]
+
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
         try:
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import os
+from typing import IO, Any, Iterable, List, Mapping, Optional, Sequence, Union
+
+from meilisearch._codec import JsonCodec
+from meilisearch._httprequests import _compressor
+from meilisearch.config import Config
+
+
+def range_filters(attribute: str, boundaries: Sequence[Union[int, float]]) -> List[str]:
+    """Split the documents into disjoint partitions on a filterable numeric attribute.
+
+    Parameters
+    ----------
+    attribute:
+        Filterable attribute the ranges are built on.
+    boundaries:
+        Increasing values separating the partitions. n boundaries give n + 1 partitions, the
+        first one below the first boundary and the last one from the last boundary on.
+
+    Returns
+    -------
+    filters:
+        One filter per partition, to be passed as the `partitions` of an export. Documents
+        without the attribute are not part of any partition.
+    """
+    if list(boundaries) != sorted(boundaries):
+        raise ValueError("boundaries should be sorted in increasing order")
+
+    if not boundaries:
+        return [f"{attribute} EXISTS"]
+    filters = [f"{attribute} < {boundaries[0]}"]
+    for low, high in zip(boundaries, boundaries[1:]):
+        filters.append(f"{attribute} >= {low} AND {attribute} < {high}")
+    filters.append(f"{attribute} >= {boundaries[-1]}")
+    return filters
+
+
+class NdjsonWriter:
+    """
+    Write documents to a file as NDJSON, one document per line
+
+    The lines can be compressed on the fly with gzip or deflate. A path is opened and closed by
+    the writer, a file object opened in binary mode is written to and left open.
+    """
+
+    def __init__(
+        self,
+        file: Union[str, os.PathLike, IO[bytes]],
+        compression: Optional[str] = None,
+        compression_level: int = -1,
+        codec: Optional[JsonCodec] = None,
+    ) -> None:
+        if compression not in Config.COMPRESSIONS:
+            raise ValueError(
+                f"Unsupported compression {compression!r}, expected one of: gzip, deflate"
+            )
+
+        self.codec = codec or JsonCodec()
+        self.documents = 0
+        self._owned = isinstance(file, (str, os.PathLike))
+        # The file stays open across the writes, close() closes it.
+        self._file = (
+            open(file, "wb")  # pylint: disable=consider-using-with
+            if isinstance(file, (str, os.PathLike))
+            else file
+        )
+        self._compressor: Any = (
+            _compressor(compression, compression_level) if compression is not None else None
+        )
+
+    def write(self, documents: Iterable[Mapping[str, Any]]) -> None:
+        """Append the documents to the file."""
+        lines = [self.codec.dumps(document) for document in documents]
+        if not lines:
+            return
+        data = b"\n".join(lines) + b"\n"
+        if self._compressor is not None:
+            data = self._compressor.compress(data)
+        self._file.write(data)
+        self.documents += len(lines)
+
+    def close(self) -> None:
+        """Flush the compressed stream and close the file if the writer opened it."""
+        if self._compressor is not None:
+            self._file.write(self._compressor.flush())
+            self._compressor = None
+        if self._owned:
+            self._file.close()
+        else:
+            self._file.flush()
+
+    def __enter__(self) -> NdjsonWriter:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import re
+import threading
+from collections import deque
+from typing import Deque, Optional
+
+# Only the searches are hedged, they are read-only and sensitive to the tail latency.
+_HEDGED_PATH = re.compile(r"^(multi-search|indexes/[^/]+/search)$")
+
+
+class HedgingPolicy:
+    """
+    Send a second copy of slow searches and keep the first response
+
+    When a search has not been answered after the `percentile` of the latencies observed
+    recently, a duplicate request is sent, to the next node when several urls are configured.
+    The first response is returned and the other request is cancelled, or its response ignored
+    with the sync client. At most `max_rate` of the searches are hedged so the extra load stays
+    bounded while a node is slow.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95,
+        min_delay_in_ms: float = 10,
+        max_delay_in_ms: float = 1000,
+        initial_delay_in_ms: float = 100,
+        max_rate: float = 0.05,
+        burst: int = 10,
+        window: int = 1000,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        percentile (optional):
+            Percentile of the recent search latencies after which a search is hedged.
+        min_delay_in_ms (optional):
+            Lower bound of the hedging delay.
+        max_delay_in_ms (optional):
+            Upper bound of the hedging delay.
+        initial_delay_in_ms (optional):
+            Hedging delay used until enough latencies were observed.
+        max_rate (optional):
+            Maximum fraction of the searches that are hedged.
+        burst (optional):
+            Number of hedges allowed in a row before the rate limit applies.
+        window (optional):
+            Number of recent latencies the percentile is computed from.
+        """
+        if not 0 < percentile < 100:
+            raise ValueError("percentile should be between 0 and 100")
+        if not 0 <= max_rate <= 1:
+            raise ValueError("max_rate should be between 0 and 1")
+        if min_delay_in_ms < 0 or max_delay_in_ms < min_delay_in_ms:
+            raise ValueError("The delays should satisfy 0 <= min_delay_in_ms <= max_delay_in_ms")
+
+        self.min_delay_in_ms = min_delay_in_ms
+        self.max_delay_in_ms = max_delay_in_ms
+        self.initial_delay_in_ms = initial_delay_in_ms
+        self._latencies = _LatencyWindow(percentile, window)
+        self._budget = _TokenBucket(max_rate, burst)
+        self._lock = threading.Lock()
+
+    def applies(self, method: str, path: str) -> bool:
+        """Whether the request is a search that can be hedged."""
+        return method.upper() == "POST" and bool(_HEDGED_PATH.match(path.split("?", 1)[0]))
+
+    def delay(self) -> float:
+        """Time to wait, in milliseconds, before hedging a search."""
+        with self._lock:
+            delay = self._latencies.value()
+        if delay is None:
+            delay = self.initial_delay_in_ms
+        return min(max(delay, self.min_delay_in_ms), self.max_delay_in_ms)
+
+    def record(self, latency_in_ms: float) -> None:
+        """Record the latency of a search and earn the budget of future hedges."""
+        with self._lock:
+            self._latencies.add(latency_in_ms)
+            self._budget.earn()
+
+    def can_hedge(self) -> bool:
+        """Whether the budget allows a hedge, without spending it."""
+        with self._lock:
+            return self._budget.tokens >= 1
+
+    def try_hedge(self) -> bool:
+        """Spend the budget of one hedge, False when the rate limit is reached."""
+        with self._lock:
+            return self._budget.spend()
+
+
+class _LatencyWindow:
+    """Recent latencies and their percentile, recomputed once every `refresh` new latencies."""
+
+    def __init__(self, percentile: float, size: int) -> None:
+        self.percentile = percentile
+        self.latencies: Deque[float] = deque(maxlen=size)
+        self.refresh = max(size // 20, 1)
+        self._value: Optional[float] = None
+        self._stale = 0
+
+    def add(self, latency_in_ms: float) -> None:
+        self.latencies.append(latency_in_ms)
+        self._stale += 1
+
+    def value(self) -> Optional[float]:
+        # Below a few dozen samples the percentile is mostly noise.
+        if len(self.latencies) < 20:
+            return None
+        if self._value is None or self._stale >= self.refresh:
+            latencies = sorted(self.latencies)
+            position = min(int(len(latencies) * self.percentile / 100), len(latencies) - 1)
+            self._value, self._stale = latencies[position], 0
+        return self._value
+
+
+class _TokenBucket:
+    """Budget of hedges, earning `rate` of a hedge per search up to `burst` hedges."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+
+    def earn(self) -> None:
+        self.tokens = min(self.tokens + self.rate, self.burst)
+
+    def spend(self) -> bool:
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
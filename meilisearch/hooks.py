@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+from meilisearch.metrics import RequestSample
+
+
+class RequestHook:
+    """
+    Observe every request sent to Meilisearch by a client
+
+    `before_request` is called once per request, before its body is encoded, and
+    `after_response` once it is answered or has failed, retries included. Whatever
+    `before_request` returns is handed back to `after_response`, to carry a span or a start time
+    from one to the other. Both do nothing by default, subclasses override what they need.
+    An error raised by `after_response` is raised by the request only when the request
+    succeeded, the error of a failed request is never replaced by it.
+    """
+
+    # pylint: disable=unused-argument
+
+    def before_request(self, sample: RequestSample, headers: Dict[str, str]) -> Any:
+        """Called before the request is sent.
+
+        Parameters
+        ----------
+        sample:
+            Method, path and route template of the request. Its measures are filled in while
+            the request is sent.
+        headers:
+            Headers of the request, headers added to it are sent with every attempt.
+
+        Returns
+        -------
+        state:
+            Passed as is to `after_response`.
+        """
+        return None
+
+    def after_response(
+        self,
+        sample: RequestSample,
+        response: Optional[Any],
+        error: Optional[BaseException],
+        state: Any,
+    ) -> None:
+        """Called once the request is answered or has failed.
+
+        Parameters
+        ----------
+        sample:
+            Measures of the request: status, body sizes, retries and time spent on each phase.
+        response:
+            Last response received, a requests.Response or an httpx.Response for the async
+            client, None when Meilisearch could not be reached.
+        error:
+            Exception that failed the request, None when it succeeded.
+        state:
+            Value returned by `before_request`.
+        """
@@ -1,28 +1,51 @@
 from __future__ import annotations
 
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
 from datetime import datetime
+from functools import partial
+from itertools import chain, islice
 from typing import (
+    IO,
     TYPE_CHECKING,
     Any,
+    Callable,
+    Deque,
     Dict,
     Generator,
+    Iterable,
+    Iterator,
     List,
+    Literal,
     Mapping,
     MutableMapping,
     Optional,
     Sequence,
     Type,
+    TypeVar,
     Union,
+    overload,
 )
 from urllib import parse
 from warnings import warn
 
 from camel_converter import to_snake
 
+from meilisearch._codec import JsonCodec
 from meilisearch._httprequests import HttpRequests
-from meilisearch._utils import iso_to_date_time
+from meilisearch._utils import (
+    DEFAULT_CHUNK_SIZE,
+    PayloadBatcher,
+    iso_to_date_time,
+    open_binary,
+    read_chunks,
+    split_records,
+)
 from meilisearch.config import Config
 from meilisearch.errors import version_error_hint_message
+from meilisearch.export import NdjsonWriter
 from meilisearch.models.document import Document, DocumentsResults
 from meilisearch.models.embedders import (
     CompositeEmbedder,
@@ -44,11 +67,14 @@ from meilisearch.models.index import (
     TypoTolerance,
 )
 from meilisearch.models.task import Task, TaskInfo, TaskResults
+from meilisearch.polling import PollingStrategy
 from meilisearch.task import TaskHandler
 
 if TYPE_CHECKING:
     from json import JSONEncoder
 
+T = TypeVar("T")
+
 
 # pylint: disable=too-many-public-methods, too-many-lines
 class Index:
@@ -66,6 +92,9 @@ class Index:
         primary_key: Optional[str] = None,
         created_at: Optional[Union[datetime, str]] = None,
         updated_at: Optional[Union[datetime, str]] = None,
+        *,
+        http: Optional[HttpRequests] = None,
+        task_handler: Optional[TaskHandler] = None,
     ) -> None:
         """
         Parameters
@@ -76,10 +105,17 @@ class Index:
             UID of the index on which to perform the index actions.
         primary_key:
             Primary-key of the index.
+        http (optional):
+            Transport to reuse, usually the one of the Client. A new one is created if omitted.
+        task_handler (optional):
+            TaskHandler to reuse, usually the one of the Client so that the waits for tasks go
+            through its task webhook once enabled. A new one is created if omitted.
         """
         self.config = config
-        self.http = HttpRequests(config)
-        self.task_handler = TaskHandler(config)
+        self.http = http if http is not None else HttpRequests(config)
+        self.task_handler = (
+            task_handler if task_handler is not None else TaskHandler(config, self.http)
+        )
         self.uid = uid
         self.primary_key = primary_key
         self.created_at = iso_to_date_time(created_at)
@@ -153,7 +189,13 @@ class Index:
         return self.fetch_info().primary_key
 
     @staticmethod
-    def create(config: Config, uid: str, options: Optional[Mapping[str, Any]] = None) -> TaskInfo:
+    def create(
+        config: Config,
+        uid: str,
+        options: Optional[Mapping[str, Any]] = None,
+        *,
+        http: Optional[HttpRequests] = None,
+    ) -> TaskInfo:
         """Create the index.
 
         Parameters
@@ -162,6 +204,8 @@ class Index:
             UID of the index.
         options:
             Options passed during index creation (ex: { 'primaryKey': 'name' }).
+        http (optional):
+            Transport to reuse, a new one is created from the config if omitted.
 
         Returns
         -------
@@ -177,7 +221,9 @@ class Index:
         if options is None:
             options = {}
         payload = {**options, "uid": uid}
-        task = HttpRequests(config).post(config.paths.index, payload)
+        if http is None:
+            http = HttpRequests(config)
+        task = http.post(config.paths.index, payload)
 
         return TaskInfo(**task)
 
@@ -235,6 +281,8 @@ class Index:
         uid: int,
         timeout_in_ms: int = 5000,
         interval_in_ms: int = 50,
+        *,
+        polling: Optional[PollingStrategy] = None,
     ) -> Task:
         """Wait until Meilisearch processes a task until it fails or succeeds.
 
@@ -246,6 +294,10 @@ class Index:
             time the method should wait before raising a MeilisearchTimeoutError.
         interval_in_ms (optional):
             time interval the method should wait (sleep) between requests.
+        polling (optional):
+            PollingStrategy controlling the intervals between requests, overrides interval_in_ms.
+            Once the Client of this index enabled its task webhook, the task is awaited through
+            the webhook notifications unless a polling strategy is given.
 
         Returns
         -------
@@ -257,7 +309,53 @@ class Index:
         MeilisearchTimeoutError
             An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
         """
-        return self.task_handler.wait_for_task(uid, timeout_in_ms, interval_in_ms)
+        return self.task_handler.wait_for_task(uid, timeout_in_ms, interval_in_ms, polling=polling)
+
+    def wait_for_tasks(
+        self,
+        uids: Sequence[int],
+        timeout_in_ms: int = 5000,
+        interval_in_ms: int = 50,
+        *,
+        stop_on_failure: bool = False,
+        polling: Optional[PollingStrategy] = None,
+    ) -> List[Task]:
+        """Wait until Meilisearch processes several tasks until they fail or succeed.
+
+        The pending tasks are polled together with one request per interval.
+
+        Parameters
+        ----------
+        uids:
+            identifiers of the tasks to wait for being processed.
+        timeout_in_ms (optional):
+            time the method should wait for all the tasks before raising a MeilisearchTimeoutError.
+        interval_in_ms (optional):
+            time interval the method should wait (sleep) between requests.
+        stop_on_failure (optional):
+            return as soon as one of the tasks failed, without waiting for the others.
+        polling (optional):
+            PollingStrategy controlling the intervals between requests, overrides interval_in_ms.
+            Once the Client of this index enabled its task webhook, the tasks are awaited through
+            the webhook notifications unless a polling strategy is given.
+
+        Returns
+        -------
+        tasks:
+            List of Task instances of the processed tasks, in the order of uids.
+
+        Raises
+        ------
+        MeilisearchTimeoutError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return self.task_handler.wait_for_tasks(
+            uids,
+            timeout_in_ms,
+            interval_in_ms,
+            stop_on_failure=stop_on_failure,
+            polling=polling,
+        )
 
     def get_stats(self) -> IndexStats:
         """Get stats of the index.
@@ -278,8 +376,24 @@ class Index:
         stats = self.http.get(f"{self.config.paths.index}/{self.uid}/{self.config.paths.stat}")
         return IndexStats(**stats)
 
+    @overload
+    def search(
+        self,
+        query: str,
+        opt_params: Optional[Mapping[str, Any]] = None,
+        *,
+        raw: Literal[False] = False,
+    ) -> Dict[str, Any]: ...
+
+    @overload
+    def search(
+        self, query: str, opt_params: Optional[Mapping[str, Any]] = None, *, raw: Literal[True]
+    ) -> bytes: ...
+
     @version_error_hint_message
-    def search(self, query: str, opt_params: Optional[Mapping[str, Any]] = None) -> Dict[str, Any]:
+    def search(
+        self, query: str, opt_params: Optional[Mapping[str, Any]] = None, *, raw: bool = False
+    ) -> Union[Dict[str, Any], bytes]:
         """Search in the index.
 
         https://www.meilisearch.com/docs/reference/api/search
@@ -297,11 +411,15 @@ class Index:
             - filter: Filter queries by an attribute's value
             - limit: Maximum number of documents returned
             - offset: Number of documents to skip
+        raw (optional):
+            Return the body of the response as bytes, without decoding it, for instance to
+            forward it untouched. Defaults to False.
 
         Returns
         -------
         results:
-            Dictionary with hits, offset, limit, processingTime and initial query
+            Dictionary with hits, offset, limit, processingTime and initial query, or the
+            encoded response when raw is True
 
         Raises
         ------
@@ -316,6 +434,7 @@ class Index:
         return self.http.post(
             f"{self.config.paths.index}/{self.uid}/{self.config.paths.search}",
             body=body,
+            raw=raw,
         )
 
     @version_error_hint_message
@@ -383,10 +502,23 @@ class Index:
         )
         return Document(document)
 
+    @overload
+    def get_documents(
+        self,
+        parameters: Optional[MutableMapping[str, Any]] = None,
+        *,
+        raw: Literal[False] = False,
+    ) -> DocumentsResults: ...
+
+    @overload
+    def get_documents(
+        self, parameters: Optional[MutableMapping[str, Any]] = None, *, raw: Literal[True]
+    ) -> bytes: ...
+
     @version_error_hint_message
     def get_documents(
-        self, parameters: Optional[MutableMapping[str, Any]] = None
-    ) -> DocumentsResults:
+        self, parameters: Optional[MutableMapping[str, Any]] = None, *, raw: bool = False
+    ) -> Union[DocumentsResults, bytes]:
         """Get a set of documents from the index.
 
         Parameters
@@ -394,6 +526,9 @@ class Index:
         parameters (optional):
             parameters accepted by the get documents route: https://www.meilisearch.com/docs/reference/api/documents#get-documents
             Note: The filter parameter is only available in Meilisearch >= 1.2.0.
+        raw (optional):
+            Return the body of the response as bytes, without decoding it, for instance to
+            forward it untouched. Defaults to False.
 
         Returns
         -------
@@ -404,6 +539,7 @@ class Index:
             - limit
             - results : list of Document instances containing the documents information
             - sort:  A list of attributes written as an array or as a comma-separated string
+            The encoded response when raw is True.
 
         Raises
         ------
@@ -421,8 +557,136 @@ class Index:
         response = self.http.post(
             f"{self.config.paths.index}/{self.uid}/{self.config.paths.document}/fetch",
             body=parameters,
+            raw=raw,
+        )
+        return response if raw else DocumentsResults(response)
+
+    def iter_documents(
+        self,
+        filter: Optional[  # pylint: disable=redefined-builtin
+            Union[str, List[Union[str, List[str]]]]
+        ] = None,
+        fields: Optional[List[str]] = None,
+        page_size: int = 1000,
+        prefetch: int = 2,
+    ) -> Iterator[Document]:
+        """Iterate over the documents of the index, page by page.
+
+        The first page gives the total number of documents. The next pages are then fetched in
+        the background, at most `prefetch` pages ahead of the one being consumed, and the
+        iteration stops once `total` documents were requested.
+
+        Parameters
+        ----------
+        filter (optional):
+            Filter selecting the documents. Only available in Meilisearch >= 1.2.0.
+        fields (optional):
+            Attributes returned for each document, all of them by default.
+        page_size (optional):
+            Number of documents fetched per request.
+        prefetch (optional):
+            Maximum number of pages fetched ahead of the caller.
+
+        Returns
+        -------
+        documents:
+            Iterator yielding Document instances.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        if page_size < 1:
+            raise ValueError("page_size should be greater than or equal to 1")
+        if prefetch < 1:
+            raise ValueError("prefetch should be greater than or equal to 1")
+
+        parameters: Dict[str, Any] = {"limit": page_size}
+        if filter is not None:
+            parameters["filter"] = filter
+        if fields is not None:
+            parameters["fields"] = fields
+
+        return _iter_documents(
+            lambda offset: self.get_documents({**parameters, "offset": offset}), page_size, prefetch
         )
-        return DocumentsResults(response)
+
+    def export_documents(
+        self,
+        file: Union[str, os.PathLike, IO[bytes]],
+        *,
+        partitions: Optional[Sequence[Union[str, List[Union[str, List[str]]]]]] = None,
+        fields: Optional[List[str]] = None,
+        page_size: int = 1000,
+        workers: int = 4,
+        compression: Optional[str] = None,
+    ) -> int:
+        """Export the documents of the index to an NDJSON file.
+
+        The pages of documents are fetched by `workers` concurrent requests and streamed to the
+        file in order, so at most `workers` pages are held in memory. Without `partitions` the
+        pages are offset ranges of the whole index. Each partition is a filter paged through on its
+        own, for instance the ranges built by `meilisearch.export.range_filters`, which keeps the
+        offsets small on large indexes. The partitions should be disjoint and cover every document
+        to export. Documents written to the index during the export may be missed or duplicated.
+
+        Parameters
+        ----------
+        file:
+            Path of the file, or a file object opened in binary mode.
+        partitions (optional):
+            Filters splitting the documents into disjoint partitions. The attributes they use must
+            be filterable.
+        fields (optional):
+            Attributes exported for each document, all of them by default.
+        page_size (optional):
+            Number of documents fetched per request.
+        workers (optional):
+            Number of pages fetched concurrently. Above the `pool_size` of the client, the
+            requests wait for a free connection.
+        compression (optional):
+            Compress the file with "gzip" or "deflate". Defaults to None, uncompressed.
+
+        Returns
+        -------
+        documents:
+            Number of documents written.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        if page_size < 1:
+            raise ValueError("page_size should be greater than or equal to 1")
+        if workers < 1:
+            raise ValueError("workers should be greater than or equal to 1")
+
+        path = f"{self.config.paths.index}/{self.uid}/{self.config.paths.document}/fetch"
+
+        def fetch(partition: Any, offset: int, limit: int) -> Dict[str, Any]:
+            body: Dict[str, Any] = {"offset": offset, "limit": limit}
+            if partition is not None:
+                body["filter"] = partition
+            if fields is not None:
+                body["fields"] = fields
+            return self.http.post(path, body=body)
+
+        filters = list(partitions) if partitions is not None else [None]
+        with NdjsonWriter(file, compression, codec=self.config.transport.json_codec) as writer:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="meilisearch-export"
+            ) as executor:
+                # A page of 0 documents only returns the size of the partition.
+                totals = executor.map(lambda partition: fetch(partition, 0, 0)["total"], filters)
+                pages = (
+                    partial(fetch, partition, offset, page_size)
+                    for partition, total in zip(filters, totals)
+                    for offset in range(0, total, page_size)
+                )
+                _write_pages(executor, pages, workers, writer)
+        return writer.documents
 
     def get_similar_documents(self, parameters: Mapping[str, Any]) -> Dict[str, Any]:
         """Get the documents similar to a document.
@@ -484,18 +748,22 @@ class Index:
 
     def add_documents_in_batches(
         self,
-        documents: Sequence[Mapping[str, Any]],
+        documents: Iterable[Mapping[str, Any]],
         batch_size: int = 1000,
         primary_key: Optional[str] = None,
         *,
         serializer: Optional[Type[JSONEncoder]] = None,
+        concurrency: int = 1,
+        max_payload_size: Optional[int] = None,
     ) -> List[TaskInfo]:
         """Add documents to the index in batches.
 
         Parameters
         ----------
         documents:
-            List of documents. Each document should be a dictionary.
+            List, iterable or generator of documents. Each document should be a dictionary.
+            The documents are consumed lazily, one batch at a time, so a generator or a database
+            cursor can be uploaded without loading the whole dataset in memory.
         batch_size (optional):
             The number of documents that should be included in each batch. Default = 1000
         primary_key (optional):
@@ -503,6 +771,16 @@ class Index:
         serializer (optional):
             A custom JSONEncode to handle serializing fields that the build in json.dumps
             cannot handle, for example UUID and datetime.
+        concurrency (optional):
+            The number of batches uploaded at the same time. Default = 1, the batches are sent one
+            after another. Keep it below the pool_size of the client to reuse the connections.
+            With more than one batch in flight Meilisearch may enqueue them out of order, the
+            returned list still follows the order of the batches.
+        max_payload_size (optional):
+            The maximum size in bytes of the JSON payload of a batch. When set, the batches are cut
+            as soon as the next document would not fit anymore, batch_size still caps the number of
+            documents in a batch. Each document is serialized only once. A document larger than
+            max_payload_size is sent alone. Default = None, the batches are built from batch_size.
 
         Returns
         -------
@@ -517,13 +795,24 @@ class Index:
             Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
         """
 
-        tasks: List[TaskInfo] = []
+        if max_payload_size is not None:
+
+            def send_payload(payload: bytes) -> TaskInfo:
+                return self.add_documents_json(payload, primary_key)
 
-        for document_batch in self._batch(documents, batch_size):
-            task = self.add_documents(document_batch, primary_key, serializer=serializer)
-            tasks.append(task)
+            payloads = self._batch_payloads(
+                documents,
+                batch_size,
+                max_payload_size,
+                serializer,
+                self.config.transport.json_codec,
+            )
+            return _send_batches(send_payload, payloads, concurrency)
+
+        def send(document_batch: Sequence[Mapping[str, Any]]) -> TaskInfo:
+            return self.add_documents(document_batch, primary_key, serializer=serializer)
 
-        return tasks
+        return _send_batches(send, self._batch(documents, batch_size), concurrency)
 
     def add_documents_json(
         self,
@@ -657,6 +946,99 @@ class Index:
         response = self.http.post(url, str_documents, content_type, serializer=serializer)
         return TaskInfo(**response)
 
+    def add_documents_file(
+        self,
+        file: Union[str, os.PathLike, IO[bytes]],
+        content_type: str = "application/x-ndjson",
+        primary_key: Optional[str] = None,
+        csv_delimiter: Optional[str] = None,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> TaskInfo:
+        """Add documents to the index from a JSON, NDJSON or CSV file.
+
+        The file is streamed with chunked transfer encoding, it is never fully loaded in memory.
+
+        Parameters
+        ----------
+        file:
+            Path of the file, or a file object opened in binary mode.
+        content_type (optional):
+            The content MIME type: 'application/json', 'application/x-ndjson', or 'text/csv'.
+            Default = 'application/x-ndjson'
+        primary_key (optional):
+            The primary-key used in index. Ignored if already set up.
+        csv_delimiter (optional):
+            One ASCII character used to customize the delimiter for CSV.
+            Note: The csv delimiter can only be used with the Content-Type text/csv.
+        chunk_size (optional):
+            The number of bytes read from the file and sent at once. Default = 65536
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        url = self._build_url(primary_key=primary_key, csv_delimiter=csv_delimiter)
+        with open_binary(file) as stream:
+            response = self.http.post(url, read_chunks(stream, chunk_size), content_type)
+        return TaskInfo(**response)
+
+    def add_documents_file_in_batches(
+        self,
+        file: Union[str, os.PathLike, IO[bytes]],
+        batch_size: int = 1000,
+        content_type: str = "application/x-ndjson",
+        primary_key: Optional[str] = None,
+        csv_delimiter: Optional[str] = None,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> List[TaskInfo]:
+        """Add documents to the index from an NDJSON or CSV file, in batches.
+
+        The file is split on line, or row, boundaries and every batch is streamed with chunked
+        transfer encoding as its own task, so memory stays flat whatever the size of the file.
+
+        Parameters
+        ----------
+        file:
+            Path of the file, or a file object opened in binary mode.
+        batch_size (optional):
+            The number of lines, or CSV rows, that should be included in each batch. The CSV
+            header is repeated in every batch. Default = 1000
+        content_type (optional):
+            The content MIME type: 'application/x-ndjson' or 'text/csv'.
+            Default = 'application/x-ndjson'
+        primary_key (optional):
+            The primary-key used in index. Ignored if already set up.
+        csv_delimiter (optional):
+            One ASCII character used to customize the delimiter for CSV.
+            Note: The csv delimiter can only be used with the Content-Type text/csv.
+        chunk_size (optional):
+            The number of bytes read from the file and sent at once. Default = 65536
+
+        Returns
+        -------
+        tasks_info:
+            List of TaskInfo instances containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        url = self._build_url(primary_key=primary_key, csv_delimiter=csv_delimiter)
+        with open_binary(file) as stream:
+            batches = self._split_file(stream, batch_size, content_type, chunk_size)
+            return [TaskInfo(**self.http.post(url, batch, content_type)) for batch in batches]
+
     def update_documents(
         self,
         documents: Sequence[Mapping[str, Any]],
@@ -720,7 +1102,7 @@ class Index:
 
     def update_documents_json(
         self,
-        str_documents: str,
+        str_documents: Union[str, bytes],
         primary_key: Optional[str] = None,
         *,
         serializer: Optional[Type[JSONEncoder]] = None,
@@ -784,7 +1166,7 @@ class Index:
 
     def update_documents_raw(
         self,
-        str_documents: str,
+        str_documents: Union[str, bytes],
         primary_key: Optional[str] = None,
         content_type: Optional[str] = None,
         csv_delimiter: Optional[str] = None,
@@ -823,19 +1205,117 @@ class Index:
         response = self.http.put(url, str_documents, content_type, serializer=serializer)
         return TaskInfo(**response)
 
+    def update_documents_file(
+        self,
+        file: Union[str, os.PathLike, IO[bytes]],
+        content_type: str = "application/x-ndjson",
+        primary_key: Optional[str] = None,
+        csv_delimiter: Optional[str] = None,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> TaskInfo:
+        """Update documents in the index from a JSON, NDJSON or CSV file.
+
+        The file is streamed with chunked transfer encoding, it is never fully loaded in memory.
+
+        Parameters
+        ----------
+        file:
+            Path of the file, or a file object opened in binary mode.
+        content_type (optional):
+            The content MIME type: 'application/json', 'application/x-ndjson', or 'text/csv'.
+            Default = 'application/x-ndjson'
+        primary_key (optional):
+            The primary-key used in index. Ignored if already set up.
+        csv_delimiter (optional):
+            One ASCII character used to customize the delimiter for CSV.
+            Note: The csv delimiter can only be used with the Content-Type text/csv.
+        chunk_size (optional):
+            The number of bytes read from the file and sent at once. Default = 65536
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        url = self._build_url(primary_key=primary_key, csv_delimiter=csv_delimiter)
+        with open_binary(file) as stream:
+            response = self.http.put(url, read_chunks(stream, chunk_size), content_type)
+        return TaskInfo(**response)
+
+    def update_documents_file_in_batches(
+        self,
+        file: Union[str, os.PathLike, IO[bytes]],
+        batch_size: int = 1000,
+        content_type: str = "application/x-ndjson",
+        primary_key: Optional[str] = None,
+        csv_delimiter: Optional[str] = None,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> List[TaskInfo]:
+        """Update documents in the index from an NDJSON or CSV file, in batches.
+
+        The file is split on line, or row, boundaries and every batch is streamed with chunked
+        transfer encoding as its own task, so memory stays flat whatever the size of the file.
+
+        Parameters
+        ----------
+        file:
+            Path of the file, or a file object opened in binary mode.
+        batch_size (optional):
+            The number of lines, or CSV rows, that should be included in each batch. The CSV
+            header is repeated in every batch. Default = 1000
+        content_type (optional):
+            The content MIME type: 'application/x-ndjson' or 'text/csv'.
+            Default = 'application/x-ndjson'
+        primary_key (optional):
+            The primary-key used in index. Ignored if already set up.
+        csv_delimiter (optional):
+            One ASCII character used to customize the delimiter for CSV.
+            Note: The csv delimiter can only be used with the Content-Type text/csv.
+        chunk_size (optional):
+            The number of bytes read from the file and sent at once. Default = 65536
+
+        Returns
+        -------
+        tasks_info:
+            List of TaskInfo instances containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        url = self._build_url(primary_key=primary_key, csv_delimiter=csv_delimiter)
+        with open_binary(file) as stream:
+            batches = self._split_file(stream, batch_size, content_type, chunk_size)
+            return [TaskInfo(**self.http.put(url, batch, content_type)) for batch in batches]
+
     def update_documents_in_batches(
         self,
-        documents: Sequence[Mapping[str, Any]],
+        documents: Iterable[Mapping[str, Any]],
         batch_size: int = 1000,
         primary_key: Optional[str] = None,
         serializer: Optional[Type[JSONEncoder]] = None,
+        *,
+        concurrency: int = 1,
+        max_payload_size: Optional[int] = None,
     ) -> List[TaskInfo]:
         """Update documents to the index in batches.
 
         Parameters
         ----------
         documents:
-            List of documents. Each document should be a dictionary.
+            List, iterable or generator of documents. Each document should be a dictionary.
+            The documents are consumed lazily, one batch at a time, so a generator or a database
+            cursor can be uploaded without loading the whole dataset in memory.
         batch_size (optional):
             The number of documents that should be included in each batch. Default = 1000
         primary_key (optional):
@@ -843,6 +1323,16 @@ class Index:
         serializer (optional):
             A custom JSONEncode to handle serializing fields that the build in json.dumps
             cannot handle, for example UUID and datetime.
+        concurrency (optional):
+            The number of batches uploaded at the same time. Default = 1, the batches are sent one
+            after another. Keep it below the pool_size of the client to reuse the connections.
+            With more than one batch in flight Meilisearch may enqueue them out of order, the
+            returned list still follows the order of the batches.
+        max_payload_size (optional):
+            The maximum size in bytes of the JSON payload of a batch. When set, the batches are cut
+            as soon as the next document would not fit anymore, batch_size still caps the number of
+            documents in a batch. Each document is serialized only once. A document larger than
+            max_payload_size is sent alone. Default = None, the batches are built from batch_size.
 
         Returns
         -------
@@ -857,13 +1347,24 @@ class Index:
             Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
         """
 
-        tasks = []
+        if max_payload_size is not None:
 
-        for document_batch in self._batch(documents, batch_size):
-            update_task = self.update_documents(document_batch, primary_key, serializer=serializer)
-            tasks.append(update_task)
+            def send_payload(payload: bytes) -> TaskInfo:
+                return self.update_documents_json(payload, primary_key)
+
+            payloads = self._batch_payloads(
+                documents,
+                batch_size,
+                max_payload_size,
+                serializer,
+                self.config.transport.json_codec,
+            )
+            return _send_batches(send_payload, payloads, concurrency)
 
-        return tasks
+        def send(document_batch: Sequence[Mapping[str, Any]]) -> TaskInfo:
+            return self.update_documents(document_batch, primary_key, serializer=serializer)
+
+        return _send_batches(send, self._batch(documents, batch_size), concurrency)
 
     def delete_document(self, document_id: Union[str, int]) -> TaskInfo:
         """Delete one document from the index.
@@ -2318,11 +2819,48 @@ class Index:
 
     @staticmethod
     def _batch(
-        documents: Sequence[Mapping[str, Any]], batch_size: int
+        documents: Iterable[Mapping[str, Any]], batch_size: int
     ) -> Generator[Sequence[Mapping[str, Any]], None, None]:
-        total_len = len(documents)
-        for i in range(0, total_len, batch_size):
-            yield documents[i : i + batch_size]
+        if batch_size < 1:
+            raise ValueError("batch_size should be greater than or equal to 1")
+
+        if isinstance(documents, Sequence):
+            for i in range(0, len(documents), batch_size):
+                yield documents[i : i + batch_size]
+            return
+
+        iterator = iter(documents)
+        while batch := list(islice(iterator, batch_size)):
+            yield batch
+
+    @staticmethod
+    def _batch_payloads(
+        documents: Iterable[Mapping[str, Any]],
+        batch_size: int,
+        max_payload_size: int,
+        serializer: Optional[Type[JSONEncoder]] = None,
+        codec: Optional[JsonCodec] = None,
+    ) -> Generator[bytes, None, None]:
+        batcher = PayloadBatcher(batch_size, max_payload_size, serializer, codec)
+        for document in documents:
+            payload = batcher.add(document)
+            if payload is not None:
+                yield payload
+
+        payload = batcher.flush()
+        if payload is not None:
+            yield payload
+
+    @staticmethod
+    def _split_file(
+        file: IO[bytes], batch_size: int, content_type: str, chunk_size: int
+    ) -> Iterator[Iterator[bytes]]:
+        if content_type not in ("application/x-ndjson", "text/csv"):
+            raise ValueError("Only NDJSON and CSV files can be split in batches")
+
+        return split_records(
+            file, batch_size, csv=content_type == "text/csv", chunk_size=chunk_size
+        )
 
     def __settings_url_for(self, sub_route: str) -> str:
         return f"{self.config.paths.index}/{self.uid}/{self.config.paths.setting}/{sub_route}"
@@ -2354,3 +2892,75 @@ class Index:
         path = f"{self.config.paths.index}/{self.uid}/compact"
         task = self.http.post(path)
         return TaskInfo(**task)
+
+
+def _iter_documents(
+    fetch: Callable[[int], DocumentsResults], page_size: int, prefetch: int
+) -> Iterator[Document]:
+    """Yield the documents of every page while the next pages are fetched by a thread pool."""
+    first = fetch(0)
+    pages: Iterator[Callable[[], DocumentsResults]] = chain(
+        [lambda: first],
+        (partial(fetch, offset) for offset in range(page_size, first.total, page_size)),
+    )
+    executor = ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix="meilisearch-prefetch")
+    try:
+        # The first page is already fetched, one more slot keeps `prefetch` pages in flight.
+        with closing(_in_order(executor, pages, prefetch + 1)) as results:
+            for page in results:
+                yield from page.results
+    finally:
+        # A caller leaving the loop early does not wait for the pages still being fetched.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _write_pages(
+    executor: ThreadPoolExecutor,
+    pages: Iterator[Callable[[], Dict[str, Any]]],
+    workers: int,
+    writer: NdjsonWriter,
+) -> None:
+    """Fetch the pages with at most `workers` requests in flight and write them in order."""
+    with closing(_in_order(executor, pages, workers)) as results:
+        for page in results:
+            writer.write(page["results"])
+
+
+def _send_batches(
+    send: Callable[[T], TaskInfo],
+    batches: Iterator[T],
+    concurrency: int,
+) -> List[TaskInfo]:
+    """Send the batches with at most `concurrency` requests in flight.
+
+    The batches are pulled from the iterator only when a slot is free and the tasks are returned
+    in the order of the batches.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency should be greater than or equal to 1")
+    if concurrency == 1:
+        return [send(batch) for batch in batches]
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(_in_order(executor, (partial(send, batch) for batch in batches), concurrency))
+
+
+def _in_order(
+    executor: ThreadPoolExecutor, calls: Iterable[Callable[[], T]], limit: int
+) -> Generator[T, None, None]:
+    """Run the calls with at most `limit` of them in flight and yield their results in order.
+
+    The next call is pulled from `calls` once the oldest one in flight is answered. The calls
+    not started yet are cancelled when one of them fails or the caller stops iterating.
+    """
+    in_flight: Deque[Future[T]] = deque()
+    try:
+        for call in calls:
+            if len(in_flight) == limit:
+                yield in_flight.popleft().result()
+            in_flight.append(executor.submit(call))
+        while in_flight:
+            yield in_flight.popleft().result()
+    finally:
+        for future in in_flight:
+            future.cancel()
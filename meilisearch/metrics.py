@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import bisect
+import threading
+from abc import ABC, abstractmethod
+from collections import defaultdict, deque
+from typing import Callable, DefaultDict, Deque, Dict, List, Optional, Sequence, Tuple, Union
+
+# The segment following each collection is an identifier, replaced to keep the endpoints few.
+_IDENTIFIERS = {
+    "indexes": "{index_uid}",
+    "documents": "{document_id}",
+    "tasks": "{task_uid}",
+    "batches": "{batch_uid}",
+    "keys": "{key}",
+    "webhooks": "{webhook_uuid}",
+    "chats": "{workspace_uid}",
+}
+_SUBROUTES = {"fetch", "delete", "delete-batch", "edit", "cancel", "settings"}
+
+PHASES = ("serialize", "network", "decode")
+
+DEFAULT_BUCKETS_IN_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+def endpoint(path: str) -> str:
+    """Route template of a request path, e.g. "indexes/{index_uid}/search"."""
+    segments = path.split("?", 1)[0].strip("/").split("/")
+    for position in range(1, len(segments)):
+        placeholder = _IDENTIFIERS.get(segments[position - 1])
+        if placeholder is not None and segments[position] not in _SUBROUTES:
+            segments[position] = placeholder
+    return "/".join(segments)
+
+
+class RequestSample:
+    """Measures of one request sent to Meilisearch, retries included.
+
+    `durations_ms` holds the milliseconds spent in each of the `PHASES` and `sizes` the bytes
+    of the "request" and "response" bodies. `status` is the HTTP status of the last response,
+    or "error" when no response was received. The request size is the encoded body before
+    compression, 0 for streamed bodies.
+    """
+
+    __slots__ = ("method", "path", "endpoint", "status", "durations_ms", "sizes", "retries")
+
+    def __init__(self, method: str, path: str) -> None:
+        self.method = method
+        self.path = path
+        self.endpoint = endpoint(path)
+        self.status: Union[int, str] = "error"
+        self.durations_ms = dict.fromkeys(PHASES, 0.0)
+        self.sizes = {"request": 0, "response": 0}
+        self.retries = 0
+
+    @property
+    def total_ms(self) -> float:
+        return sum(self.durations_ms.values())
+
+
+class MetricsSink(ABC):
+    """Receive the measures of every request sent by a client."""
+
+    @abstractmethod
+    def record(self, sample: RequestSample) -> None:
+        """Called once per request, after its last attempt."""
+
+
+class InMemorySink(MetricsSink):
+    """Keep the last `max_samples` requests to compute percentiles in process."""
+
+    def __init__(self, max_samples: int = 10000) -> None:
+        self.samples: Deque[RequestSample] = deque(maxlen=max_samples)
+
+    def record(self, sample: RequestSample) -> None:
+        self.samples.append(sample)
+
+    def percentile(
+        self,
+        percentile: float,
+        *,
+        method: Optional[str] = None,
+        endpoint: Optional[str] = None,  # pylint: disable=redefined-outer-name
+        phase: Optional[str] = None,
+    ) -> Optional[float]:
+        """Percentile of the durations of the matching requests, None when there are none.
+
+        Parameters
+        ----------
+        percentile:
+            Percentile between 0 and 100.
+        method (optional):
+            Only count the requests with this HTTP method.
+        endpoint (optional):
+            Only count the requests to this route template.
+        phase (optional):
+            "serialize", "network" or "decode", the whole request by default.
+        """
+        durations = sorted(
+            sample.total_ms if phase is None else sample.durations_ms[phase]
+            for sample in list(self.samples)
+            if (method is None or sample.method == method)
+            and (endpoint is None or sample.endpoint == endpoint)
+        )
+        if not durations:
+            return None
+        return durations[min(int(len(durations) * percentile / 100), len(durations) - 1)]
+
+
+class StatsdSink(MetricsSink):
+    """
+    Forward every measure to a StatsD-style callback
+
+    The callback is called with the name of the metric, its value, its type, "c" for counters,
+    "ms" for timers and "h" for histograms, and the tags method, endpoint and status.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[str, float, str, Dict[str, str]], None],
+        prefix: str = "meilisearch",
+    ) -> None:
+        self.callback = callback
+        self.prefix = prefix
+
+    def record(self, sample: RequestSample) -> None:
+        tags = {"method": sample.method, "endpoint": sample.endpoint, "status": str(sample.status)}
+        self.callback(f"{self.prefix}.requests", 1, "c", tags)
+        for phase in PHASES:
+            self.callback(f"{self.prefix}.request.{phase}", sample.durations_ms[phase], "ms", tags)
+        for direction, size in sample.sizes.items():
+            self.callback(f"{self.prefix}.{direction}.bytes", size, "h", tags)
+        if sample.retries:
+            self.callback(f"{self.prefix}.retries", sample.retries, "c", tags)
+
+
+class _Histogram:
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+
+class PrometheusSink(MetricsSink):
+    """
+    Aggregate the measures into counters and histograms in the Prometheus text format
+
+    Serve the output of `exposition` on the metrics route of the application, or append it to
+    the output of its registry. The durations are exported in seconds.
+    """
+
+    def __init__(
+        self, prefix: str = "meilisearch", buckets_in_ms: Sequence[float] = DEFAULT_BUCKETS_IN_MS
+    ) -> None:
+        self.prefix = prefix
+        self.buckets_in_ms = tuple(sorted(buckets_in_ms))
+        self._requests: DefaultDict[Tuple[str, str, str], int] = defaultdict(int)
+        self._durations: Dict[Tuple[str, str, str, str], _Histogram] = {}
+        self._bytes: DefaultDict[Tuple[str, str, str], int] = defaultdict(int)
+        self._retries: DefaultDict[Tuple[str, str], int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def record(self, sample: RequestSample) -> None:
+        status = str(sample.status)
+        with self._lock:
+            self._requests[(sample.method, sample.endpoint, status)] += 1
+            for phase in PHASES:
+                key = (sample.method, sample.endpoint, status, phase)
+                histogram = self._durations.get(key)
+                if histogram is None:
+                    histogram = self._durations[key] = _Histogram(self.buckets_in_ms)
+                duration = sample.durations_ms[phase]
+                histogram.counts[bisect.bisect_left(self.buckets_in_ms, duration)] += 1
+                histogram.sum += duration
+            for direction, size in sample.sizes.items():
+                self._bytes[(sample.method, sample.endpoint, direction)] += size
+            self._retries[(sample.method, sample.endpoint)] += sample.retries
+
+    def exposition(self) -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        name = self.prefix
+        lines: List[str] = []
+        with self._lock:
+            lines += [
+                f"# HELP {name}_requests_total Requests sent to Meilisearch.",
+                f"# TYPE {name}_requests_total counter",
+            ]
+            for (method, route, status), count in sorted(self._requests.items()):
+                labels = _labels(method=method, endpoint=route, status=status)
+                lines.append(f"{name}_requests_total{{{labels}}} {count}")
+
+            lines += [
+                f"# HELP {name}_request_duration_seconds Time spent on each phase of the requests.",
+                f"# TYPE {name}_request_duration_seconds histogram",
+            ]
+            for (method, route, status, phase), histogram in sorted(self._durations.items()):
+                labels = _labels(method=method, endpoint=route, status=status, phase=phase)
+                cumulative = 0
+                for bound, count in zip(self.buckets_in_ms, histogram.counts):
+                    cumulative += count
+                    lines.append(
+                        f'{name}_request_duration_seconds_bucket{{{labels},le="{bound / 1000:g}"}}'
+                        f" {cumulative}"
+                    )
+                cumulative += histogram.counts[-1]
+                lines.append(
+                    f'{name}_request_duration_seconds_bucket{{{labels},le="+Inf"}} {cumulative}'
+                )
+                lines.append(
+                    f"{name}_request_duration_seconds_sum{{{labels}}} {histogram.sum / 1000:g}"
+                )
+                lines.append(f"{name}_request_duration_seconds_count{{{labels}}} {cumulative}")
+
+            lines += [
+                f"# HELP {name}_bytes_total Bytes of the request and response bodies.",
+                f"# TYPE {name}_bytes_total counter",
+            ]
+            for (method, route, direction), size in sorted(self._bytes.items()):
+                labels = _labels(method=method, endpoint=route, direction=direction)
+                lines.append(f"{name}_bytes_total{{{labels}}} {size}")
+
+            lines += [
+                f"# HELP {name}_retries_total Requests sent again after a transient failure.",
+                f"# TYPE {name}_retries_total counter",
+            ]
+            for (method, route), retries in sorted(self._retries.items()):
+                lines.append(
+                    f"{name}_retries_total{{{_labels(method=method, endpoint=route)}}} {retries}"
+                )
+        return "\n".join(lines) + "\n"
+
+
+def _labels(**labels: str) -> str:
+    return ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -1,20 +1,52 @@
-from typing import Any, Dict, Iterator, List
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping
 
 
 class Document:
+    """Read-only view over a document decoded from a response.
+
+    The fields are read as attributes or items straight from the decoded JSON object, which is
+    neither copied nor converted.
+    """
+
+    __slots__ = ("__doc",)
+
     def __init__(self, doc: Dict[str, Any]) -> None:
-        self.__dict__.update(**doc)
+        self.__doc = doc
 
     def __getattr__(self, attr: str) -> Any:
-        if attr in self.__dict__:
-            return self.__dict__[attr]
+        # Only reached for the fields, the slot is found first. It is unset while a copy or an
+        # unpickled document is built, the lookup must then fail without recursing.
+        if attr != "_Document__doc":
+            try:
+                return self.__doc[attr]
+            except KeyError:
+                pass
         raise AttributeError(f"{self.__class__.__name__} object has no attribute {attr}")
 
+    def __getitem__(self, key: str) -> Any:
+        return self.__doc[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__doc
+
+    def __len__(self) -> int:
+        return len(self.__doc)
+
     def __iter__(self) -> Iterator:
-        return iter(self.__dict__.items())
+        return iter(self.__doc.items())
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.__doc!r})"
+
+    @property
+    def __dict__(self) -> Mapping[str, Any]:  # type: ignore[override]
+        return MappingProxyType(self.__doc)
 
 
 class DocumentsResults:
+    __slots__ = ("results", "offset", "limit", "total")
+
     def __init__(self, resp: Dict[str, Any]) -> None:
         self.results: List[Document] = [Document(doc) for doc in resp["results"]]
         self.offset: int = resp["offset"]
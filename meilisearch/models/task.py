@@ -17,6 +17,7 @@ class Task(CamelBase):
     details: Union[Dict[str, Any], None] = None
     error: Union[Dict[str, Any], None] = None
     canceled_by: Union[int, None] = None
+    batch_uid: Optional[int] = None
     duration: Optional[str] = None
     enqueued_at: datetime
     started_at: Optional[datetime] = None
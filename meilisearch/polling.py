@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import random
+from time import monotonic
+from typing import Any, Mapping, Optional, Tuple
+
+
+class PollingStrategy:
+    """
+    Exponential backoff with jitter between two polls of a task
+
+    The first poll happens after `initial_interval_in_ms`, every following interval is multiplied
+    by `multiplier` up to `max_interval_in_ms`. When the batch processing the task reports its
+    progress and `use_progress` is set, the interval follows the estimated time left instead,
+    within the same bounds.
+    """
+
+    def __init__(
+        self,
+        initial_interval_in_ms: float = 50,
+        max_interval_in_ms: float = 1000,
+        multiplier: float = 1.5,
+        jitter: float = 0.1,
+        use_progress: bool = False,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        initial_interval_in_ms (optional):
+            Time to wait before the second poll.
+        max_interval_in_ms (optional):
+            Upper bound of the time to wait between two polls.
+        multiplier (optional):
+            Growth factor of the interval after each poll. 1 keeps a fixed interval.
+        jitter (optional):
+            Fraction of the interval randomly added or removed so that concurrent waiters do not
+            poll in lockstep. 0 disables it.
+        use_progress (optional):
+            Fetch the progress of the batch processing the task to poll again around its expected
+            completion. Every poll of a processing task then sends a second request, which only
+            pays off for batches lasting several seconds.
+        """
+        if initial_interval_in_ms < 0 or max_interval_in_ms < initial_interval_in_ms:
+            raise ValueError(
+                "The intervals should satisfy 0 <= initial_interval_in_ms <= max_interval_in_ms"
+            )
+        if multiplier < 1:
+            raise ValueError("multiplier should be greater than or equal to 1")
+        if not 0 <= jitter < 1:
+            raise ValueError("jitter should be between 0 and 1")
+
+        self.initial_interval_in_ms = initial_interval_in_ms
+        self.max_interval_in_ms = max_interval_in_ms
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.use_progress = use_progress
+
+    @classmethod
+    def fixed(cls, interval_in_ms: float) -> PollingStrategy:
+        """Poll at a fixed interval, the behaviour of previous versions."""
+        return cls(interval_in_ms, interval_in_ms, multiplier=1, jitter=0)
+
+    def next_interval(
+        self, previous_in_ms: Optional[float], remaining_in_ms: Optional[float] = None
+    ) -> float:
+        """Compute the time to wait, in milliseconds, before the next poll.
+
+        Parameters
+        ----------
+        previous_in_ms:
+            The interval returned for the previous poll, None before the first one.
+        remaining_in_ms (optional):
+            The estimated time left before the task is processed, if known.
+        """
+        if remaining_in_ms is not None:
+            # Aim for half of the estimated time left to converge on the completion without
+            # overshooting it by much.
+            interval = remaining_in_ms / 2
+        elif previous_in_ms is None:
+            interval = self.initial_interval_in_ms
+        else:
+            interval = previous_in_ms * self.multiplier
+
+        if self.jitter:
+            interval *= random.uniform(1 - self.jitter, 1 + self.jitter)  # nosec
+        return min(max(interval, self.initial_interval_in_ms), self.max_interval_in_ms)
+
+
+class ProgressTracker:
+    """Estimate the time left to a batch from the progress observed between two polls.
+
+    Only the local monotonic clock is used, so the estimate does not depend on the clock of the
+    Meilisearch server.
+    """
+
+    def __init__(self) -> None:
+        self._first: Optional[Tuple[float, float]] = None
+
+    def update(self, progress: Optional[Mapping[str, Any]]) -> Optional[float]:
+        """Record the progress of the batch and return the estimated time left in milliseconds."""
+        percentage = (progress or {}).get("percentage")
+        if not isinstance(percentage, (int, float)):
+            return None
+
+        now = monotonic()
+        if self._first is None or percentage < self._first[1]:
+            self._first = (now, percentage)
+            return None
+
+        started_at, started_percentage = self._first
+        if percentage <= started_percentage:
+            return None
+
+        rate = (percentage - started_percentage) / (now - started_at)
+        return (100 - percentage) / rate * 1000
+
+
+def default_polling(interval_in_ms: float) -> PollingStrategy:
+    """Backoff used when waiting for tasks without an explicit strategy."""
+    return PollingStrategy(interval_in_ms, max(interval_in_ms, 1000))
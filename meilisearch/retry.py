@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Optional
+
+from meilisearch._nodes import is_read_only
+
+
+class RetryPolicy:
+    """
+    Retry the requests failing with a transient error
+
+    Connection errors, timeouts and the responses with one of `retry_statuses` are retried up to
+    `max_attempts` times, waiting an exponentially growing, jittered backoff between two attempts
+    or the delay asked by the `Retry-After` header of the response.
+
+    Only the requests that can safely be sent twice are retried: GETs and the POST routes reading
+    data (search, facet search, multi search, similar documents, fetch documents). Every other
+    request enqueues a task in Meilisearch, so repeating it after a timeout may enqueue the task
+    twice. They are retried when `retry_writes` is set, or when the connection could not be
+    established at all.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_in_ms: float = 100,
+        max_backoff_in_ms: float = 5000,
+        multiplier: float = 2,
+        jitter: float = 0.5,
+        retry_statuses: Iterable[int] = (429, 502, 503, 504),
+        retry_writes: bool = False,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        max_attempts (optional):
+            Total number of attempts of a request, 1 disables the retries.
+        backoff_in_ms (optional):
+            Time to wait before the first retry.
+        max_backoff_in_ms (optional):
+            Upper bound of the time to wait between two attempts. A Retry-After header asking
+            for a longer delay makes the request fail instead.
+        multiplier (optional):
+            Growth factor of the backoff after each attempt.
+        jitter (optional):
+            Fraction of the backoff randomly removed so that concurrent clients do not retry in
+            lockstep. 0 disables it.
+        retry_statuses (optional):
+            HTTP status codes of the responses to retry.
+        retry_writes (optional):
+            Also retry the requests enqueuing a task, such as document additions.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts should be greater than or equal to 1")
+        if backoff_in_ms < 0 or max_backoff_in_ms < backoff_in_ms:
+            raise ValueError("The backoffs should satisfy 0 <= backoff_in_ms <= max_backoff_in_ms")
+        if multiplier < 1:
+            raise ValueError("multiplier should be greater than or equal to 1")
+        if not 0 <= jitter <= 1:
+            raise ValueError("jitter should be between 0 and 1")
+
+        self.max_attempts = max_attempts
+        self.backoff_in_ms = backoff_in_ms
+        self.max_backoff_in_ms = max_backoff_in_ms
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_writes = retry_writes
+
+    def is_idempotent(self, method: str, path: str) -> bool:
+        """Whether sending the request twice has the same effect as sending it once."""
+        return method.upper() in ("HEAD", "OPTIONS") or is_read_only(method, path)
+
+    def can_retry(
+        self,
+        attempt: int,
+        method: str,
+        path: str,
+        *,
+        status_code: Optional[int] = None,
+        sent: bool = True,
+    ) -> bool:
+        """Whether a failed attempt should be retried.
+
+        Parameters
+        ----------
+        attempt:
+            Number of the attempt that failed, starting at 1.
+        method:
+            HTTP method of the request.
+        path:
+            Path of the request, relative to the url of Meilisearch.
+        status_code (optional):
+            Status of the response, None when the request failed without a response.
+        sent (optional):
+            False when the connection failed before the request was sent.
+        """
+        if attempt >= self.max_attempts:
+            return False
+        if status_code is not None and status_code not in self.retry_statuses:
+            return False
+        return not sent or self.retry_writes or self.is_idempotent(method, path)
+
+    def backoff(self, attempt: int, retry_after: Optional[str] = None) -> Optional[float]:
+        """Compute the time to wait, in milliseconds, before the next attempt.
+
+        Returns None when the Retry-After header asks for a delay longer than
+        max_backoff_in_ms, the request should then not be retried.
+        """
+        requested = _parse_retry_after(retry_after)
+        if requested is not None:
+            return requested if requested <= self.max_backoff_in_ms else None
+
+        interval = min(
+            self.backoff_in_ms * self.multiplier ** (attempt - 1), self.max_backoff_in_ms
+        )
+        if self.jitter:
+            interval *= 1 - random.uniform(0, self.jitter)  # nosec
+        return interval
+
+
+def _parse_retry_after(retry_after: Optional[str]) -> Optional[float]:
+    """Convert a Retry-After header, in seconds or as an HTTP date, to milliseconds."""
+    if not retry_after:
+        return None
+    try:
+        return max(float(retry_after), 0) * 1000
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max((date - datetime.now(timezone.utc)).total_seconds(), 0) * 1000
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+import json
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+from meilisearch._nodes import is_read_only
+
+
+class SingleFlight:
+    """
+    Share one request between the identical reads sent at the same time
+
+    While a GET request, a search or a document fetch is in flight, the identical requests sent
+    by other threads or tasks of the client do not reach Meilisearch: they wait for the request
+    in flight and get a copy of its response, or its error. This caps the burst of identical
+    requests sent when many workers start, or when the entries of the search cache expire, at
+    once. Nothing is kept once the request is answered.
+    """
+
+    def __init__(self) -> None:
+        self.shared = 0
+        # Futures of the calls in flight, concurrent ones for threads and asyncio ones for tasks.
+        self._calls: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+
+    def applies(self, method: str, path: str) -> bool:
+        """Whether the request only reads data and can be shared."""
+        return is_read_only(method, path)
+
+    def key(self, method: str, path: str, body: Any) -> Optional[Hashable]:
+        """Identify the request, None when its body cannot be compared."""
+        if body is not None and not isinstance(body, (dict, list)):
+            return None
+        return (method.upper(), path, json.dumps(body, sort_keys=True, default=str))
+
+    def run(self, key: Hashable, send: Callable[[], Any]) -> Any:
+        """Call `send`, or wait for the call in flight for the same key and copy its result."""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if future is None:
+                future = self._calls[key] = Future()
+            else:
+                self.shared += 1
+
+        if not leader:
+            return copy.deepcopy(future.result())
+
+        try:
+            result = send()
+        except BaseException as err:
+            self._forget(key)
+            future.set_exception(err)
+            raise
+        self._forget(key)
+        future.set_result(result)
+        return result
+
+    async def arun(self, key: Hashable, send: Callable[[], Awaitable[Any]]) -> Any:
+        """Await `send`, or the call in flight for the same key, see `run`."""
+        loop = asyncio.get_running_loop()
+        # The futures are bound to their event loop, each loop shares its own calls.
+        key = (id(loop), key)
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if future is None:
+                future = self._calls[key] = loop.create_future()
+            else:
+                self.shared += 1
+
+        if not leader:
+            try:
+                return copy.deepcopy(await asyncio.shield(future))
+            except asyncio.CancelledError:
+                # The request in flight was cancelled with the task sending it, not this one.
+                if not future.cancelled():
+                    raise
+            return await send()
+
+        try:
+            result = await send()
+        except asyncio.CancelledError:
+            self._forget(key)
+            future.cancel()
+            raise
+        except Exception as err:
+            self._forget(key)
+            future.set_exception(err)
+            # Retrieving the exception keeps asyncio from logging it when nobody else waited.
+            future.exception()
+            raise
+        self._forget(key)
+        future.set_result(result)
+        return result
+
+    def _forget(self, key: Hashable) -> None:
+        with self._lock:
+            self._calls.pop(key, None)
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
-from datetime import datetime
-from time import sleep
-from typing import Any, MutableMapping, Optional
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from time import monotonic, sleep
+from typing import Any, Dict, Iterable, Iterator, List, MutableMapping, Optional, Sequence, Union
 from urllib import parse
 
 from meilisearch._httprequests import HttpRequests
 from meilisearch.config import Config
-from meilisearch.errors import MeilisearchTimeoutError
+from meilisearch.errors import MeilisearchCommunicationError, MeilisearchTimeoutError
 from meilisearch.models.task import Batch, BatchResults, Task, TaskInfo, TaskResults
+from meilisearch.polling import PollingStrategy, ProgressTracker, default_polling
+
+FINISHED_STATUSES = ("succeeded", "failed", "canceled")
+# Keeps the query string of the get tasks route to a reasonable length.
+TASK_UIDS_PER_REQUEST = 1000
 
 
 class TaskHandler:
@@ -19,13 +25,17 @@ class TaskHandler:
     https://www.meilisearch.com/docs/reference/api/tasks
     """
 
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, http: Optional[HttpRequests] = None):
         """Parameters
         ----------
             config: Config object containing permission and location of Meilisearch.
+            http (optional): Transport to reuse, a new one is created from the config if omitted.
         """
         self.config = config
-        self.http = HttpRequests(config)
+        self.http = http if http is not None else HttpRequests(config)
+        # Set by Client.enable_task_webhook, the waits without a polling strategy then go through
+        # this watcher and resolve on the webhook notifications.
+        self.watcher: Optional[TaskWatcher] = None
 
     def get_batches(self, parameters: Optional[MutableMapping[str, Any]] = None) -> BatchResults:
         """Get all task batches.
@@ -176,6 +186,8 @@ class TaskHandler:
         uid: int,
         timeout_in_ms: int = 5000,
         interval_in_ms: int = 50,
+        *,
+        polling: Optional[PollingStrategy] = None,
     ) -> Task:
         """Wait until the task fails or succeeds in Meilisearch.
 
@@ -186,7 +198,13 @@ class TaskHandler:
         timeout_in_ms (optional):
             Time the method should wait before raising a MeilisearchTimeoutError.
         interval_in_ms (optional):
-            Time interval the method should wait (sleep) between requests.
+            Time interval the method should wait (sleep) before the second request. The following
+            intervals grow exponentially up to one second, or interval_in_ms if it is larger.
+        polling (optional):
+            PollingStrategy controlling the intervals between requests, overrides interval_in_ms.
+            Use PollingStrategy.fixed(interval_in_ms) to poll at a fixed interval.
+            Once a task webhook is enabled, the task is awaited through the webhook
+            notifications unless a polling strategy is given.
 
         Returns
         -------
@@ -198,15 +216,266 @@ class TaskHandler:
         MeilisearchTimeoutError
             An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
         """
-        start_time = datetime.now()
-        elapsed_time = 0.0
-        while elapsed_time < timeout_in_ms:
+        if self.watcher is not None and polling is None:
+            return self.watcher.wait_for_tasks([uid], timeout_in_ms)[0]
+        polling = polling or default_polling(interval_in_ms)
+        progress = ProgressTracker()
+        interval: Optional[float] = None
+        deadline = monotonic() + timeout_in_ms / 1000
+        while monotonic() < deadline:
             task = self.get_task(uid)
             if task.status not in ("enqueued", "processing"):
                 return task
-            sleep(interval_in_ms / 1000)
-            time_delta = datetime.now() - start_time
-            elapsed_time = time_delta.seconds * 1000 + time_delta.microseconds / 1000
+            remaining = None
+            if polling.use_progress and task.status == "processing" and task.batch_uid is not None:
+                remaining = progress.update(self.get_batch(task.batch_uid).progress)
+            interval = polling.next_interval(interval, remaining)
+            sleep(min(interval / 1000, max(deadline - monotonic(), 0)))
         raise MeilisearchTimeoutError(
             f"timeout of ${timeout_in_ms}ms has exceeded on process ${uid} when waiting for task to be resolve."
         )
+
+    def wait_for_tasks(
+        self,
+        uids: Sequence[int],
+        timeout_in_ms: int = 5000,
+        interval_in_ms: int = 50,
+        *,
+        stop_on_failure: bool = False,
+        polling: Optional[PollingStrategy] = None,
+    ) -> List[Task]:
+        """Wait until several tasks fail or succeed in Meilisearch.
+
+        The tasks still pending are fetched together from the get tasks route once per interval,
+        instead of polling every task on its own.
+
+        Parameters
+        ----------
+        uids:
+            Identifiers of the tasks to wait for being processed.
+        timeout_in_ms (optional):
+            Time the method should wait for all the tasks before raising a MeilisearchTimeoutError.
+        interval_in_ms (optional):
+            Time interval the method should wait (sleep) before the second request. The following
+            intervals grow exponentially up to one second, or interval_in_ms if it is larger.
+        stop_on_failure (optional):
+            Return as soon as one of the tasks failed, without waiting for the others.
+        polling (optional):
+            PollingStrategy controlling the intervals between requests, overrides interval_in_ms.
+            Once a task webhook is enabled, the tasks are awaited through the webhook
+            notifications unless a polling strategy is given.
+
+        Returns
+        -------
+        tasks:
+            List of Task instances of the processed tasks, in the order of uids. With
+            stop_on_failure only the tasks finished when the failure was seen are returned.
+
+        Raises
+        ------
+        MeilisearchTimeoutError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        if self.watcher is not None and polling is None:
+            return self.watcher.wait_for_tasks(uids, timeout_in_ms, stop_on_failure=stop_on_failure)
+        polling = polling or default_polling(interval_in_ms)
+        interval: Optional[float] = None
+        deadline = monotonic() + timeout_in_ms / 1000
+        pending = set(uids)
+        finished: Dict[int, Task] = {}
+        while True:
+            for task in self._get_finished_tasks(pending):
+                finished[task.uid] = task
+                pending.discard(task.uid)
+                if stop_on_failure and task.status == "failed":
+                    return [finished[uid] for uid in uids if uid in finished]
+            if not pending:
+                return [finished[uid] for uid in uids]
+            if monotonic() >= deadline:
+                raise MeilisearchTimeoutError(
+                    f"timeout of {timeout_in_ms}ms has exceeded when waiting for {len(pending)} "
+                    "tasks to be resolved."
+                )
+            interval = polling.next_interval(interval)
+            sleep(min(interval / 1000, max(deadline - monotonic(), 0)))
+
+    def _get_finished_tasks(self, uids: Iterable[int]) -> Iterator[Task]:
+        ordered = sorted(uids)
+        for i in range(0, len(ordered), TASK_UIDS_PER_REQUEST):
+            chunk = ordered[i : i + TASK_UIDS_PER_REQUEST]
+            parameters = {
+                "uids": [str(uid) for uid in chunk],
+                "statuses": list(FINISHED_STATUSES),
+                "limit": len(chunk),
+            }
+            yield from self.get_tasks(parameters).results
+
+
+class TaskWatcher:
+    """
+    Resolve the tasks watched by many callers from a single background polling loop
+
+    A daemon thread, started on the first call to `watch`, fetches all the pending tasks together
+    from the get tasks route once per interval and resolves their futures. Callers can block on
+    `Future.result()`, attach callbacks with `Future.add_done_callback()` or wait for many tasks
+    with `concurrent.futures.wait()` without adding any request.
+    """
+
+    def __init__(self, task_handler: TaskHandler, polling: Optional[PollingStrategy] = None):
+        """Parameters
+        ----------
+            task_handler: TaskHandler used to fetch the tasks.
+            polling (optional): PollingStrategy controlling the intervals between two polls.
+        """
+        self.task_handler = task_handler
+        self.polling = polling or PollingStrategy()
+        self._pending: Dict[int, List[Future[Task]]] = {}
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def watch(self, task: Union[int, TaskInfo]) -> Future[Task]:
+        """Watch a task until it fails or succeeds.
+
+        Parameters
+        ----------
+        task:
+            TaskInfo returned by a write method, or the uid of the task.
+
+        Returns
+        -------
+        future:
+            Future resolved with the Task instance of the processed task. It is set with the
+            MeilisearchApiError if Meilisearch refuses the request fetching the tasks. Cancel it
+            to stop watching the task.
+        """
+        uid = task.task_uid if isinstance(task, TaskInfo) else task
+        future: Future[Task] = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("The task watcher is closed")
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="meilisearch-task-watcher", daemon=True
+                )
+                self._thread.start()
+            # Only wake up an idle loop, a running one picks the task up on its next poll.
+            if not self._pending:
+                self._condition.notify()
+            self._pending.setdefault(uid, []).append(future)
+        return future
+
+    def wait_for_tasks(
+        self, uids: Sequence[int], timeout_in_ms: int = 5000, *, stop_on_failure: bool = False
+    ) -> List[Task]:
+        """Block until the watched tasks fail or succeed.
+
+        Parameters
+        ----------
+        uids:
+            Identifiers of the tasks to wait for being processed.
+        timeout_in_ms (optional):
+            Time the method should wait for all the tasks before raising a MeilisearchTimeoutError.
+        stop_on_failure (optional):
+            Return as soon as one of the tasks failed, without waiting for the others.
+
+        Returns
+        -------
+        tasks:
+            List of Task instances of the processed tasks, in the order of uids. With
+            stop_on_failure only the tasks finished when the failure was seen are returned.
+
+        Raises
+        ------
+        MeilisearchTimeoutError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        futures = {uid: self.watch(uid) for uid in uids}
+        deadline = monotonic() + timeout_in_ms / 1000
+        not_done = set(futures.values())
+        try:
+            while not_done:
+                done, not_done = wait(
+                    not_done, timeout=max(deadline - monotonic(), 0), return_when=FIRST_COMPLETED
+                )
+                if not done:
+                    raise MeilisearchTimeoutError(
+                        f"timeout of {timeout_in_ms}ms has exceeded when waiting for "
+                        f"{len(not_done)} tasks to be resolved."
+                    )
+                if stop_on_failure and any(future.result().status == "failed" for future in done):
+                    return [futures[uid].result() for uid in uids if futures[uid].done()]
+            return [futures[uid].result() for uid in uids]
+        finally:
+            # Nobody waits for the tasks left after a timeout or a failure, stop polling them.
+            for future in not_done:
+                future.cancel()
+            self._drop_cancelled()
+
+    def notify(self, tasks: Iterable[Task]) -> None:
+        """Resolve the futures of the finished tasks among `tasks` without waiting for a poll.
+
+        Used as a listener of a TaskWebhookReceiver, the polling loop then only catches the
+        notifications that got lost.
+        """
+        for task in tasks:
+            if task.status in FINISHED_STATUSES:
+                self._resolve([task.uid], lambda future, task=task: future.set_result(task))
+
+    def close(self) -> None:
+        """Stop the polling loop and cancel the futures still pending."""
+        with self._condition:
+            self._closed = True
+            pending, self._pending = self._pending, {}
+            self._condition.notify()
+        for futures in pending.values():
+            for future in futures:
+                future.cancel()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def _run(self) -> None:
+        interval: Optional[float] = None
+        while True:
+            self._drop_cancelled()
+            with self._condition:
+                while not self._pending and not self._closed:
+                    interval = None
+                    self._condition.wait()
+                if self._closed:
+                    return
+                uids = list(self._pending)
+
+            try:
+                finished = list(
+                    self.task_handler._get_finished_tasks(uids)  # pylint: disable=protected-access
+                )
+            except (MeilisearchCommunicationError, MeilisearchTimeoutError):
+                # Transient, the tasks are polled again on the next interval.
+                finished = []
+            except Exception as err:  # pylint: disable=broad-except
+                self._resolve(uids, lambda future, err=err: future.set_exception(err))
+                continue
+
+            self.notify(finished)
+
+            interval = self.polling.next_interval(None if finished else interval)
+            with self._condition:
+                if self._pending and not self._closed:
+                    self._condition.wait(interval / 1000)
+
+    def _drop_cancelled(self) -> None:
+        # The tasks whose futures were all cancelled by their callers are no longer polled.
+        with self._condition:
+            for uid, futures in list(self._pending.items()):
+                futures[:] = [future for future in futures if not future.cancelled()]
+                if not futures:
+                    del self._pending[uid]
+
+    def _resolve(self, uids: Iterable[int], resolve: Any) -> None:
+        with self._condition:
+            futures = [future for uid in uids for future in self._pending.pop(uid, [])]
+        # The callbacks of the futures run outside of the lock.
+        for future in futures:
+            if future.set_running_or_notify_cancel():
+                resolve(future)
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import gzip
+import hmac
+import secrets
+import threading
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from meilisearch._codec import JsonCodec
+from meilisearch.models.task import Task
+
+TaskListener = Callable[[List[Task]], None]
+
+
+class TaskWebhookReceiver:
+    """
+    Embedded HTTP server receiving the task notifications sent by a Meilisearch webhook
+
+    Meilisearch posts the tasks of every finished batch to its webhooks as gzip-compressed NDJSON.
+    The receiver decodes them and hands them to its listeners, usually the `notify` method of a
+    TaskWatcher. Only the requests carrying the secret registered with the webhook are accepted.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        *,
+        public_url: Optional[str] = None,
+        secret: Optional[str] = None,
+        codec: Optional[JsonCodec] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        host (optional):
+            Interface the server listens on. Use "0.0.0.0" when Meilisearch runs on another host.
+        port (optional):
+            Port the server listens on, 0 picks a free one.
+        public_url (optional):
+            URL under which Meilisearch reaches the server, when it differs from the listening
+            address (container, proxy, ...).
+        secret (optional):
+            Token Meilisearch must send in the Authorization header, a random one by default.
+        codec (optional):
+            JsonCodec decoding the notifications.
+        """
+        self.secret = secret or secrets.token_urlsafe(32)
+        self.codec = codec or JsonCodec()
+        self._listeners: List[TaskListener] = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+        self.public_url = public_url or f"http://{host}:{self._server.server_address[1]}"
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Headers Meilisearch should send with its notifications."""
+        return {"Authorization": f"Bearer {self.secret}"}
+
+    def add_listener(self, listener: TaskListener) -> None:
+        """Call `listener` with the tasks of every notification received."""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def start(self) -> None:
+        """Serve the notifications from a daemon thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._server.serve_forever, name="meilisearch-task-webhook", daemon=True
+            )
+            self._thread.start()
+
+    def close(self) -> None:
+        """Stop the server and release its port."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def is_authorized(self, authorization: Optional[str]) -> bool:
+        return hmac.compare_digest(
+            (authorization or "").encode("utf-8"), f"Bearer {self.secret}".encode("utf-8")
+        )
+
+    def dispatch(self, body: bytes, content_encoding: Optional[str] = None) -> List[Task]:
+        """Decode a notification and pass its tasks to the listeners."""
+        tasks = [Task(**data) for data in self._decode(body, content_encoding)]
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener(tasks)
+        return tasks
+
+    def _decode(self, body: bytes, content_encoding: Optional[str]) -> Iterator[Any]:
+        if content_encoding == "gzip":
+            body = gzip.decompress(body)
+        elif content_encoding == "deflate":
+            body = zlib.decompress(body)
+        for line in body.splitlines():
+            if line.strip():
+                yield self.codec.loads(line)
+
+
+def _make_handler(receiver: TaskWebhookReceiver) -> type:
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:  # pylint: disable=invalid-name
+            if not receiver.is_authorized(self.headers.get("Authorization")):
+                self._reply(401)
+                return
+            body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            try:
+                receiver.dispatch(body, self.headers.get("Content-Encoding"))
+            except (ValueError, TypeError, OSError, zlib.error):
+                self._reply(400)
+                return
+            self._reply(204)
+
+        def _reply(self, status: int) -> None:
+            self.send_response(status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, format: str, *args: Any) -> None:  # pylint: disable=redefined-builtin
+            pass
+
+    return Handler
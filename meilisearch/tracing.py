@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+from meilisearch.hooks import RequestHook
+from meilisearch.metrics import PHASES, RequestSample
+from meilisearch.version import __version__
+
+try:
+    from opentelemetry import propagate, trace
+except ImportError:  # pragma: no cover
+    trace = None  # type: ignore[assignment]
+
+
+class TracingHook(RequestHook):
+    """
+    Trace the requests sent to Meilisearch with OpenTelemetry
+
+    Every request opens a client span, child of the current span and named after the method and
+    the route template such as "POST indexes/{index_uid}/search". Its context is sent to
+    Meilisearch in the `traceparent` header. The span ends with the status, the body sizes, the
+    retries and the time spent encoding, on the network and decoding.
+
+    When a hedged search sends its request a second time, each copy is traced as its own span,
+    so the search shows as two sibling spans under the current span.
+    """
+
+    def __init__(self, tracer: Optional[Any] = None) -> None:
+        """
+        Parameters
+        ----------
+        tracer (optional):
+            OpenTelemetry tracer opening the spans. The tracer of the global tracer provider by
+            default.
+        """
+        if trace is None:
+            raise ImportError(
+                "The tracing hook requires opentelemetry-api. "
+                "Install it with `pip install opentelemetry-api`."
+            )
+
+        self.tracer = tracer or trace.get_tracer("meilisearch", __version__)
+
+    def before_request(self, sample: RequestSample, headers: Dict[str, str]) -> Any:
+        span = self.tracer.start_span(
+            f"{sample.method} {sample.endpoint}",
+            kind=trace.SpanKind.CLIENT,
+            attributes={
+                "http.request.method": sample.method,
+                "http.route": sample.endpoint,
+                "url.path": sample.path.split("?", 1)[0],
+            },
+        )
+        propagate.inject(headers, context=trace.set_span_in_context(span))
+        return span
+
+    def after_response(
+        self,
+        sample: RequestSample,
+        response: Optional[Any],
+        error: Optional[BaseException],
+        state: Any,
+    ) -> None:
+        span = state
+        if span.is_recording():
+            if isinstance(sample.status, int):
+                span.set_attribute("http.response.status_code", sample.status)
+            span.set_attribute("http.request.body.size", sample.sizes["request"])
+            span.set_attribute("http.response.body.size", sample.sizes["response"])
+            if sample.retries:
+                span.set_attribute("http.request.resend_count", sample.retries)
+            for phase in PHASES:
+                span.set_attribute(f"meilisearch.{phase}_ms", sample.durations_ms[phase])
+            if error is not None:
+                span.set_attribute("error.type", type(error).__qualname__)
+                span.record_exception(error)
+                span.set_status(trace.Status(trace.StatusCode.ERROR, str(error)))
+        span.end()
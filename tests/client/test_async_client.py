@@ -0,0 +1,145 @@
+# pylint: disable=invalid-name
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+import meilisearch
+from meilisearch.async_index import AsyncIndex
+from meilisearch.errors import MeilisearchApiError, MeilisearchCommunicationError
+from meilisearch.models.task import Task, TaskInfo
+from tests import BASE_URL, MASTER_KEY, common
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_async_client_shares_transport():
+    """Tests the indexes created by an async client reuse its connection pool."""
+    client = meilisearch.AsyncClient(BASE_URL, MASTER_KEY)
+    index = client.index(common.INDEX_UID)
+
+    assert isinstance(index, AsyncIndex)
+    assert index.http is client.http
+    assert index.task_handler.http is client.http
+    run(client.close())
+
+
+def test_async_health():
+    async def scenario():
+        async with meilisearch.AsyncClient(BASE_URL, MASTER_KEY) as client:
+            return await client.health()
+
+    assert run(scenario())["status"] == "available"
+
+
+def test_async_add_documents_and_search(small_movies):
+    async def scenario():
+        async with meilisearch.AsyncClient(BASE_URL, MASTER_KEY) as client:
+            index = client.index(common.INDEX_UID)
+            task = await index.add_documents(small_movies)
+            assert isinstance(task, TaskInfo)
+            finished = await client.wait_for_task(task.task_uid)
+            assert isinstance(finished, Task)
+            return await asyncio.gather(*(index.search(query) for query in ("pirate", "prince")))
+
+    pirate, prince = run(scenario())
+
+    assert pirate["query"] == "pirate"
+    assert prince["query"] == "prince"
+    assert len(pirate["hits"]) > 0
+
+
+def test_async_get_index_not_found():
+    async def scenario():
+        async with meilisearch.AsyncClient(BASE_URL, MASTER_KEY) as client:
+            await client.get_index("unknown_index")
+
+    with pytest.raises(MeilisearchApiError):
+        run(scenario())
+
+
+def test_async_communication_error():
+    async def scenario():
+        async with meilisearch.AsyncClient("http://wrongurl:1234", MASTER_KEY, timeout=1) as client:
+            await client.health()
+
+    with pytest.raises(MeilisearchCommunicationError):
+        run(scenario())
+
+
+def test_async_create_chat_completion():
+    class MockStreamingResponse:
+        def __init__(self, lines):
+            self.lines = lines
+            self.closed = False
+
+        async def aiter_lines(self):
+            for line in self.lines:
+                yield line
+
+        async def aclose(self):
+            self.closed = True
+
+    mock_resp = MockStreamingResponse(
+        [
+            'data: {"choices":[{"delta":{"content":"Hello"}}]}',
+            "",
+            "data: [DONE]",
+        ]
+    )
+
+    async def scenario(client):
+        return [chunk async for chunk in client.create_chat_completion("assistant", messages=[])]
+
+    client = meilisearch.AsyncClient(BASE_URL, MASTER_KEY)
+    with patch.object(client.http, "post_stream", return_value=mock_resp):
+        chunks = run(scenario(client))
+
+    assert chunks == [{"choices": [{"delta": {"content": "Hello"}}]}]
+    assert mock_resp.closed
+
+
+def test_async_add_documents_in_batches_concurrency(small_movies):
+    async def scenario():
+        async with meilisearch.AsyncClient(BASE_URL, MASTER_KEY) as client:
+            index = client.index(common.INDEX_UID)
+            tasks = await index.add_documents_in_batches(small_movies, 5, concurrency=4)
+            return [await client.wait_for_task(task.task_uid) for task in tasks]
+
+    finished = run(scenario())
+
+    assert len(finished) == -(-len(small_movies) // 5)
+    assert all(task.status == "succeeded" for task in finished)
+
+
+def test_async_add_documents_in_batches_from_async_generator(small_movies):
+    async def documents():
+        for movie in small_movies:
+            yield movie
+
+    async def scenario():
+        async with meilisearch.AsyncClient(BASE_URL, MASTER_KEY) as client:
+            index = client.index(common.INDEX_UID)
+            tasks = await index.add_documents_in_batches(documents(), 7)
+            return [await client.wait_for_task(task.task_uid) for task in tasks]
+
+    finished = run(scenario())
+
+    assert len(finished) == -(-len(small_movies) // 7)
+    assert all(task.status == "succeeded" for task in finished)
+
+
+def test_async_iter_documents(small_movies):
+    async def scenario():
+        async with meilisearch.AsyncClient(BASE_URL, MASTER_KEY) as client:
+            index = client.index(common.INDEX_UID)
+            task = await index.add_documents(small_movies)
+            await client.wait_for_task(task.task_uid)
+            return [document async for document in index.iter_documents(page_size=7)]
+
+    documents = run(scenario())
+
+    assert {document.id for document in documents} == {movie["id"] for movie in small_movies}
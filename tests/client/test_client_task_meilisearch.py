@@ -1,9 +1,17 @@
 # pylint: disable=invalid-name
 
+import json
+from threading import Thread, Timer
+from threading import enumerate as enumerate_threads
+from time import sleep
+from unittest.mock import Mock, patch
+
 import pytest
 
+import meilisearch
+from meilisearch.errors import MeilisearchApiError, MeilisearchTimeoutError
 from meilisearch.models.task import TaskInfo
-from tests import common
+from tests import BASE_URL, MASTER_KEY, common
 
 
 def test_get_tasks_default(client):
@@ -189,3 +197,153 @@ def test_get_batch(client):
     uid = batches.results[0].uid
     batch = client.get_batch(uid)
     assert batch.uid == uid
+
+
+def test_watch_task(client):
+    """Tests the futures returned by watch_task resolve with the processed tasks."""
+    tasks = [client.create_index(uid=f"{common.INDEX_UID}{i}") for i in range(5)]
+    futures = [client.watch_task(task) for task in tasks]
+
+    finished = [future.result(timeout=10) for future in futures]
+
+    assert [task.uid for task in finished] == [task.task_uid for task in tasks]
+    assert all(task.status == "succeeded" for task in finished)
+
+
+def test_watch_task_same_uid(client):
+    """Tests watching the same task twice resolves both futures."""
+    task = client.create_index(uid=common.INDEX_UID)
+
+    first, second = client.watch_task(task), client.watch_task(task.task_uid)
+
+    assert first.result(timeout=10).uid == second.result(timeout=10).uid == task.task_uid
+
+
+def test_watch_task_api_error():
+    """Tests the futures are set with the error when the tasks cannot be fetched."""
+    client = meilisearch.Client(BASE_URL, MASTER_KEY)
+    error = MeilisearchApiError("HTTP 500", Mock(status_code=500, text=""))
+    with client, patch.object(client.task_handler, "get_tasks", side_effect=error):
+        future = client.watch_task(12345678)
+
+        with pytest.raises(MeilisearchApiError):
+            future.result(timeout=10)
+
+
+def test_watch_task_after_close():
+    """Tests close cancels the pending futures and stops the watcher."""
+    client = meilisearch.Client(BASE_URL, MASTER_KEY)
+    with patch.object(client.task_handler, "get_tasks", return_value=Mock(results=[])):
+        future = client.watch_task(12345678)
+        client.close()
+
+    assert future.cancelled()
+    with pytest.raises(RuntimeError):
+        client.watch_task(12345678)
+
+
+def test_wait_for_tasks_stops_polling_after_timeout():
+    """Tests the tasks are no longer polled once waiting for them timed out."""
+    client = meilisearch.Client(BASE_URL, MASTER_KEY)
+    with (
+        client,
+        patch.object(client.task_handler, "get_tasks", return_value=Mock(results=[])) as get_tasks,
+    ):
+        with pytest.raises(MeilisearchTimeoutError):
+            client.task_watcher.wait_for_tasks([12345678], timeout_in_ms=100)
+        # Let a poll already sent finish before counting.
+        sleep(0.2)
+        calls = get_tasks.call_count
+        sleep(0.5)
+
+        assert get_tasks.call_count == calls
+        assert not client.task_watcher._pending  # pylint: disable=protected-access
+
+
+def test_watch_task_cancelled():
+    """Tests a task is no longer polled once its future is cancelled."""
+    client = meilisearch.Client(BASE_URL, MASTER_KEY)
+    with (
+        client,
+        patch.object(client.task_handler, "get_tasks", return_value=Mock(results=[])) as get_tasks,
+    ):
+        assert client.watch_task(12345678).cancel()
+        sleep(0.2)
+        calls = get_tasks.call_count
+        sleep(0.5)
+
+        assert get_tasks.call_count == calls
+        assert not client.task_watcher._pending  # pylint: disable=protected-access
+
+
+def _watcher_threads():
+    return [thread for thread in enumerate_threads() if thread.name == "meilisearch-task-watcher"]
+
+
+def test_watch_task_from_concurrent_threads():
+    """Tests the threads watching tasks at the same time share one polling thread."""
+    client = meilisearch.Client(BASE_URL, MASTER_KEY)
+    before = _watcher_threads()
+    with patch.object(client.task_handler, "get_tasks", return_value=Mock(results=[])):
+        threads = [Thread(target=client.watch_task, args=(uid,)) for uid in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        started = [thread for thread in _watcher_threads() if thread not in before]
+        client.close()
+
+    assert len(started) == 1
+
+
+def _task_notification(uid):
+    return json.dumps(
+        {
+            "uid": uid,
+            "indexUid": common.INDEX_UID,
+            "status": "succeeded",
+            "type": "indexCreation",
+            "enqueuedAt": "2024-01-01T00:00:00.000000Z",
+        }
+    ).encode("utf-8")
+
+
+def test_wait_for_task_with_task_webhook():
+    """Tests a webhook notification resolves wait_for_task without waiting for a poll."""
+    client = meilisearch.Client(BASE_URL, MASTER_KEY)
+    notification = _task_notification(12345678)
+    with (
+        patch.object(client, "create_webhook", return_value=Mock(uuid="uuid")) as create,
+        patch.object(client, "delete_webhook") as delete,
+        patch.object(client.task_handler, "get_tasks", return_value=Mock(results=[])),
+    ):
+        with client:
+            receiver = client.enable_task_webhook(fallback_interval_in_ms=60000)
+            Timer(0.1, receiver.dispatch, [notification]).start()
+
+            task = client.wait_for_task(12345678, timeout_in_ms=5000)
+
+    assert task.uid == 12345678
+    create.assert_called_once_with({"url": receiver.public_url, "headers": receiver.headers})
+    delete.assert_called_once_with("uuid")
+
+
+def test_index_wait_for_task_with_task_webhook():
+    """Tests the indexes of the client also wait for their tasks through the webhook."""
+    client = meilisearch.Client(BASE_URL, MASTER_KEY)
+    with (
+        patch.object(client, "create_webhook", return_value=Mock(uuid="uuid")),
+        patch.object(client, "delete_webhook"),
+        patch.object(client.task_handler, "get_tasks", return_value=Mock(results=[])),
+        patch.object(client.task_handler, "get_task") as get_task,
+    ):
+        with client:
+            index = client.index(common.INDEX_UID)
+            receiver = client.enable_task_webhook(fallback_interval_in_ms=60000)
+            Timer(0.1, receiver.dispatch, [_task_notification(12345678)]).start()
+
+            task = index.wait_for_task(12345678, timeout_in_ms=5000)
+
+    assert task.uid == 12345678
+    get_task.assert_not_called()
+    assert client.task_handler.watcher is None
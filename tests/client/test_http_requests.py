@@ -1,5 +1,30 @@
+import io
+import json
+import threading
+import time
+import uuid
+import zlib
+from unittest.mock import patch
+
+import pytest
+import requests
+
+import meilisearch
+from meilisearch._codec import JsonCodec, MsgspecCodec, OrjsonCodec
 from meilisearch._httprequests import HttpRequests
-from meilisearch.config import Config
+from meilisearch.cache import SearchCache
+from meilisearch.circuit_breaker import CircuitBreaker
+from meilisearch.config import Config, Middleware, Transport
+from meilisearch.errors import (
+    MeilisearchApiError,
+    MeilisearchCommunicationError,
+    MeilisearchTimeoutError,
+)
+from meilisearch.hedging import HedgingPolicy
+from meilisearch.hooks import RequestHook
+from meilisearch.metrics import InMemorySink
+from meilisearch.retry import RetryPolicy
+from meilisearch.single_flight import SingleFlight
 from meilisearch.version import qualified_version
 from tests import BASE_URL, MASTER_KEY
 
@@ -28,3 +53,498 @@ def test_get_headers_with_multiple_user_agent():
         http.headers["User-Agent"]
         == qualified_version() + ";Meilisearch Package1 (v1.1.1);Meilisearch Package2 (v2.2.2)"
     )
+
+
+def test_http_requests_pool_size():
+    """Tests the connection pool is sized from the config."""
+    config = Config(BASE_URL, MASTER_KEY, transport=Transport(pool_size=5))
+    http = HttpRequests(config=config)
+
+    adapter = http.session.get_adapter(BASE_URL)
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 5
+
+
+def test_http_requests_no_keep_alive():
+    """Tests connections are not reused when keep-alive is disabled."""
+    config = Config(BASE_URL, MASTER_KEY, transport=Transport(keep_alive=False))
+    http = HttpRequests(config=config)
+
+    assert http.headers["Connection"] == "close"
+
+
+def test_transport_shared_by_indexes_and_task_handler():
+    """Tests the indexes and task handler created by a client reuse its transport."""
+    client = meilisearch.Client(BASE_URL, MASTER_KEY)
+    index = client.index("movies")
+
+    assert index.http is client.http
+    assert index.task_handler.http is client.http
+    assert client.task_handler.http is client.http
+
+
+def test_client_close():
+    """Tests closing the client closes the pooled session."""
+    with patch.object(requests.Session, "close") as mock_close:
+        with meilisearch.Client(BASE_URL, MASTER_KEY):
+            pass
+
+    mock_close.assert_called_once()
+
+
+def _response(status_code, content, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response.raw = io.BytesIO(content)
+    return response
+
+
+def _task_response():
+    return _response(
+        202,
+        b'{"taskUid":1,"indexUid":"movies","status":"enqueued",'
+        b'"type":"documentAdditionOrUpdate","enqueuedAt":"2024-01-01T00:00:00.000Z"}',
+    )
+
+
+@pytest.mark.parametrize(
+    "json_codec, expected",
+    [(None, JsonCodec), ("json", JsonCodec), ("orjson", OrjsonCodec), ("msgspec", MsgspecCodec)],
+)
+def test_json_codec_from_config(json_codec, expected):
+    """Tests the JSON codec is picked from the config."""
+    config = Config(BASE_URL, MASTER_KEY, transport=Transport(json_codec=json_codec))
+
+    assert type(config.transport.json_codec) is expected  # pylint: disable=unidiomatic-typecheck
+
+
+def test_json_codec_unknown():
+    with pytest.raises(ValueError):
+        Config(BASE_URL, MASTER_KEY, transport=Transport(json_codec="unknown"))
+
+
+@pytest.mark.parametrize("json_codec", ["json", "orjson", "msgspec"])
+def test_json_codec_encodes_and_decodes(json_codec):
+    """Tests the codec is used for the request bodies and the responses."""
+    client = meilisearch.Client(BASE_URL, MASTER_KEY, transport=Transport(json_codec=json_codec))
+
+    with patch.object(requests.Session, "post", return_value=_task_response()) as mock_post:
+        mock_post.configure_mock(__name__="post")
+        task = client.index("movies").add_documents([{"id": 1, "title": "Élan"}])
+
+    assert task.task_uid == 1
+    assert json.loads(mock_post.call_args.kwargs["data"]) == [{"id": 1, "title": "Élan"}]
+
+
+@pytest.mark.parametrize("json_codec", ["orjson", "msgspec"])
+def test_json_codec_custom_serializer(json_codec):
+    """Tests a custom serializer class is still honoured with another codec."""
+
+    class UUIDEncoder(json.JSONEncoder):
+        def default(self, o):
+            if isinstance(o, uuid.UUID):
+                return f"uuid:{o}"
+            return super().default(o)
+
+    client = meilisearch.Client(BASE_URL, MASTER_KEY, transport=Transport(json_codec=json_codec))
+    document_id = uuid.uuid4()
+
+    with patch.object(requests.Session, "post", return_value=_task_response()) as mock_post:
+        mock_post.configure_mock(__name__="post")
+        client.index("movies").add_documents([{"id": document_id}], serializer=UUIDEncoder)
+
+    assert json.loads(mock_post.call_args.kwargs["data"]) == [{"id": f"uuid:{document_id}"}]
+
+
+@pytest.mark.parametrize("compression, wbits", [("gzip", 31), ("deflate", 15)])
+def test_http_requests_compression(compression, wbits):
+    """Tests the request bodies above the threshold are compressed while they are sent."""
+    client = meilisearch.Client(BASE_URL, MASTER_KEY, transport=Transport(compression=compression))
+    documents = [{"id": i, "title": "Carol"} for i in range(100)]
+
+    with patch.object(requests.Session, "post", return_value=_task_response()) as mock_post:
+        mock_post.configure_mock(__name__="post")
+        client.index("movies").add_documents(documents)
+
+    data = b"".join(mock_post.call_args.kwargs["data"])
+    assert mock_post.call_args.kwargs["headers"]["Content-Encoding"] == compression
+    assert json.loads(zlib.decompress(data, wbits)) == documents
+
+
+def test_http_requests_compression_threshold():
+    """Tests small request bodies are sent uncompressed."""
+    client = meilisearch.Client(BASE_URL, MASTER_KEY, transport=Transport(compression="gzip"))
+
+    with patch.object(requests.Session, "post", return_value=_task_response()) as mock_post:
+        mock_post.configure_mock(__name__="post")
+        client.index("movies").add_documents([{"id": 1}])
+
+    assert "Content-Encoding" not in mock_post.call_args.kwargs["headers"]
+    assert json.loads(mock_post.call_args.kwargs["data"]) == [{"id": 1}]
+
+
+def test_http_requests_unsupported_compression():
+    with pytest.raises(ValueError):
+        Config(BASE_URL, MASTER_KEY, transport=Transport(compression="lz4"))
+
+
+def _status_response(status_code, headers=None):
+    return _response(
+        status_code, b'{"message":"unavailable","code":"x","type":"system","link":"l"}', headers
+    )
+
+
+def _search_response():
+    return _response(200, b'{"hits":[],"query":"","limit":20,"offset":0}')
+
+
+def test_http_requests_retry_search():
+    """Tests read requests are retried on connection errors and transient statuses."""
+    client = meilisearch.Client(
+        BASE_URL,
+        MASTER_KEY,
+        middleware=Middleware(retry=RetryPolicy(max_attempts=3, backoff_in_ms=0)),
+    )
+    responses = [
+        requests.exceptions.ConnectionError("reset"),
+        _status_response(503, {"Retry-After": "0"}),
+        _search_response(),
+    ]
+
+    with patch.object(requests.Session, "post", side_effect=responses) as mock_post:
+        mock_post.configure_mock(__name__="post")
+        result = client.index("movies").search("")
+
+    assert result["hits"] == []
+    assert mock_post.call_count == 3
+
+
+def test_http_requests_retry_gives_up():
+    """Tests the last error is raised once the attempts are exhausted."""
+    client = meilisearch.Client(
+        BASE_URL,
+        MASTER_KEY,
+        middleware=Middleware(retry=RetryPolicy(max_attempts=2, backoff_in_ms=0)),
+    )
+
+    with patch.object(requests.Session, "get", return_value=_status_response(503)) as mock_get:
+        mock_get.configure_mock(__name__="get")
+        with pytest.raises(MeilisearchApiError):
+            client.get_version()
+
+    assert mock_get.call_count == 2
+
+
+def test_http_requests_no_retry_for_writes():
+    """Tests document writes are not retried unless opted in, they could be enqueued twice."""
+    client = meilisearch.Client(
+        BASE_URL, MASTER_KEY, middleware=Middleware(retry=RetryPolicy(backoff_in_ms=0))
+    )
+
+    with patch.object(
+        requests.Session, "post", side_effect=requests.exceptions.ReadTimeout("slow")
+    ) as mock_post:
+        mock_post.configure_mock(__name__="post")
+        with pytest.raises(MeilisearchTimeoutError):
+            client.index("movies").add_documents([{"id": 1}])
+
+    assert mock_post.call_count == 1
+
+
+def test_http_requests_retry_writes():
+    """Tests document writes are retried with retry_writes."""
+    client = meilisearch.Client(
+        BASE_URL,
+        MASTER_KEY,
+        middleware=Middleware(retry=RetryPolicy(backoff_in_ms=0, retry_writes=True)),
+    )
+    responses = [_status_response(429), _task_response()]
+
+    with patch.object(requests.Session, "post", side_effect=responses) as mock_post:
+        mock_post.configure_mock(__name__="post")
+        task = client.index("movies").add_documents([{"id": 1}])
+
+    assert task.task_uid == 1
+    assert mock_post.call_args_list[0].kwargs["data"] == mock_post.call_args_list[1].kwargs["data"]
+
+
+def test_http_requests_no_retry_for_client_errors():
+    client = meilisearch.Client(
+        BASE_URL, MASTER_KEY, middleware=Middleware(retry=RetryPolicy(backoff_in_ms=0))
+    )
+
+    with patch.object(requests.Session, "get", return_value=_status_response(404)) as mock_get:
+        mock_get.configure_mock(__name__="get")
+        with pytest.raises(MeilisearchApiError):
+            client.get_version()
+
+    assert mock_get.call_count == 1
+
+
+def test_http_requests_circuit_breaker_fails_fast():
+    """Tests the requests fail fast once the circuit opens, and recover after a health probe."""
+    breaker = CircuitBreaker(minimum_requests=2, open_duration_in_ms=0)
+    client = meilisearch.Client(
+        BASE_URL, MASTER_KEY, middleware=Middleware(circuit_breaker=breaker)
+    )
+    responses = [
+        requests.exceptions.ReadTimeout("slow"),
+        requests.exceptions.ReadTimeout("slow"),
+        _status_response(503),
+    ]
+
+    with patch.object(requests.Session, "get", side_effect=responses) as mock_get:
+        mock_get.configure_mock(__name__="get")
+        for _ in range(2):
+            with pytest.raises(MeilisearchTimeoutError):
+                client.get_version()
+        assert breaker.state(BASE_URL) == "open"
+
+        # The health probe answers 503, the request is not sent.
+        with pytest.raises(MeilisearchCommunicationError):
+            client.get_version()
+
+    assert mock_get.call_args.args[0] == f"{BASE_URL}/health"
+    assert mock_get.call_count == 3
+
+
+def test_http_requests_read_failover():
+    """Tests a search fails over to the next node while the writes stay on the primary."""
+    urls = ["http://node0:7700", "http://node1:7700"]
+    client = meilisearch.Client(urls, MASTER_KEY)
+    responses = [requests.exceptions.ConnectionError("down"), _search_response(), _task_response()]
+
+    with patch.object(requests.Session, "post", side_effect=responses) as mock_post:
+        mock_post.configure_mock(__name__="post")
+        client.index("movies").search("")
+        client.index("movies").add_documents([{"id": 1}])
+
+    called = [call.args[0] for call in mock_post.call_args_list]
+    assert called == [
+        f"{urls[0]}/indexes/movies/search",
+        f"{urls[1]}/indexes/movies/search",
+        f"{urls[0]}/indexes/movies/documents",
+    ]
+
+
+def test_http_requests_hedged_search():
+    """Tests a slow search is sent again to the next node and the first response wins."""
+    urls = ["http://node0:7700", "http://node1:7700"]
+    client = meilisearch.Client(
+        urls,
+        MASTER_KEY,
+        middleware=Middleware(hedging=HedgingPolicy(initial_delay_in_ms=20, min_delay_in_ms=0)),
+    )
+    slow_node_released = threading.Event()
+
+    def post(url, **kwargs):  # pylint: disable=unused-argument
+        if url.startswith(urls[0]):
+            slow_node_released.wait(5)
+        return _search_response()
+
+    with patch.object(requests.Session, "post", side_effect=post) as mock_post:
+        mock_post.configure_mock(__name__="post")
+        started = time.monotonic()
+        result = client.index("movies").search("")
+        elapsed = time.monotonic() - started
+        slow_node_released.set()
+
+    assert result["hits"] == []
+    assert elapsed < 2
+    assert [call.args[0] for call in mock_post.call_args_list] == [
+        f"{urls[0]}/indexes/movies/search",
+        f"{urls[1]}/indexes/movies/search",
+    ]
+    client.close()
+
+
+def test_http_requests_unhedged_search_on_calling_thread():
+    """Tests a search is sent from the calling thread when it could not be hedged anyway."""
+    client = meilisearch.Client(
+        BASE_URL, MASTER_KEY, middleware=Middleware(hedging=HedgingPolicy(burst=0))
+    )
+    threads = []
+
+    def post(url, **kwargs):  # pylint: disable=unused-argument
+        threads.append(threading.current_thread())
+        return _search_response()
+
+    with patch.object(requests.Session, "post", side_effect=post) as mock_post:
+        mock_post.configure_mock(__name__="post")
+        client.index("movies").search("")
+
+    assert threads == [threading.current_thread()]
+    client.close()
+
+
+def test_http_requests_search_cache():
+    """Tests repeated searches are served from the cache until the client writes to the index."""
+    client = meilisearch.Client(
+        BASE_URL, MASTER_KEY, middleware=Middleware(search_cache=SearchCache())
+    )
+    index = client.index("movies")
+
+    with patch.object(requests.Session, "post") as mock_post:
+        mock_post.configure_mock(__name__="post")
+        mock_post.side_effect = [_search_response(), _task_response(), _search_response()]
+        index.search("prince", {"limit": 5})
+        index.search("prince", {"limit": 5})
+        index.add_documents([{"id": 1}])
+        index.search("prince", {"limit": 5})
+
+    assert mock_post.call_count == 3
+
+
+def test_http_requests_search_cache_kept_on_reads():
+    """Tests the read-only POST routes, such as similar documents, keep the cached searches."""
+    client = meilisearch.Client(
+        BASE_URL, MASTER_KEY, middleware=Middleware(search_cache=SearchCache())
+    )
+    index = client.index("movies")
+
+    with patch.object(requests.Session, "post") as mock_post:
+        mock_post.configure_mock(__name__="post")
+        mock_post.side_effect = [_search_response(), _search_response()]
+        index.search("prince", {"limit": 5})
+        index.get_similar_documents({"id": 1, "embedder": "default"})
+        index.search("prince", {"limit": 5})
+
+    assert mock_post.call_count == 2
+
+
+def test_http_requests_raw_response():
+    """Tests the raw responses are returned undecoded and bypass the search cache."""
+    client = meilisearch.Client(
+        BASE_URL, MASTER_KEY, middleware=Middleware(search_cache=SearchCache())
+    )
+    index = client.index("movies")
+
+    with patch.object(requests.Session, "post") as mock_post:
+        mock_post.configure_mock(__name__="post")
+        mock_post.side_effect = [_search_response(), _search_response()]
+        raw = index.search("prince", raw=True)
+        decoded = index.search("prince")
+
+    assert raw == b'{"hits":[],"query":"","limit":20,"offset":0}'
+    assert decoded == json.loads(raw)
+    assert mock_post.call_count == 2
+
+
+def test_http_requests_metrics():
+    """Tests every request is measured once, with its retries, by the configured sinks."""
+    sink = InMemorySink()
+    client = meilisearch.Client(
+        BASE_URL,
+        MASTER_KEY,
+        middleware=Middleware(retry=RetryPolicy(max_attempts=2, backoff_in_ms=0), metrics=[sink]),
+    )
+    responses = [_status_response(503, {"Retry-After": "0"}), _search_response()]
+
+    with patch.object(requests.Session, "post", side_effect=responses) as mock_post:
+        mock_post.configure_mock(__name__="post")
+        client.index("movies").search("prince")
+    with patch.object(requests.Session, "get", return_value=_status_response(404)) as mock_get:
+        mock_get.configure_mock(__name__="get")
+        with pytest.raises(MeilisearchApiError):
+            client.get_index("missing")
+
+    search, get_index = sink.samples
+    assert (search.method, search.endpoint, search.status) == (
+        "POST",
+        "indexes/{index_uid}/search",
+        200,
+    )
+    assert search.retries == 1
+    assert search.sizes == {
+        "request": len(b'{"q":"prince"}'),
+        "response": len(b'{"hits":[],"query":"","limit":20,"offset":0}'),
+    }
+    assert search.total_ms >= search.durations_ms["network"] > 0
+    assert (get_index.method, get_index.endpoint, get_index.status) == (
+        "GET",
+        "indexes/{index_uid}",
+        404,
+    )
+
+
+class _RecordingHook(RequestHook):
+    def __init__(self):
+        self.calls = []
+
+    def before_request(self, sample, headers):
+        headers["X-Request-Id"] = "42"
+        self.calls.append(("before", sample.method, sample.path))
+        return "state"
+
+    def after_response(self, sample, response, error, state):
+        status = None if response is None else response.status_code
+        self.calls.append(("after", status, type(error).__name__ if error else None, state))
+
+
+def test_http_requests_hooks():
+    """Tests the hooks are called around every request and can add headers to it."""
+    hook = _RecordingHook()
+    client = meilisearch.Client(BASE_URL, MASTER_KEY, middleware=Middleware(hooks=[hook]))
+
+    with patch.object(requests.Session, "post", return_value=_search_response()) as mock_post:
+        mock_post.configure_mock(__name__="post")
+        client.index("movies").search("prince")
+    with patch.object(
+        requests.Session, "get", side_effect=requests.exceptions.ConnectionError("down")
+    ) as mock_get:
+        mock_get.configure_mock(__name__="get")
+        with pytest.raises(MeilisearchCommunicationError):
+            client.get_version()
+
+    assert hook.calls == [
+        ("before", "POST", "indexes/movies/search"),
+        ("after", 200, None, "state"),
+        ("before", "GET", "version"),
+        ("after", None, "ConnectionError", "state"),
+    ]
+    assert mock_post.call_args.kwargs["headers"]["X-Request-Id"] == "42"
+    assert "X-Request-Id" not in client.http.headers
+
+
+class _FailingHook(RequestHook):
+    def after_response(self, sample, response, error, state):
+        raise RuntimeError("hook failed")
+
+
+def test_http_requests_hook_errors_do_not_mask_request_errors():
+    """Tests a failing hook is raised on success but never replaces the error of the request."""
+    sink = InMemorySink()
+    client = meilisearch.Client(
+        BASE_URL, MASTER_KEY, middleware=Middleware(hooks=[_FailingHook()], metrics=[sink])
+    )
+
+    with patch.object(requests.Session, "post", return_value=_search_response()) as mock_post:
+        mock_post.configure_mock(__name__="post")
+        with pytest.raises(RuntimeError, match="hook failed"):
+            client.index("movies").search("prince")
+    with patch.object(
+        requests.Session, "get", side_effect=requests.exceptions.ConnectionError("down")
+    ) as mock_get:
+        mock_get.configure_mock(__name__="get")
+        with pytest.raises(MeilisearchCommunicationError):
+            client.get_version()
+
+    assert [sample.status for sample in sink.samples] == [200, "error"]
+
+
+def test_http_requests_single_flight_skips_writes():
+    """Tests the bodies of the writes are not encoded into single-flight keys."""
+    flight = SingleFlight()
+    client = meilisearch.Client(BASE_URL, MASTER_KEY, middleware=Middleware(single_flight=flight))
+
+    with (
+        patch.object(flight, "key", wraps=flight.key) as mock_key,
+        patch.object(
+            requests.Session, "post", side_effect=[_task_response(), _search_response()]
+        ) as mock_post,
+    ):
+        mock_post.configure_mock(__name__="post")
+        client.index("movies").add_documents([{"id": 1}])
+        client.index("movies").search("prince")
+
+    mock_key.assert_called_once_with("POST", "indexes/movies/search", {"q": "prince"})
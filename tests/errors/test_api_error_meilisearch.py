@@ -22,7 +22,7 @@ def test_meilisearch_api_error_wrong_master_key():
         client.create_index("some_index")
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_meilisearch_api_error_no_code(mock_post):
     """Here to test for regressions related to https://github.com/meilisearch/meilisearch-python/issues/305."""
     mock_post.configure_mock(__name__="post")
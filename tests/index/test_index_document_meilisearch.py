@@ -1,5 +1,8 @@
 # pylint: disable=invalid-name
 
+import gzip
+import io
+import json
 from datetime import datetime
 from json import JSONEncoder
 from math import ceil
@@ -8,8 +11,12 @@ from warnings import catch_warnings
 
 import pytest
 
+import meilisearch
+from meilisearch.config import Transport
+from meilisearch.export import range_filters
 from meilisearch.models.document import Document
 from meilisearch.models.task import TaskInfo
+from tests import BASE_URL, MASTER_KEY
 
 
 class CustomEncoder(JSONEncoder):
@@ -72,6 +79,60 @@ def test_add_documents_in_batches(
     assert index.get_primary_key() == expected_primary_key
 
 
+@pytest.mark.parametrize("concurrency", [2, 4])
+def test_add_documents_in_batches_concurrency(concurrency, empty_index, small_movies):
+    index = empty_index()
+    response = index.add_documents_in_batches(small_movies, 5, concurrency=concurrency)
+    assert ceil(len(small_movies) / 5) == len(response)
+
+    for r in response:
+        update = index.wait_for_task(r.task_uid)
+        assert update.status == "succeeded"
+
+    assert index.get_stats().number_of_documents == len(small_movies)
+
+
+@pytest.mark.parametrize("compression", ["gzip", "deflate"])
+def test_add_documents_compressed(empty_index, small_movies, compression):
+    """Tests adding documents with a compressed request body."""
+    uid = empty_index().uid
+    client = meilisearch.Client(BASE_URL, MASTER_KEY, transport=Transport(compression=compression))
+    index = client.index(uid)
+    response = index.add_documents(small_movies)
+    update = index.wait_for_task(response.task_uid)
+    assert update.status == "succeeded"
+    assert index.get_stats().number_of_documents == len(small_movies)
+
+
+def test_add_documents_in_batches_from_generator(empty_index, small_movies):
+    index = empty_index()
+    response = index.add_documents_in_batches((movie for movie in small_movies), 7)
+    assert ceil(len(small_movies) / 7) == len(response)
+
+    for r in response:
+        update = index.wait_for_task(r.task_uid)
+        assert update.status == "succeeded"
+
+    assert index.get_stats().number_of_documents == len(small_movies)
+
+
+def test_add_documents_in_batches_max_payload_size(empty_index, small_movies):
+    index = empty_index()
+    response = index.add_documents_in_batches(small_movies, 1000, max_payload_size=4096)
+    assert len(response) > 1
+
+    for r in response:
+        update = index.wait_for_task(r.task_uid)
+        assert update.status == "succeeded"
+
+    assert index.get_stats().number_of_documents == len(small_movies)
+
+
+def test_add_documents_in_batches_invalid_concurrency(empty_index, small_movies):
+    with pytest.raises(ValueError):
+        empty_index().add_documents_in_batches(small_movies, 5, concurrency=0)
+
+
 def test_add_documents_custom_serializer(empty_index):
     documents = [
         {"id": uuid4(), "title": "test 1", "when": datetime.now()},
@@ -143,6 +204,16 @@ def test_update_documents_custom_serializer(empty_index):
     assert update.status == "succeeded"
 
 
+def test_update_documents_in_batches_concurrency(empty_index, small_movies):
+    index = empty_index()
+    response = index.update_documents_in_batches(small_movies, 5, concurrency=3)
+    assert ceil(len(small_movies) / 5) == len(response)
+
+    for r in response:
+        update = index.wait_for_task(r.task_uid)
+        assert update.status == "succeeded"
+
+
 def test_update_documents_in_batches_custom_serializer(empty_index):
     documents = [
         {"id": uuid4(), "title": "test 1", "when": datetime.now()},
@@ -217,6 +288,13 @@ def test_get_documents_populated(index_with_documents):
     assert len(response.results) == 20
 
 
+def test_get_documents_raw(index_with_documents):
+    """Tests getting the undecoded documents response."""
+    response = index_with_documents().get_documents({"limit": 5}, raw=True)
+    assert isinstance(response, bytes)
+    assert len(json.loads(response)["results"]) == 5
+
+
 def test_get_documents_offset_optional_params(index_with_documents):
     """Tests getting documents from a populated index with optional parameters."""
     index = index_with_documents()
@@ -339,6 +417,66 @@ def test_get_documents_filter_with_fields(index_with_documents):
     assert next(iter(genres)) == "action"
 
 
+def test_iter_documents(index_with_documents, small_movies):
+    """Tests iterating over every document of an index with several pages."""
+    index = index_with_documents()
+    documents = list(index.iter_documents(page_size=7))
+    assert len(documents) == len(small_movies)
+    assert {document.id for document in documents} == {movie["id"] for movie in small_movies}
+
+
+def test_iter_documents_filter_with_fields(index_with_documents):
+    index = index_with_documents()
+    response = index.update_filterable_attributes(["genre"])
+    index.wait_for_task(response.task_uid)
+    documents = list(index.iter_documents(filter="genre=action", fields=["genre"], page_size=2))
+    expected = index.get_documents({"filter": "genre=action", "limit": 100})
+    assert len(documents) == expected.total
+    assert {document.genre for document in documents} == {"action"}
+
+
+def test_iter_documents_stops_early(index_with_documents):
+    """Tests leaving the iteration before the last page."""
+    documents = index_with_documents().iter_documents(page_size=5, prefetch=3)
+    first = [next(documents) for _ in range(6)]
+    documents.close()
+    assert len({document.id for document in first}) == 6
+
+
+@pytest.mark.parametrize("page_size, prefetch", [(0, 1), (10, 0)])
+def test_iter_documents_invalid_parameters(empty_index, page_size, prefetch):
+    with pytest.raises(ValueError):
+        empty_index().iter_documents(page_size=page_size, prefetch=prefetch)
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_export_documents(index_with_documents, small_movies, tmp_path, workers):
+    """Tests exporting every document of an index to an NDJSON file."""
+    path = tmp_path / "movies.ndjson"
+    exported = index_with_documents().export_documents(path, page_size=7, workers=workers)
+    lines = path.read_bytes().splitlines()
+    assert exported == len(lines) == len(small_movies)
+    assert {json.loads(line)["id"] for line in lines} == {movie["id"] for movie in small_movies}
+
+
+def test_export_documents_partitions(index_with_documents, small_movies):
+    """Tests exporting partitions built from ranges of a filterable attribute."""
+    index = index_with_documents()
+    response = index.update_filterable_attributes(["release_date"])
+    index.wait_for_task(response.task_uid)
+    file = io.BytesIO()
+    exported = index.export_documents(
+        file,
+        partitions=range_filters("release_date", [1000000000, 1500000000]),
+        fields=["id"],
+        page_size=5,
+        compression="gzip",
+    )
+    documents = [json.loads(line) for line in gzip.decompress(file.getvalue()).splitlines()]
+    assert exported == len(small_movies)
+    assert {document["id"] for document in documents} == {movie["id"] for movie in small_movies}
+
+
 def test_get_similar_documents(empty_index):
     index = empty_index()
     index.update_embedders({"manual": {"source": "userProvided", "dimensions": 3}})
@@ -555,3 +693,59 @@ def test_update_documents_ndjson(index_with_documents, songs_ndjson):
     task = index.wait_for_task(response.task_uid)
     assert task.status == "succeeded"
     assert index.get_primary_key() == "id"
+
+
+def test_add_documents_file(empty_index):
+    """Tests streaming an ndjson file from its path to a clean index."""
+    index = empty_index()
+    response = index.add_documents_file("./datasets/songs.ndjson", chunk_size=1024)
+    assert isinstance(response, TaskInfo)
+    task = index.wait_for_task(response.task_uid)
+    assert task.status == "succeeded"
+    assert task.details["receivedDocuments"] == 225
+
+
+def test_add_documents_file_csv_file_object(empty_index):
+    """Tests streaming a csv file object to a clean index."""
+    index = empty_index()
+    with open("./datasets/songs_custom_delimiter.csv", "rb") as songs:
+        response = index.add_documents_file(songs, "text/csv", csv_delimiter=";")
+    task = index.wait_for_task(response.task_uid)
+    assert task.status == "succeeded"
+    assert task.details["receivedDocuments"] == 20
+
+
+@pytest.mark.parametrize(
+    "path, content_type, batch_size, expected_batches",
+    [
+        ("./datasets/songs.ndjson", "application/x-ndjson", 100, 3),
+        ("./datasets/songs.csv", "text/csv", 200, 3),
+    ],
+)
+def test_add_documents_file_in_batches(
+    empty_index, path, content_type, batch_size, expected_batches
+):
+    """Tests splitting a file on line boundaries into several tasks."""
+    index = empty_index()
+    response = index.add_documents_file_in_batches(path, batch_size, content_type)
+    assert len(response) == expected_batches
+
+    tasks = [index.wait_for_task(r.task_uid) for r in response]
+    assert all(task.status == "succeeded" for task in tasks)
+    assert all(task.details["receivedDocuments"] <= batch_size for task in tasks)
+
+
+def test_update_documents_file_in_batches(index_with_documents):
+    """Tests updating documents from an ndjson file in batches."""
+    index = index_with_documents()
+    response = index.update_documents_file_in_batches("./datasets/songs.ndjson", 100)
+    assert len(response) == 3
+    for r in response:
+        assert index.wait_for_task(r.task_uid).status == "succeeded"
+
+
+def test_add_documents_file_in_batches_json_not_supported(empty_index):
+    with pytest.raises(ValueError):
+        empty_index().add_documents_file_in_batches(
+            "./datasets/small_movies.json", 10, "application/json"
+        )
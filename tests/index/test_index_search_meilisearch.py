@@ -1,5 +1,6 @@
 # pylint: disable=invalid-name
 
+import json
 from collections import Counter
 
 import pytest
@@ -14,6 +15,13 @@ def test_basic_search(index_with_documents):
     assert "hitsPerPage" is not response
 
 
+def test_basic_search_raw(index_with_documents):
+    """Tests search returning the undecoded response."""
+    response = index_with_documents().search("How to Train Your Dragon", raw=True)
+    assert isinstance(response, bytes)
+    assert json.loads(response)["hits"][0]["id"] == "166428"
+
+
 def test_basic_search_with_empty_params(index_with_documents):
     """Tests search with a simple query and empty params."""
     response = index_with_documents().search("How to Train Your Dragon", {})
@@ -50,3 +50,30 @@ def test_wait_for_task_interval_zero(index_with_documents, small_movies):
     assert wait_update.status is not None
     assert wait_update.status != "enqueued"
     assert wait_update.status != "processing"
+
+
+def test_wait_for_tasks(empty_index, small_movies):
+    """Tests waiting for several tasks with a single polling loop."""
+    index = empty_index()
+    responses = index.add_documents_in_batches(small_movies, 5)
+    uids = [response.task_uid for response in responses]
+    tasks = index.wait_for_tasks(uids, timeout_in_ms=10000)
+    assert [task.uid for task in tasks] == uids
+    assert all(isinstance(task, Task) for task in tasks)
+    assert all(task.status == "succeeded" for task in tasks)
+
+
+def test_wait_for_tasks_timeout(index_with_documents):
+    """Tests timeout risen by waiting for several tasks."""
+    with pytest.raises(MeilisearchTimeoutError):
+        index_with_documents().wait_for_tasks([999999], timeout_in_ms=0)
+
+
+def test_wait_for_tasks_stop_on_failure(empty_index):
+    """Tests waiting for several tasks returns as soon as one of them failed."""
+    index = empty_index()
+    # No field can be used as primary key, the task fails.
+    failing = index.add_documents([{"title": "Le Petit Prince"}])
+    tasks = index.wait_for_tasks([failing.task_uid, 999999], stop_on_failure=True)
+    assert [task.uid for task in tasks] == [failing.task_uid]
+    assert tasks[0].status == "failed"
@@ -1,9 +1,11 @@
 # pylint: disable=unnecessary-dunder-call
 
+import copy
+import pickle
 
 import pytest
 
-from meilisearch.models.document import Document
+from meilisearch.models.document import Document, DocumentsResults
 
 
 def test_doc_init():
@@ -26,3 +28,42 @@ def test_getattr_not_found():
 def test_iter():
     document = Document({"field1": "test 1", "field2": "test 2"})
     assert list(iter(document)) == [("field1", "test 1"), ("field2", "test 2")]
+
+
+def test_doc_is_not_copied():
+    d = {"field1": ["test 1"]}
+    document = Document(d)
+    assert document.field1 is d["field1"]
+    assert document["field1"] is d["field1"]
+    assert document.__dict__ == d
+
+
+def test_mapping_access():
+    document = Document({"field1": "test 1", "field2": "test 2"})
+    assert "field1" in document
+    assert "bad" not in document
+    assert len(document) == 2
+    with pytest.raises(KeyError):
+        document["bad"]  # pylint: disable=pointless-statement
+
+
+def test_read_only():
+    document = Document({"field1": "test 1"})
+    with pytest.raises(AttributeError):
+        document.field1 = "test 2"  # pylint: disable=assigning-non-slot
+    with pytest.raises(TypeError):
+        document.__dict__["field1"] = "test 2"
+
+
+def test_copy_and_pickle():
+    document = Document({"field1": "test 1", "field2": ["test 2"]})
+    assert dict(copy.deepcopy(document)) == dict(document)
+    assert dict(pickle.loads(pickle.dumps(document))) == dict(document)
+
+
+def test_documents_results():
+    results = DocumentsResults(
+        {"results": [{"id": 1}, {"id": 2}], "offset": 0, "limit": 20, "total": 2}
+    )
+    assert [document.id for document in results.results] == [1, 2]
+    assert (results.offset, results.limit, results.total) == (0, 20, 2)
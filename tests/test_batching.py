@@ -0,0 +1,113 @@
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from meilisearch.batching import SearchBatcher
+from meilisearch.errors import MeilisearchApiError
+
+
+def fake_send(calls):
+    def send(path, body):
+        calls.append((path, body))
+        if path == "multi-search":
+            return {
+                "results": [
+                    {"indexUid": query["indexUid"], "hits": [query["q"]]}
+                    for query in body["queries"]
+                ]
+            }
+        return {"hits": [body["q"]]}
+
+    return send
+
+
+def search_in_threads(batcher, send, queries):
+    results = {}
+
+    def search(query):
+        results[query] = batcher.search(send, "movies", {"q": query})
+
+    threads = [threading.Thread(target=search, args=(query,)) for query in queries]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+@pytest.mark.parametrize(
+    "method, path, expected",
+    [
+        ("POST", "indexes/movies/search", "movies"),
+        ("POST", "multi-search", None),
+        ("POST", "indexes/movies/facet-search", None),
+        ("GET", "indexes/movies/search", None),
+    ],
+)
+def test_search_batcher_index_uid(method, path, expected):
+    assert SearchBatcher().index_uid(method, path) == expected
+
+
+def test_search_batcher_merges_concurrent_searches():
+    calls = []
+    batcher = SearchBatcher(window_in_ms=500, max_batch_size=4)
+
+    results = search_in_threads(batcher, fake_send(calls), ["a", "b", "c", "d"])
+
+    assert results == {query: {"hits": [query]} for query in "abcd"}
+    assert len(calls) == 1
+    assert calls[0][0] == "multi-search"
+    assert len(calls[0][1]["queries"]) == 4
+
+
+def test_search_batcher_sends_lone_search_directly():
+    calls = []
+
+    assert SearchBatcher(window_in_ms=1).search(fake_send(calls), "movies", {"q": "a"}) == {
+        "hits": ["a"]
+    }
+    assert calls == [("indexes/movies/search", {"q": "a"})]
+
+
+def test_search_batcher_resends_searches_when_multi_search_fails():
+    calls = []
+    send = fake_send(calls)
+
+    def failing_send(path, body):
+        if path == "multi-search":
+            calls.append((path, body))
+            raise MeilisearchApiError("invalid", MagicMock(status_code=400, text=""))
+        return send(path, body)
+
+    results = search_in_threads(
+        SearchBatcher(window_in_ms=500, max_batch_size=3), failing_send, ["a", "b", "c"]
+    )
+
+    assert results == {query: {"hits": [query]} for query in "abc"}
+    assert [path for path, _ in calls].count("indexes/movies/search") == 3
+
+
+def test_search_batcher_async():
+    calls = []
+    send = fake_send(calls)
+
+    async def asend(path, body):
+        return send(path, body)
+
+    async def run():
+        batcher = SearchBatcher(window_in_ms=50)
+        return await asyncio.gather(
+            *(batcher.asearch(asend, "movies", {"q": query}) for query in "abc")
+        )
+
+    assert asyncio.run(run()) == [{"hits": [query]} for query in "abc"]
+    assert [path for path, _ in calls] == ["multi-search"]
+
+
+def test_search_batcher_validation():
+    with pytest.raises(ValueError):
+        SearchBatcher(window_in_ms=-1)
+    with pytest.raises(ValueError):
+        SearchBatcher(max_batch_size=0)
@@ -0,0 +1,95 @@
+from unittest.mock import patch
+
+import pytest
+
+from meilisearch._codec import JsonCodec
+from meilisearch.cache import SearchCache
+
+CODEC = JsonCodec()
+
+
+def cached_search(cache, path, body, response):
+    key, indexes = cache.key(path, body)
+    cache.put(key, response, indexes, cache.generation(indexes), CODEC)
+    return key
+
+
+def test_search_cache_key_is_normalized():
+    cache = SearchCache()
+    first, _ = cache.key("indexes/movies/search", {"q": "prince", "limit": 5})
+    second, _ = cache.key("indexes/movies/search", {"limit": 5, "q": "prince"})
+
+    assert first == second
+
+
+def test_search_cache_returns_copies():
+    cache = SearchCache()
+    key = cached_search(cache, "indexes/movies/search", {"q": "prince"}, {"hits": [{"id": 1}]})
+
+    cache.get(key, CODEC)["hits"].clear()
+
+    assert cache.get(key, CODEC) == {"hits": [{"id": 1}]}
+    assert cache.hits == 2
+
+
+def test_search_cache_ttl():
+    cache = SearchCache(ttl_in_ms=1000)
+    with patch("meilisearch.cache.monotonic", return_value=0):
+        key = cached_search(cache, "indexes/movies/search", {"q": ""}, {"hits": []})
+    with patch("meilisearch.cache.monotonic", return_value=2):
+        assert cache.get(key, CODEC) is None
+
+    assert len(cache) == 0
+
+
+def test_search_cache_lru_eviction():
+    cache = SearchCache(max_entries=2)
+    first = cached_search(cache, "indexes/movies/search", {"q": "a"}, {"hits": []})
+    second = cached_search(cache, "indexes/movies/search", {"q": "b"}, {"hits": []})
+    cache.get(first, CODEC)
+    cached_search(cache, "indexes/movies/search", {"q": "c"}, {"hits": []})
+
+    assert cache.get(first, CODEC) is not None
+    assert cache.get(second, CODEC) is None
+
+
+def test_search_cache_max_bytes():
+    cache = SearchCache(max_bytes=40)
+    first = cached_search(cache, "indexes/movies/search", {"q": "a"}, {"hits": ["a" * 10]})
+    cached_search(cache, "indexes/movies/search", {"q": "b"}, {"hits": ["b" * 10]})
+
+    assert cache.get(first, CODEC) is None
+    assert len(cache) == 1
+
+
+@pytest.mark.parametrize(
+    "path, dropped",
+    [
+        ("indexes/movies/documents", True),
+        ("indexes/movies/settings", True),
+        ("indexes/books/documents", False),
+        ("swap-indexes", True),
+    ],
+)
+def test_search_cache_invalidate_for_write(path, dropped):
+    cache = SearchCache()
+    search = cached_search(cache, "indexes/movies/search", {"q": ""}, {"hits": []})
+    multi_search = cached_search(
+        cache, "multi-search", {"queries": [{"indexUid": "movies", "q": ""}]}, {"results": []}
+    )
+
+    cache.invalidate_for_write(path)
+
+    assert (cache.get(search, CODEC) is None) is dropped
+    assert (cache.get(multi_search, CODEC) is None) is dropped
+
+
+def test_search_cache_skips_response_fetched_during_write():
+    cache = SearchCache()
+    key, indexes = cache.key("indexes/movies/search", {"q": ""})
+    generation = cache.generation(indexes)
+    cache.invalidate("movies")
+
+    cache.put(key, {"hits": []}, indexes, generation, CODEC)
+
+    assert cache.get(key, CODEC) is None
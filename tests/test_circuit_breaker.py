@@ -0,0 +1,60 @@
+from unittest.mock import patch
+
+import pytest
+
+from meilisearch.circuit_breaker import CircuitBreaker
+from meilisearch.errors import MeilisearchCommunicationError
+
+URL = "http://127.0.0.1:7700"
+
+
+def test_circuit_breaker_opens_on_failure_rate():
+    breaker = CircuitBreaker(failure_rate=0.5, minimum_requests=4)
+    for success in (True, False, True):
+        breaker.record(URL, success)
+    assert breaker.state(URL) == "closed"
+
+    breaker.record(URL, False)
+
+    assert breaker.state(URL) == "open"
+    with pytest.raises(MeilisearchCommunicationError):
+        breaker.before_request(URL)
+
+
+def test_circuit_breaker_is_per_url():
+    breaker = CircuitBreaker(minimum_requests=1)
+    breaker.record(URL, False)
+
+    assert breaker.state(URL) == "open"
+    assert breaker.before_request("http://127.0.0.1:7701") is False
+
+
+def test_circuit_breaker_forgets_old_outcomes():
+    breaker = CircuitBreaker(minimum_requests=2, window_in_ms=1000)
+    with patch("meilisearch.circuit_breaker.monotonic", return_value=0):
+        breaker.record(URL, False)
+    with patch("meilisearch.circuit_breaker.monotonic", return_value=2):
+        breaker.record(URL, False)
+
+    assert breaker.state(URL) == "closed"
+
+
+def test_circuit_breaker_half_open_probe():
+    breaker = CircuitBreaker(minimum_requests=1, open_duration_in_ms=1000)
+    with patch("meilisearch.circuit_breaker.monotonic", return_value=0):
+        breaker.record(URL, False)
+
+    with patch("meilisearch.circuit_breaker.monotonic", return_value=2):
+        assert breaker.before_request(URL) is True
+        # Only one request probes, the others keep failing fast.
+        with pytest.raises(MeilisearchCommunicationError):
+            breaker.before_request(URL)
+        breaker.record_probe(URL, healthy=False)
+        assert breaker.state(URL) == "open"
+
+    with patch("meilisearch.circuit_breaker.monotonic", return_value=4):
+        assert breaker.before_request(URL) is True
+        breaker.record_probe(URL, healthy=True)
+
+    assert breaker.state(URL) == "closed"
+    assert breaker.before_request(URL) is False
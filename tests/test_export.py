@@ -0,0 +1,54 @@
+import gzip
+import io
+import json
+import zlib
+
+import pytest
+
+from meilisearch.export import NdjsonWriter, range_filters
+
+
+def test_range_filters():
+    assert range_filters("release_date", [100, 200]) == [
+        "release_date < 100",
+        "release_date >= 100 AND release_date < 200",
+        "release_date >= 200",
+    ]
+
+
+def test_range_filters_unsorted_boundaries():
+    with pytest.raises(ValueError):
+        range_filters("release_date", [200, 100])
+
+
+def test_ndjson_writer():
+    file = io.BytesIO()
+    with NdjsonWriter(file) as writer:
+        writer.write([{"id": 1}, {"id": 2}])
+        writer.write([])
+        writer.write([{"id": 3}])
+
+    assert writer.documents == 3
+    assert [json.loads(line) for line in file.getvalue().splitlines()] == [
+        {"id": 1},
+        {"id": 2},
+        {"id": 3},
+    ]
+    assert not file.closed
+
+
+@pytest.mark.parametrize(
+    "compression, decompress", [("gzip", gzip.decompress), ("deflate", zlib.decompress)]
+)
+def test_ndjson_writer_compression(tmp_path, compression, decompress):
+    path = tmp_path / "documents.ndjson"
+    with NdjsonWriter(path, compression) as writer:
+        writer.write([{"id": i} for i in range(100)])
+
+    lines = decompress(path.read_bytes()).splitlines()
+    assert [json.loads(line)["id"] for line in lines] == list(range(100))
+
+
+def test_ndjson_writer_invalid_compression():
+    with pytest.raises(ValueError):
+        NdjsonWriter(io.BytesIO(), "brotli")
@@ -0,0 +1,55 @@
+import pytest
+
+from meilisearch.hedging import HedgingPolicy
+
+
+@pytest.mark.parametrize(
+    "method, path, expected",
+    [
+        ("POST", "indexes/movies/search", True),
+        ("POST", "multi-search", True),
+        ("POST", "indexes/movies/facet-search", False),
+        ("POST", "indexes/movies/documents", False),
+        ("GET", "indexes/movies/search?q=prince", False),
+    ],
+)
+def test_hedging_policy_applies(method, path, expected):
+    assert HedgingPolicy().applies(method, path) is expected
+
+
+def test_hedging_policy_delay_from_percentile():
+    policy = HedgingPolicy(percentile=90, min_delay_in_ms=0, initial_delay_in_ms=100)
+    assert policy.delay() == 100
+
+    for latency in range(1, 101):
+        policy.record(latency)
+
+    assert policy.delay() == 91
+
+
+def test_hedging_policy_delay_bounds():
+    policy = HedgingPolicy(min_delay_in_ms=20, max_delay_in_ms=50)
+    for _ in range(50):
+        policy.record(1)
+    assert policy.delay() == 20
+
+    for _ in range(1000):
+        policy.record(500)
+    assert policy.delay() == 50
+
+
+def test_hedging_policy_rate_limit():
+    policy = HedgingPolicy(max_rate=0.1, burst=2)
+
+    assert [policy.try_hedge() for _ in range(3)] == [True, True, False]
+    for _ in range(11):
+        policy.record(1)
+    assert policy.try_hedge()
+    assert not policy.try_hedge()
+
+
+def test_hedging_policy_validation():
+    with pytest.raises(ValueError):
+        HedgingPolicy(percentile=100)
+    with pytest.raises(ValueError):
+        HedgingPolicy(max_rate=2)
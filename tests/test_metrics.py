@@ -0,0 +1,84 @@
+import pytest
+
+from meilisearch.metrics import (
+    InMemorySink,
+    PrometheusSink,
+    RequestSample,
+    StatsdSink,
+    endpoint,
+)
+
+
+def make_sample(path="indexes/movies/search", status=200, network_ms=10.0, retries=0):
+    sample = RequestSample("POST", path)
+    sample.status = status
+    sample.durations_ms = {"serialize": 0.5, "network": network_ms, "decode": 1.5}
+    sample.sizes = {"request": 20, "response": 300}
+    sample.retries = retries
+    return sample
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        ("indexes/movies/search", "indexes/{index_uid}/search"),
+        ("indexes/movies/documents/42?fields=title", "indexes/{index_uid}/documents/{document_id}"),
+        ("indexes/movies/documents/fetch", "indexes/{index_uid}/documents/fetch"),
+        ("indexes/movies/documents/delete-batch", "indexes/{index_uid}/documents/delete-batch"),
+        ("indexes?limit=20", "indexes"),
+        ("tasks/12", "tasks/{task_uid}"),
+        ("tasks/cancel?uids=1", "tasks/cancel"),
+        ("keys/abc", "keys/{key}"),
+        ("multi-search", "multi-search"),
+    ],
+)
+def test_endpoint(path, expected):
+    assert endpoint(path) == expected
+
+
+def test_in_memory_sink_percentile():
+    sink = InMemorySink()
+    assert sink.percentile(50) is None
+
+    for network_ms in range(1, 101):
+        sink.record(make_sample(network_ms=network_ms))
+    sink.record(make_sample(path="indexes/movies/settings", network_ms=1000))
+
+    assert sink.percentile(50, endpoint="indexes/{index_uid}/search", phase="network") == 51
+    assert sink.percentile(99, endpoint="indexes/{index_uid}/search") == 102
+    assert sink.percentile(100, method="POST", phase="network") == 1000
+
+
+def test_statsd_sink():
+    calls = []
+    StatsdSink(lambda *call: calls.append(call)).record(make_sample(retries=2))
+
+    tags = {"method": "POST", "endpoint": "indexes/{index_uid}/search", "status": "200"}
+    assert calls == [
+        ("meilisearch.requests", 1, "c", tags),
+        ("meilisearch.request.serialize", 0.5, "ms", tags),
+        ("meilisearch.request.network", 10.0, "ms", tags),
+        ("meilisearch.request.decode", 1.5, "ms", tags),
+        ("meilisearch.request.bytes", 20, "h", tags),
+        ("meilisearch.response.bytes", 300, "h", tags),
+        ("meilisearch.retries", 2, "c", tags),
+    ]
+
+
+def test_prometheus_sink_exposition():
+    sink = PrometheusSink(buckets_in_ms=(5, 50))
+    sink.record(make_sample(network_ms=10))
+    sink.record(make_sample(network_ms=100, retries=1))
+    sink.record(make_sample(status="error", network_ms=1))
+
+    labels = 'method="POST",endpoint="indexes/{index_uid}/search"'
+    lines = sink.exposition().splitlines()
+    assert f'meilisearch_requests_total{{{labels},status="200"}} 2' in lines
+    assert f'meilisearch_requests_total{{{labels},status="error"}} 1' in lines
+    network = f'{labels},status="200",phase="network"'
+    assert f'meilisearch_request_duration_seconds_bucket{{{network},le="0.005"}} 0' in lines
+    assert f'meilisearch_request_duration_seconds_bucket{{{network},le="0.05"}} 1' in lines
+    assert f'meilisearch_request_duration_seconds_bucket{{{network},le="+Inf"}} 2' in lines
+    assert f"meilisearch_request_duration_seconds_sum{{{network}}} 0.11" in lines
+    assert f'meilisearch_bytes_total{{{labels},direction="response"}} 900' in lines
+    assert f"meilisearch_retries_total{{{labels}}} 1" in lines
@@ -0,0 +1,93 @@
+import pytest
+
+from meilisearch._nodes import NodePool, is_read, is_read_only
+from meilisearch.config import Config, Transport
+
+URLS = ("http://node0:7700", "http://node1:7700", "http://node2:7700")
+
+
+@pytest.mark.parametrize(
+    "method, path, expected",
+    [
+        ("POST", "indexes/movies/search", True),
+        ("POST", "indexes/movies/facet-search", True),
+        ("POST", "multi-search", True),
+        ("POST", "indexes/movies/documents/fetch", True),
+        ("POST", "indexes/movies/similar", True),
+        ("GET", "indexes/movies/documents?limit=20", True),
+        ("GET", "indexes/movies/documents/1", True),
+        ("POST", "indexes/movies/documents", False),
+        ("GET", "tasks/1", False),
+        ("GET", "indexes/movies/settings", False),
+    ],
+)
+def test_is_read(method, path, expected):
+    assert is_read(method, path) is expected
+
+
+@pytest.mark.parametrize(
+    "method, path, expected",
+    [
+        ("POST", "indexes/movies/search?x=1", True),
+        ("POST", "indexes/movies/similar", True),
+        ("GET", "tasks/1", True),
+        ("get", "indexes/movies/settings", True),
+        ("POST", "indexes/movies/documents", False),
+        ("POST", "indexes/movies/documents/delete-batch", False),
+        ("PUT", "indexes/movies/documents", False),
+        ("DELETE", "indexes/movies", False),
+    ],
+)
+def test_is_read_only(method, path, expected):
+    assert is_read_only(method, path) is expected
+
+
+def test_node_pool_round_robin():
+    nodes = NodePool(URLS)
+
+    selected = []
+    for _ in range(6):
+        url = nodes.select(read=True)
+        nodes.release(url, success=True)
+        selected.append(url)
+
+    assert selected == list(URLS) * 2
+
+
+def test_node_pool_writes_go_to_primary():
+    nodes = NodePool(URLS)
+
+    assert {nodes.select(read=False) for _ in range(5)} == {URLS[0]}
+
+
+def test_node_pool_least_outstanding():
+    nodes = NodePool(URLS, "least_outstanding")
+    busy = [nodes.select(read=True) for _ in range(2)]
+
+    assert nodes.select(read=True) not in busy
+
+
+def test_node_pool_skips_unhealthy_nodes():
+    nodes = NodePool(URLS)
+    nodes.release(nodes.select(read=True), success=False)
+
+    assert URLS[0] not in {nodes.select(read=True) for _ in range(4)}
+
+
+def test_node_pool_failover():
+    nodes = NodePool(URLS)
+
+    assert nodes.select(read=True, exclude=URLS[:2]) == URLS[2]
+    assert nodes.can_failover(URLS[:2])
+    assert not nodes.can_failover(URLS)
+
+
+def test_config_urls():
+    config = Config(list(URLS))
+
+    assert config.url == URLS[0]
+    assert config.urls == URLS
+    with pytest.raises(ValueError):
+        Config([])
+    with pytest.raises(ValueError):
+        Config(URLS[0], transport=Transport(load_balancing="random"))
@@ -0,0 +1,73 @@
+from unittest.mock import patch
+
+import pytest
+
+from meilisearch.polling import PollingStrategy, ProgressTracker
+
+
+def test_polling_strategy_backoff():
+    polling = PollingStrategy(50, 400, multiplier=2, jitter=0)
+    intervals = []
+    interval = None
+    for _ in range(6):
+        interval = polling.next_interval(interval)
+        intervals.append(interval)
+
+    assert intervals == [50, 100, 200, 400, 400, 400]
+
+
+def test_polling_strategy_skips_progress_by_default():
+    assert PollingStrategy().use_progress is False
+
+
+def test_polling_strategy_fixed():
+    polling = PollingStrategy.fixed(100)
+
+    assert polling.next_interval(None) == 100
+    assert polling.next_interval(100) == 100
+    assert polling.use_progress is False
+
+
+def test_polling_strategy_jitter_stays_within_bounds():
+    polling = PollingStrategy(100, 1000, jitter=0.5)
+
+    for previous in (None, 100, 500, 1000):
+        assert 100 <= polling.next_interval(previous) <= 1000
+
+
+def test_polling_strategy_follows_remaining_time():
+    polling = PollingStrategy(50, 5000, jitter=0)
+
+    assert polling.next_interval(50, remaining_in_ms=2000) == 1000
+    assert polling.next_interval(2000, remaining_in_ms=20) == 50
+    assert polling.next_interval(50, remaining_in_ms=60000) == 5000
+
+
+@pytest.mark.parametrize(
+    "parameters",
+    [
+        {"initial_interval_in_ms": -1},
+        {"initial_interval_in_ms": 100, "max_interval_in_ms": 50},
+        {"multiplier": 0.5},
+        {"jitter": 1},
+    ],
+)
+def test_polling_strategy_invalid(parameters):
+    with pytest.raises(ValueError):
+        PollingStrategy(**parameters)
+
+
+def test_progress_tracker_estimates_remaining_time():
+    tracker = ProgressTracker()
+
+    with patch("meilisearch.polling.monotonic", side_effect=[10.0, 12.0]):
+        assert tracker.update({"percentage": 20.0}) is None
+        # 20% in 2 seconds, 60% left.
+        assert tracker.update({"percentage": 40.0}) == pytest.approx(6000)
+
+
+def test_progress_tracker_without_progress():
+    tracker = ProgressTracker()
+
+    assert tracker.update(None) is None
+    assert tracker.update({"steps": []}) is None
@@ -0,0 +1,64 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from meilisearch.retry import RetryPolicy
+
+
+@pytest.mark.parametrize(
+    "method, path, expected",
+    [
+        ("GET", "indexes/movies/documents?limit=20", True),
+        ("POST", "indexes/movies/search", True),
+        ("POST", "indexes/movies/facet-search", True),
+        ("POST", "multi-search", True),
+        ("POST", "indexes/movies/similar", True),
+        ("POST", "indexes/movies/documents/fetch", True),
+        ("POST", "indexes/movies/documents", False),
+        ("PUT", "indexes/movies/settings/synonyms", False),
+        ("DELETE", "indexes/movies", False),
+    ],
+)
+def test_retry_policy_is_idempotent(method, path, expected):
+    assert RetryPolicy().is_idempotent(method, path) is expected
+
+
+def test_retry_policy_can_retry():
+    policy = RetryPolicy(max_attempts=3)
+
+    assert policy.can_retry(1, "GET", "version")
+    assert policy.can_retry(2, "GET", "version", status_code=503)
+    assert not policy.can_retry(3, "GET", "version")
+    assert not policy.can_retry(1, "GET", "version", status_code=500)
+    assert not policy.can_retry(1, "POST", "indexes/movies/documents")
+    assert policy.can_retry(1, "POST", "indexes/movies/documents", sent=False)
+    assert RetryPolicy(retry_writes=True).can_retry(1, "POST", "indexes/movies/documents")
+
+
+def test_retry_policy_backoff():
+    policy = RetryPolicy(backoff_in_ms=100, max_backoff_in_ms=300, multiplier=2, jitter=0)
+
+    assert [policy.backoff(attempt) for attempt in range(1, 5)] == [100, 200, 300, 300]
+
+
+def test_retry_policy_backoff_jitter():
+    policy = RetryPolicy(backoff_in_ms=100, jitter=0.5)
+
+    assert all(50 <= policy.backoff(1) <= 100 for _ in range(100))
+
+
+def test_retry_policy_retry_after():
+    policy = RetryPolicy(max_backoff_in_ms=5000)
+    date = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=2), usegmt=True)
+
+    assert policy.backoff(1, "2") == 2000
+    assert 0 < policy.backoff(1, date) <= 2000
+    assert policy.backoff(1, "60") is None
+
+
+def test_retry_policy_validation():
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
+    with pytest.raises(ValueError):
+        RetryPolicy(backoff_in_ms=100, max_backoff_in_ms=10)
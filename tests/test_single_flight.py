@@ -0,0 +1,129 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from meilisearch.single_flight import SingleFlight
+
+
+@pytest.mark.parametrize(
+    "method, path, expected",
+    [
+        ("GET", "indexes/movies/settings", True),
+        ("GET", "indexes/movies/stats", True),
+        ("POST", "indexes/movies/search", True),
+        ("POST", "indexes/movies/documents/fetch", True),
+        ("POST", "indexes/movies/documents", False),
+        ("PATCH", "indexes/movies/settings", False),
+        ("DELETE", "indexes/movies", False),
+    ],
+)
+def test_single_flight_applies(method, path, expected):
+    assert SingleFlight().applies(method, path) is expected
+
+
+def test_single_flight_key():
+    flight = SingleFlight()
+
+    assert flight.key("POST", "indexes/movies/search", {"q": "a", "limit": 2}) == flight.key(
+        "POST", "indexes/movies/search", {"limit": 2, "q": "a"}
+    )
+    assert flight.key("POST", "indexes/movies/search", {"q": "a"}) != flight.key(
+        "POST", "indexes/movies/search", {"q": "b"}
+    )
+    assert flight.key("POST", "indexes/movies/search", b"{}") is None
+
+
+def test_single_flight_shares_call_in_flight():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def send():
+        calls.append(1)
+        release.wait(5)
+        return {"hits": []}
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.run("key", send))) for _ in range(10)
+    ]
+    for thread in threads:
+        thread.start()
+    while flight.shared < 9:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [{"hits": []}] * 10
+    # Each caller gets its own copy of the response.
+    assert len({id(result) for result in results}) == 10
+
+
+def test_single_flight_shares_errors():
+    flight = SingleFlight()
+    release = threading.Event()
+    errors = []
+
+    def send():
+        release.wait(5)
+        raise ValueError("boom")
+
+    def call():
+        try:
+            flight.run("key", send)
+        except ValueError as err:
+            errors.append(err)
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    while flight.shared < 2:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(errors) == 3
+    assert flight.run("key", lambda: "fresh") == "fresh"
+
+
+def test_single_flight_async():
+    flight = SingleFlight()
+    calls = []
+
+    async def send():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"hits": []}
+
+    async def run():
+        return await asyncio.gather(*(flight.arun("key", send) for _ in range(5)))
+
+    assert asyncio.run(run()) == [{"hits": []}] * 5
+    assert len(calls) == 1
+    assert flight.shared == 4
+
+
+def test_single_flight_async_leader_cancelled():
+    flight = SingleFlight()
+    calls = []
+
+    async def send():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "done"
+
+    async def run():
+        leader = asyncio.create_task(flight.arun("key", send))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.arun("key", send))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await follower
+
+    assert asyncio.run(run()) == "done"
+    assert len(calls) == 2
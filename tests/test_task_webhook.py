@@ -0,0 +1,68 @@
+import gzip
+import json
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+import pytest
+
+from meilisearch.task_webhook import TaskWebhookReceiver
+
+NOW = "2024-01-01T00:00:00.000000Z"
+
+
+def task_payload(uid, status="succeeded"):
+    return {
+        "uid": uid,
+        "indexUid": "indexUID",
+        "status": status,
+        "type": "documentAdditionOrUpdate",
+        "enqueuedAt": NOW,
+        "startedAt": NOW,
+        "finishedAt": NOW,
+    }
+
+
+def post(receiver, body, headers):
+    request = Request(receiver.public_url, data=body, headers=headers, method="POST")
+    with urlopen(request, timeout=5) as response:  # nosec
+        return response.status
+
+
+@pytest.fixture(name="receiver")
+def fixture_receiver():
+    receiver = TaskWebhookReceiver()
+    receiver.start()
+    yield receiver
+    receiver.close()
+
+
+def test_receiver_dispatches_gzip_ndjson(receiver):
+    received = []
+    receiver.add_listener(received.extend)
+    body = gzip.compress(
+        b"\n".join(json.dumps(task_payload(uid)).encode("utf-8") for uid in (1, 2))
+    )
+
+    status = post(receiver, body, {**receiver.headers, "Content-Encoding": "gzip"})
+
+    assert status == 204
+    assert [task.uid for task in received] == [1, 2]
+    assert all(task.status == "succeeded" for task in received)
+
+
+def test_receiver_rejects_wrong_secret(receiver):
+    received = []
+    receiver.add_listener(received.extend)
+
+    with pytest.raises(HTTPError) as err:
+        post(receiver, json.dumps(task_payload(1)).encode("utf-8"), {"Authorization": "Bearer x"})
+
+    assert err.value.code == 401
+    assert not received
+
+
+def test_receiver_rejects_invalid_body(receiver):
+    with pytest.raises(HTTPError) as err:
+        post(receiver, b"not json", receiver.headers)
+
+    assert err.value.code == 400
@@ -0,0 +1,82 @@
+import io
+from unittest.mock import patch
+
+import pytest
+import requests
+
+pytest.importorskip("opentelemetry.sdk")
+
+# pylint: disable=wrong-import-position
+from opentelemetry import trace  # noqa: E402
+from opentelemetry.sdk.trace import TracerProvider  # noqa: E402
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (  # noqa: E402
+    InMemorySpanExporter,
+)
+
+import meilisearch  # noqa: E402
+from meilisearch.config import Middleware  # noqa: E402
+from meilisearch.errors import MeilisearchApiError  # noqa: E402
+from meilisearch.tracing import TracingHook  # noqa: E402
+from tests import BASE_URL, MASTER_KEY  # noqa: E402
+
+
+@pytest.fixture(name="tracing")
+def fixture_tracing():
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    return provider.get_tracer("tests"), exporter
+
+
+def _response(status_code, content):
+    response = requests.Response()
+    response.status_code = status_code
+    response.raw = io.BytesIO(content)
+    return response
+
+
+def test_tracing_hook_span_per_request(tracing):
+    tracer, exporter = tracing
+    client = meilisearch.Client(
+        BASE_URL, MASTER_KEY, middleware=Middleware(hooks=[TracingHook(tracer)])
+    )
+
+    with patch.object(
+        requests.Session, "post", return_value=_response(200, b'{"hits":[]}')
+    ) as mock_post:
+        mock_post.configure_mock(__name__="post")
+        with tracer.start_as_current_span("handler") as parent:
+            client.index("movies").search("prince")
+
+    span, _ = exporter.get_finished_spans()
+    assert span.name == "POST indexes/{index_uid}/search"
+    assert span.kind == trace.SpanKind.CLIENT
+    assert span.parent.span_id == parent.get_span_context().span_id
+    assert span.attributes["url.path"] == "indexes/movies/search"
+    assert span.attributes["http.response.status_code"] == 200
+    assert span.attributes["http.response.body.size"] == len(b'{"hits":[]}')
+    assert span.status.is_ok
+
+    context = span.get_span_context()
+    traceparent = mock_post.call_args.kwargs["headers"]["traceparent"]
+    assert traceparent.startswith(f"00-{context.trace_id:032x}-{context.span_id:016x}-")
+
+
+def test_tracing_hook_records_errors(tracing):
+    tracer, exporter = tracing
+    client = meilisearch.Client(
+        BASE_URL, MASTER_KEY, middleware=Middleware(hooks=[TracingHook(tracer)])
+    )
+
+    error = b'{"message":"not found","code":"index_not_found","type":"invalid_request","link":""}'
+    with patch.object(requests.Session, "get", return_value=_response(404, error)) as mock_get:
+        mock_get.configure_mock(__name__="get")
+        with pytest.raises(MeilisearchApiError):
+            client.get_index("missing")
+
+    (span,) = exporter.get_finished_spans()
+    assert span.name == "GET indexes/{index_uid}"
+    assert span.attributes["http.response.status_code"] == 404
+    assert span.attributes["error.type"] == "MeilisearchApiError"
+    assert span.status.status_code == trace.StatusCode.ERROR
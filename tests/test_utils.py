@@ -1,8 +1,16 @@
+import json
 from datetime import datetime, timezone
+from io import BytesIO
 
 import pytest
 
-from meilisearch._utils import is_pydantic_2, iso_to_date_time
+from meilisearch._utils import (
+    PayloadBatcher,
+    is_pydantic_2,
+    iso_to_date_time,
+    read_chunks,
+    split_records,
+)
 
 
 def test_is_pydantic_2():
@@ -33,6 +41,77 @@ def test_iso_to_date_time_invalid_format():
         iso_to_date_time("2023-07-13T23:37:20Z")
 
 
+def test_payload_batcher_cuts_on_payload_size():
+    documents = [{"id": i, "text": "x" * (i * 7)} for i in range(50)]
+    batcher = PayloadBatcher(batch_size=1000, max_payload_size=512)
+
+    payloads = []
+    for document in documents:
+        payload = batcher.add(document)
+        if payload is not None:
+            payloads.append(payload)
+    payloads.append(batcher.flush())
+
+    assert len(payloads) > 1
+    assert all(len(payload) <= 512 for payload in payloads)
+    assert [document for payload in payloads for document in json.loads(payload)] == documents
+    assert batcher.flush() is None
+
+
+def test_payload_batcher_cuts_on_batch_size():
+    batcher = PayloadBatcher(batch_size=2, max_payload_size=10_000)
+
+    assert batcher.add({"id": 1}) is None
+    assert batcher.add({"id": 2}) is None
+    assert json.loads(batcher.add({"id": 3})) == [{"id": 1}, {"id": 2}]
+    assert json.loads(batcher.flush()) == [{"id": 3}]
+
+
+def test_payload_batcher_sends_oversized_document_alone():
+    batcher = PayloadBatcher(batch_size=1000, max_payload_size=16)
+
+    assert batcher.add({"id": 1}) is None
+    assert json.loads(batcher.add({"id": 2, "text": "x" * 100})) == [{"id": 1}]
+    assert json.loads(batcher.flush()) == [{"id": 2, "text": "x" * 100}]
+
+
+@pytest.mark.parametrize("batch_size, max_payload_size", [(0, 100), (10, 0)])
+def test_payload_batcher_invalid_limits(batch_size, max_payload_size):
+    with pytest.raises(ValueError):
+        PayloadBatcher(batch_size, max_payload_size)
+
+
+def test_read_chunks():
+    assert list(read_chunks(BytesIO(b"abcdefg"), 3)) == [b"abc", b"def", b"g"]
+
+
+def test_split_records_ndjson():
+    file = BytesIO(b'{"id":1}\n{"id":2}\n{"id":3}\n{"id":4}\n{"id":5}')
+
+    batches = [b"".join(batch) for batch in split_records(file, 2, chunk_size=1)]
+
+    assert batches == [b'{"id":1}\n{"id":2}\n', b'{"id":3}\n{"id":4}\n', b'{"id":5}']
+
+
+def test_split_records_csv_repeats_header_and_keeps_quoted_newlines():
+    file = BytesIO(b'id,text\n1,"multi\nline"\n2,"say ""hi"""\n3,c\n')
+
+    batches = [b"".join(batch) for batch in split_records(file, 2, csv=True)]
+
+    assert batches == [
+        b'id,text\n1,"multi\nline"\n2,"say ""hi"""\n',
+        b"id,text\n3,c\n",
+    ]
+
+
+def test_split_records_skips_unread_records():
+    file = BytesIO(b"1\n2\n3\n4\n")
+
+    firsts = [next(batch) for batch in split_records(file, 2, chunk_size=1)]
+
+    assert firsts == [b"1\n", b"3\n"]
+
+
 # Refactor to use the unified API to toggle experimental features
 def disable_sharding(client):
     client.add_or_update_networks(body={"sharding": False})